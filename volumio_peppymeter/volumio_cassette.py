@@ -20,6 +20,8 @@ import time
 import time as time_module
 import requests
 import pygame as pg
+import re
+from collections import OrderedDict
 
 # Layer composition system
 from volumio_compositor import LayerCompositor
@@ -36,6 +38,13 @@ try:
 except ImportError:
     CAIROSVG_AVAILABLE = False
 
+# Optional numpy for vectorized surface analysis
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # =============================================================================
 # Configuration Constants (cassette-specific subset)
 # =============================================================================
@@ -237,40 +246,34 @@ def as_float(val, default=0.0):
 
 def set_color(surface, color):
     """Colorize a surface with given color (preserving alpha). Modifies surface in place."""
-    # Check if numpy is available (required for surfarray)
-    numpy_available = False
+    # Force RGB to white, then multiply by the target color. Both fills run
+    # in pygame's C blitter (no surface lock, no tint allocation) and keep
+    # per-pixel alpha unchanged since the alpha operands are 0 (max) and 255 (mult).
+    r, g, b = color.r, color.g, color.b
     try:
-        import numpy
-        numpy_available = True
-    except ImportError:
-        pass
-    
-    if numpy_available:
-        try:
-            r, g, b = color.r, color.g, color.b
-            # Get pixel array for direct manipulation (requires numpy)
-            arr = pg.surfarray.pixels3d(surface)
-            alpha = pg.surfarray.pixels_alpha(surface)
-            # Replace all non-transparent pixel colors with target color
-            mask = alpha > 0
-            arr[mask] = [r, g, b]
-            del arr
-            del alpha
-            return
-        except Exception:
-            pass
-    
-    # Fallback: pixel-by-pixel (slow but works without numpy)
-    try:
-        r, g, b = color.r, color.g, color.b
-        w, h = surface.get_size()
-        for x in range(w):
-            for y in range(h):
-                px = surface.get_at((x, y))
-                if px.a > 0:
-                    surface.set_at((x, y), (r, g, b, px.a))
-    except Exception:
-        pass
+        surface.fill((255, 255, 255, 0), special_flags=pg.BLEND_RGBA_MAX)
+        surface.fill((r, g, b, 255), special_flags=pg.BLEND_RGBA_MULT)
+    except Exception as e:
+        print(f"[set_color] Failed: {e}")
+
+
+# Playback status codes - resolved once per frame by the handler so the
+# per-reel angle updates compare ints instead of lowercasing strings
+STATUS_STOP = 0
+STATUS_PLAY = 1
+STATUS_PAUSE = 2
+STATUS_UNKNOWN = 3
+
+STATUS_MAP = {
+    "stop": STATUS_STOP,
+    "play": STATUS_PLAY,
+    "pause": STATUS_PAUSE,
+}
+
+
+def resolve_status(status):
+    """Map a Volumio status string to a STATUS_* code."""
+    return STATUS_MAP.get((status or "").lower(), STATUS_UNKNOWN)
 
 
 # Rotation quality presets (FPS, step_degrees)
@@ -282,6 +285,9 @@ ROTATION_PRESETS = {
 
 USE_PRECOMPUTED_FRAMES = True
 
+# Smooth rotation: cap per-update elapsed time so a stalled frame doesn't jump the reel
+MAX_ROTATION_DT_MS = 500
+
 
 def get_rotation_params(quality, custom_fps=8):
     """Get rotation FPS and step degrees based on quality setting."""
@@ -291,66 +297,326 @@ def get_rotation_params(quality, custom_fps=8):
     return ROTATION_PRESETS.get(quality, ROTATION_PRESETS["medium"])
 
 
+def convert_for_blit(surf):
+    """Convert surf to the display format, dropping per-pixel alpha when no
+    pixel is transparent so blits are plain copies instead of blends."""
+    if surf.get_flags() & pg.SRCALPHA:
+        opaque = False
+        if NUMPY_AVAILABLE:
+            try:
+                alpha = pg.surfarray.pixels_alpha(surf)
+                try:
+                    opaque = int(alpha.min()) == 255
+                finally:
+                    del alpha  # Release surface lock
+            except Exception:
+                pass
+        if not opaque:
+            return surf.convert_alpha()
+    return surf.convert()
+
+
+_FONT_CACHE = OrderedDict()
+_FONT_CACHE_MAX = 16
+
+# Text widths keyed by (font, text, rendered); fonts are the shared
+# load_font_cached objects, so entries stay valid across meter inits
+_FONT_METRIC_CACHE = OrderedDict()
+_FONT_METRIC_CACHE_MAX = 64
+
+
+def load_font_cached(path, size, bold=False):
+    """Load a font file, falling back to SysFont DejaVuSans when it is missing.
+    
+    Fonts are cached by (path, size, bold), so switching back to a meter
+    skips the file check and the FreeType face load. Returned fonts are
+    shared and must not have their style changed.
+    """
+    key = (path, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is not None:
+        _FONT_CACHE.move_to_end(key)
+        return font
+    if path and os.path.exists(path):
+        font = pg.font.Font(path, size)
+    else:
+        log_debug(f"  Font: SysFont DejaVuSans (fallback, file={path})", "basic")
+        key = (None, size, bold)
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            font = pg.font.SysFont("DejaVuSans", size, bold=bold)
+    _FONT_CACHE[key] = font
+    _FONT_CACHE.move_to_end(key)
+    if len(_FONT_CACHE) > _FONT_CACHE_MAX:
+        _FONT_CACHE.popitem(last=False)
+    return font
+
+
+# Common trackType variants normalized to format icon names
+FORMAT_ICON_ALIASES = {
+    'dab_radio': 'dab',
+    'dab_': 'dab',
+    'dab': 'dab',
+    'rtlsdr': 'dab',
+    'rtlsdr_radio': 'dab',
+    'fm_radio': 'fm',
+    'fm_': 'fm',
+    'fm': 'fm',
+    'webradio': 'radio',
+    'web_radio': 'radio',
+    'internet_radio': 'radio',
+    'tidal_connect': 'tidal',
+    'qobuz_connect': 'qobuz',
+    'spotify': 'spotify',
+    'spotify_connect': 'spotify',
+    'airplay': 'airplay',
+    'bluetooth': 'bluetooth',
+    'upnp': 'upnp',
+    'dlna': 'upnp',
+}
+LOCAL_FORMAT_ICONS = {'tidal', 'cd', 'qobuz', 'dab', 'fm', 'radio'}
+# Signal strength indicators and other suffixes after the format name
+# ("dab_●◦◦◦◦" -> "dab")
+FORMAT_SUFFIX_RE = re.compile(r'[^a-z0-9_].*')
+
+
+def resolve_format_icon(track_type):
+    """Normalize a raw trackType and locate its format icon.
+    
+    Returns (fmt, icon_path, icon_exists). The result only depends on
+    track_type, so handlers cache it per raw string to skip the regex,
+    alias lookup and stat() on redraws.
+    """
+    fmt = (track_type or "").strip().lower().replace(" ", "_")
+    if fmt == "dsf":
+        fmt = "dsd"
+    
+    # Strip signal strength indicators and other suffixes
+    # DAB sends "DAB ●◦◦◦◦" -> "dab_●◦◦◦◦", need just "dab"
+    # FM sends "FM ◦◦◦◦◦" -> "fm_◦◦◦◦◦", need just "fm"
+    fmt_clean = FORMAT_SUFFIX_RE.sub('', fmt)  # Keep only alphanumeric prefix
+    if fmt_clean:
+        fmt = fmt_clean
+    fmt = FORMAT_ICON_ALIASES.get(fmt, fmt)
+    
+    if fmt in LOCAL_FORMAT_ICONS:
+        icon_path = os.path.join(os.path.dirname(__file__), 'format-icons', f"{fmt}.svg")
+    else:
+        icon_path = f"/volumio/http/www3/app/assets-common/format-icons/{fmt}.svg"
+    return fmt, icon_path, os.path.exists(icon_path)
+
+
+_FORMAT_ICON_CACHE = OrderedDict()
+_FORMAT_ICON_CACHE_MAX = 16
+
+
+def rasterize_format_icon(icon_path, size, color):
+    """Rasterize a format icon SVG to fit size and tint it with color.
+    
+    Results are cached by (icon_path, size, color), so formats that recur
+    across tracks (flac, dsd, radio...) skip the SVG decode, scale and
+    set_color pass. Returns None when no SVG backend is available.
+    Returned surfaces are shared and must not be modified.
+    """
+    key = (icon_path, tuple(size), tuple(color[:3]))
+    img = _FORMAT_ICON_CACHE.get(key)
+    if img is not None:
+        _FORMAT_ICON_CACHE.move_to_end(key)
+        return img
+    width, height = key[1]
+    # Prefer cairosvg: rasterizes at exact target dimensions,
+    # consistent across platforms (Linux/Windows/Mac).
+    # pg.image.load() uses SDL_image nanosvg which produces
+    # platform-dependent default raster sizes for the same SVG.
+    if CAIROSVG_AVAILABLE and PIL_AVAILABLE:
+        png_bytes = cairosvg.svg2png(url=icon_path,
+                                     output_width=width,
+                                     output_height=height)
+        pil_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+        img = pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
+        img = img.convert_alpha()
+    elif pg.version.ver.startswith("2"):
+        # Fallback: Pygame 2 native SVG (platform-dependent size)
+        img = pg.image.load(icon_path)
+        w, h = img.get_width(), img.get_height()
+        sc = min(width / float(w), height / float(h))
+        new_size = (max(1, int(w * sc)), max(1, int(h * sc)))
+        try:
+            img = pg.transform.smoothscale(img, new_size)
+        except Exception:
+            img = pg.transform.scale(img, new_size)
+        img = img.convert_alpha()
+    else:
+        return None
+    set_color(img, pg.Color(key[2][0], key[2][1], key[2][2]))
+    _FORMAT_ICON_CACHE[key] = img
+    if len(_FORMAT_ICON_CACHE) > _FORMAT_ICON_CACHE_MAX:
+        _FORMAT_ICON_CACHE.popitem(last=False)
+    return img
+
+
+def _foreground_regions_numpy(surface, min_gap, padding):
+    """Vectorized compute_foreground_regions: one alpha scan instead of get_at per pixel."""
+    w, h = surface.get_size()
+    alpha = pg.surfarray.pixels_alpha(surface)  # (w, h) view, locks surface
+    try:
+        xs = np.flatnonzero(alpha.any(axis=1))
+        if xs.size == 0:
+            return []
+        # Split opaque columns into regions wherever the gap exceeds min_gap
+        breaks = np.flatnonzero(np.diff(xs) > min_gap)
+        starts = np.concatenate((xs[:1], xs[breaks + 1])).tolist()
+        ends = np.concatenate((xs[breaks], xs[-1:])).tolist()
+        regions = []
+        for region_start, region_end in zip(starts, ends):
+            ys = np.flatnonzero(alpha[region_start:region_end + 1].any(axis=0))
+            min_y = int(ys[0])
+            max_y = int(ys[-1])
+            regions.append(pg.Rect(
+                max(0, region_start - padding),
+                max(0, min_y - padding),
+                min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
+                min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
+            ))
+        return regions
+    finally:
+        del alpha  # Release surface lock
+
+
 def compute_foreground_regions(surface, min_gap=50, padding=2):
     """Analyze foreground surface and return list of opaque region rects."""
     if surface is None:
         return []
     
+    if NUMPY_AVAILABLE:
+        try:
+            return _foreground_regions_numpy(surface, min_gap, padding)
+        except Exception:
+            pass  # No per-pixel alpha or surfarray failure - use scan below
+    
     try:
         w, h = surface.get_size()
-        opaque_columns = {}
+        
+        # Opaque y extent per column as (x, min_y, max_y). Each column is
+        # scanned from both ends and stops at the first opaque pixel.
+        columns = []
         for x in range(w):
+            min_y = -1
             for y in range(h):
-                try:
-                    pixel = surface.get_at((x, y))
-                    if len(pixel) >= 4 and pixel[3] > 0:
-                        if x not in opaque_columns:
-                            opaque_columns[x] = []
-                        opaque_columns[x].append(y)
-                except Exception:
-                    continue
-        
-        if not opaque_columns:
+                if surface.get_at((x, y))[3] > 0:
+                    min_y = y
+                    break
+            if min_y < 0:
+                continue
+            max_y = min_y
+            for y in range(h - 1, min_y, -1):
+                if surface.get_at((x, y))[3] > 0:
+                    max_y = y
+                    break
+            columns.append((x, min_y, max_y))
+        
+        if not columns:
             return []
         
-        x_sorted = sorted(opaque_columns.keys())
+        # Group columns into horizontal regions based on gaps; the sentinel
+        # column past the right edge closes the final region
         regions = []
-        region_start = x_sorted[0]
-        region_end = x_sorted[0]
-        
-        for i in range(1, len(x_sorted)):
-            if x_sorted[i] - x_sorted[i-1] > min_gap:
-                min_y = min(min(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-                max_y = max(max(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
+        region_start, min_y, max_y = columns[0]
+        region_end = region_start
+        for x, col_min, col_max in columns[1:] + [(w + min_gap + 1, 0, 0)]:
+            if x - region_end > min_gap:
                 regions.append(pg.Rect(
                     max(0, region_start - padding),
                     max(0, min_y - padding),
                     min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
                     min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
                 ))
-                region_start = x_sorted[i]
-            region_end = x_sorted[i]
-        
-        min_y = min(min(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-        max_y = max(max(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-        regions.append(pg.Rect(
-            max(0, region_start - padding),
-            max(0, min_y - padding),
-            min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
-            min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
-        ))
+                region_start, min_y, max_y = x, col_min, col_max
+            else:
+                min_y = min(min_y, col_min)
+                max_y = max(max_y, col_max)
+            region_end = x
         
         return regions
     except Exception:
         return []
 
 
+_FGR_REGION_CACHE = OrderedDict()
+_FGR_REGION_CACHE_MAX = 8
+
+
+def compute_foreground_regions_cached(path, surface):
+    """compute_foreground_regions for a skin file, cached by path and mtime.
+    
+    The alpha scan only depends on the file, so switching back to a meter
+    reuses its regions. Returns fresh Rect copies the caller may modify.
+    """
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        return compute_foreground_regions(surface)
+    regions = _FGR_REGION_CACHE.get(key)
+    if regions is None:
+        regions = compute_foreground_regions(surface)
+        _FGR_REGION_CACHE[key] = regions
+        if len(_FGR_REGION_CACHE) > _FGR_REGION_CACHE_MAX:
+            _FGR_REGION_CACHE.popitem(last=False)
+    else:
+        _FGR_REGION_CACHE.move_to_end(key)
+    return [r.copy() for r in regions]
+
+
+def coalesce_rects(rects):
+    """Merge overlapping dirty rects into their unions.
+    
+    A merged rect is re-checked against the ones already kept, so the
+    result never contains two overlapping rects.
+    """
+    merged = []
+    for r in sorted((pg.Rect(r) for r in rects if r), key=lambda r: (r.y, r.x)):
+        i = r.collidelist(merged)
+        while i != -1:
+            r.union_ip(merged.pop(i))
+            i = r.collidelist(merged)
+        merged.append(r)
+    return merged
+
+
+def iter_meter_rects(meter_rects):
+    """Yield the dirty rects from a meter.run() result.
+    
+    meter.run() returns a list of rects or (component, rect) tuples, a
+    single such tuple, or a single rect.
+    """
+    if not meter_rects:
+        return
+    if not isinstance(meter_rects, list):
+        meter_rects = (meter_rects,)
+    for item in meter_rects:
+        if isinstance(item, tuple):
+            if len(item) >= 2 and item[1]:
+                yield item[1]
+        elif item and hasattr(item, 'x'):
+            yield item
+
+
+def format_mmss(sec):
+    """Format whole seconds as MM:SS (minutes keep counting past 99)."""
+    return "%02d:%02d" % divmod(sec, 60)
+
+
 # =============================================================================
 # ScrollingLabel - Text animation with self-backing
 # =============================================================================
 class ScrollingLabel:
     """Single-threaded scrolling text label with bidirectional or one-way scroll and self-backing."""
     
+    # Rendered text shared across labels, keyed by (font, text, color).
+    # Surfaces are only ever blitted from, so sharing them is safe.
+    _render_cache = OrderedDict()
+    _RENDER_CACHE_MAX = 64
+    
     def __init__(self, font, color, pos, box_width, center=False,
                  speed_px_per_sec=40, pause_ms=400, scroll_direction="default",
                  loop_segment_pixels=None):
@@ -421,7 +687,7 @@ class ScrollingLabel:
             log_debug(f"[Scrolling] UPDATE: old='{self.text[:20]}', new='{new_text[:20]}'", "trace", "scrolling")
         
         self.text = new_text
-        self.surf = self.font.render(self.text, True, self.color)
+        self.surf = self._render(self.text)
         self.text_w, self.text_h = self.surf.get_size()
         limit = max(0, self.text_w - self.box_width) if self.box_width > 0 else 0
         if self.scroll_direction == "rtl":
@@ -436,6 +702,27 @@ class ScrollingLabel:
         self._last_draw_offset = -1
         return True
 
+    def _render(self, text):
+        """Render text through the shared LRU cache (empty strings bypass it)."""
+        if not text:
+            return self.font.render(text, True, self.color)
+        cache = ScrollingLabel._render_cache
+        key = (self.font, text, tuple(self.color))
+        surf = cache.get(key)
+        if surf is not None:
+            cache.move_to_end(key)
+            return surf
+        surf = self.font.render(text, True, self.color)
+        try:
+            # Match the display pixel format so scroll blits skip conversion
+            surf = surf.convert_alpha()
+        except Exception:
+            pass
+        cache[key] = surf
+        if len(cache) > self._RENDER_CACHE_MAX:
+            cache.popitem(last=False)
+        return surf
+
     def force_redraw(self):
         """Force redraw on next draw() call."""
         self._needs_redraw = True
@@ -665,7 +952,8 @@ class AlbumArtRenderer:
                     scaled = pg.transform.scale(surf, self.art_dim)
                 
                 try:
-                    self._scaled_surf = scaled.convert_alpha()
+                    # Unmasked art is usually opaque - blit it without blending
+                    self._scaled_surf = convert_for_blit(scaled)
                 except Exception:
                     self._scaled_surf = scaled
                 
@@ -786,23 +1074,31 @@ class ReelRenderer:
             print(f"[ReelRenderer] Failed to load '{self.filename}': {e}")
     
     def _update_angle(self, status, now_ticks, volatile=False):
-        """Update rotation angle based on RPM, direction, and playback status."""
+        """Update rotation angle based on RPM, direction, and playback status.
+        
+        :param status: STATUS_* code (see resolve_status)
+        """
         # Calculate effective RPM from base RPM and current speed multiplier
         effective_rpm = self._base_rpm * self.speed_multiplier
         if effective_rpm <= 0.0:
             return
         
-        status = (status or "").lower()
-        if volatile and status in ("stop", "pause"):
-            status = "play"
-        if status == "play":
-            # SMOOTH_ROTATION: rollback replace block with: dt = self._blit_interval_ms / 1000.0
+        if volatile and status in (STATUS_STOP, STATUS_PAUSE):
+            status = STATUS_PLAY
+        if status == STATUS_PLAY:
+            # SMOOTH_ROTATION: rollback replace block with: dt_ms = self._blit_interval_ms
             if getattr(self, '_smooth_rotation', False) and self._last_blit_tick > 0:
-                dt = (now_ticks - self._last_blit_tick) / 1000.0
-                dt = min(max(dt, 0.0), 0.5)
+                dt_ms = now_ticks - self._last_blit_tick
+                if dt_ms > MAX_ROTATION_DT_MS:
+                    dt_ms = MAX_ROTATION_DT_MS
+                elif dt_ms < 0:
+                    dt_ms = 0
             else:
-                dt = self._blit_interval_ms / 1000.0
-            self._current_angle = (self._current_angle + effective_rpm * 6.0 * dt * self.direction_mult) % 360.0
+                dt_ms = self._blit_interval_ms
+            # speed_multiplier changes at runtime (adaptive spools), so degrees
+            # per ms is derived here rather than cached: rpm * 360 / 60000
+            deg_per_ms = effective_rpm * 0.006 * self.direction_mult
+            self._current_angle = (self._current_angle + deg_per_ms * dt_ms) % 360.0
             if getattr(self, '_smooth_rotation', False):
                 self._last_blit_tick = now_ticks
     
@@ -992,6 +1288,7 @@ class CassetteHandler:
         self.next_title_scroller = None
         self.next_artist_scroller = None
         self.next_album_scroller = None
+        self._scrollers = []  # all non-None scrollers, set in init_for_meter
 
         # Positions and fonts
         self.time_pos = None
@@ -1019,6 +1316,7 @@ class CassetteHandler:
         self.fgr_surf = None
         self.fgr_pos = (0, 0)
         self.fgr_regions = []
+        self.fgr_screen_regions = []  # (screen_rect, source_rect) pairs
         
         # Background surface for layer composition clearing
         self.bgr_surface = None
@@ -1032,6 +1330,11 @@ class CassetteHandler:
         self.last_sample_surf = None
         self.last_track_type = ""
         self.last_format_icon_surf = None
+        self._fmt_resolve_cache = {}  # raw trackType -> resolve_format_icon()
+        self._persist_file = os.path.join(tempfile.gettempdir(), 'peppy_persist')
+        self._persist_cache = None  # see _read_persist
+        self._artist_src = self._album_src = None
+        self._display_artist = ""
         
         log_debug("CassetteHandler initialized", "basic")
         
@@ -1039,7 +1342,7 @@ class CassetteHandler:
         # Higher values = lower CPU but meters may feel sluggish
         # Lower values = higher CPU but more responsive meters
         self.meter_delay_ms = max(0, min(20, meter_config_volumio.get(METER_DELAY, 10)))
-        self.meter_delay_sec = self.meter_delay_ms / 1000.0
+        self._meter_run_ms = 0  # get_ticks() of the last meter.run() in render
     
     def init_for_meter(self, meter_name):
         """Initialize handler for a specific meter."""
@@ -1061,6 +1364,9 @@ class CassetteHandler:
         self.last_sample_surf = None
         self.last_track_type = ""
         self.last_format_icon_surf = None
+        self._fmt_resolve_cache.clear()
+        self._artist_src = self._album_src = None
+        self._display_artist = ""
         
         # Fill screen black
         self.screen.fill((0, 0, 0))
@@ -1205,7 +1511,7 @@ class CassetteHandler:
             if sample_max:
                 self.sample_box = sample_max
             else:
-                self.sample_box = self.sample_font.size('-44.1 kHz 24 bit-')[0]
+                self.sample_box = self._text_width(self.sample_font, '-44.1 kHz 24 bit-')
         else:
             self.sample_box = 0
         
@@ -1428,31 +1734,16 @@ class CassetteHandler:
         self.ticker_end_spaces = max(0, int(mc_vol.get(PLAY_TICKER_END_SPACES, 8)))
         self.ticker_scroller = ScrollingLabel(ticker_font, ticker_color, ticker_pos, ticker_box, center=self.center_flag, speed_px_per_sec=ticker_speed, scroll_direction=ticker_direction, loop_segment_pixels=None) if (ticker_enabled and ticker_pos and ticker_box) else None
         self.ticker_append_next = bool(mc_vol.get(PLAY_TICKER_APPEND_NEXT)) if ticker_enabled else False
+        self._scrollers = [sc for sc in (self.artist_scroller, self.title_scroller, self.album_scroller,
+                                         self.next_title_scroller, self.next_artist_scroller,
+                                         self.next_album_scroller, self.ticker_scroller) if sc]
 
         # LAYER COMPOSITION: Set background surface on scrollers for proper clearing
         # This eliminates backing collision artifacts when text overlaps other content
         if self.bgr_surface:
-            if self.artist_scroller:
-                self.artist_scroller.set_background_surface(self.bgr_surface)
-                self.artist_scroller.capture_backing(self.screen)  # Still capture rect for clearing bounds
-            if self.title_scroller:
-                self.title_scroller.set_background_surface(self.bgr_surface)
-                self.title_scroller.capture_backing(self.screen)
-            if self.album_scroller:
-                self.album_scroller.set_background_surface(self.bgr_surface)
-                self.album_scroller.capture_backing(self.screen)
-            if self.next_title_scroller:
-                self.next_title_scroller.set_background_surface(self.bgr_surface)
-                self.next_title_scroller.capture_backing(self.screen)
-            if self.next_artist_scroller:
-                self.next_artist_scroller.set_background_surface(self.bgr_surface)
-                self.next_artist_scroller.capture_backing(self.screen)
-            if self.next_album_scroller:
-                self.next_album_scroller.set_background_surface(self.bgr_surface)
-                self.next_album_scroller.capture_backing(self.screen)
-            if self.ticker_scroller:
-                self.ticker_scroller.set_background_surface(self.bgr_surface)
-                self.ticker_scroller.capture_backing(self.screen)
+            for sc in self._scrollers:
+                sc.set_background_surface(self.bgr_surface)
+                sc.capture_backing(self.screen)  # Still capture rect for clearing bounds
 
         # NOTE: No backing captures needed for scrollers/indicators
         # Layer composition prevents all backing restore collisions
@@ -1467,19 +1758,19 @@ class CassetteHandler:
         
         # Time rect (for clearing from bgr_surface; use effective time font per field)
         if self.time_pos and self.font_time_remaining:
-            time_width = self.font_time_remaining.render('00:00', True, (255,255,255)).get_width() + 4  # render() includes italic overhang; size() does not
+            time_width = self._text_width(self.font_time_remaining, '00:00', rendered=True) + 4  # render() includes italic overhang; size() does not
             time_height = self.font_time_remaining.get_linesize()
             self.time_rect = pg.Rect(self.time_pos[0], self.time_pos[1], time_width, time_height)
         else:
             self.time_rect = None
         if self.time_elapsed_pos and self.font_time_elapsed:
-            time_width = self.font_time_elapsed.render('00:00', True, (255,255,255)).get_width() + 4  # render() includes italic overhang; size() does not
+            time_width = self._text_width(self.font_time_elapsed, '00:00', rendered=True) + 4  # render() includes italic overhang; size() does not
             time_height = self.font_time_elapsed.get_linesize()
             self.time_elapsed_rect = pg.Rect(self.time_elapsed_pos[0], self.time_elapsed_pos[1], time_width, time_height)
         else:
             self.time_elapsed_rect = None
         if self.time_total_pos and self.font_time_total:
-            time_width = self.font_time_total.render('00:00', True, (255,255,255)).get_width() + 4  # render() includes italic overhang; size() does not
+            time_width = self._text_width(self.font_time_total, '00:00', rendered=True) + 4  # render() includes italic overhang; size() does not
             time_height = self.font_time_total.get_linesize()
             self.time_total_rect = pg.Rect(self.time_total_pos[0], self.time_total_pos[1], time_width, time_height)
         else:
@@ -1495,6 +1786,7 @@ class CassetteHandler:
         # Load foreground
         self.fgr_surf = None
         self.fgr_regions = []
+        self.fgr_screen_regions = []
         fgr_name = mc.get(FGR_FILENAME)
         meter_x = mc.get('meter.x', 0)
         meter_y = mc.get('meter.y', 0)
@@ -1503,8 +1795,10 @@ class CassetteHandler:
                 meter_path = os.path.join(self.config.get(BASE_PATH), self.config.get(SCREEN_INFO)[METER_FOLDER])
                 fgr_path = os.path.join(meter_path, fgr_name)
                 self.fgr_surf = pg.image.load(fgr_path).convert_alpha()
-                self.fgr_regions = compute_foreground_regions(self.fgr_surf)
+                self.fgr_regions = compute_foreground_regions_cached(fgr_path, self.fgr_surf)
                 self.fgr_pos = (meter_x, meter_y)
+                # Regions never move, so their screen rects are computed once
+                self.fgr_screen_regions = [(r.move(meter_x, meter_y), r) for r in self.fgr_regions]
                 if self.fgr_regions:
                     log_debug(f"Foreground has {len(self.fgr_regions)} opaque regions for selective blit")
                     for i, r in enumerate(self.fgr_regions):
@@ -1539,39 +1833,23 @@ class CassetteHandler:
         
         # Light font
         light_file = self.meter_config_volumio.get(FONT_LIGHT)
-        if light_file and os.path.exists(font_path + light_file):
-            self.fontL = pg.font.Font(font_path + light_file, size_light)
-            log_debug(f"  Font light: {font_path + light_file}", "basic")
-        else:
-            self.fontL = pg.font.SysFont("DejaVuSans", size_light)
-            log_debug(f"  Font light: SysFont DejaVuSans (fallback, file={light_file})", "basic")
+        self.fontL = load_font_cached(font_path + light_file if light_file else None, size_light)
+        log_debug(f"  Font light: {light_file} size={size_light}", "basic")
         
         # Regular font
         regular_file = self.meter_config_volumio.get(FONT_REGULAR)
-        if regular_file and os.path.exists(font_path + regular_file):
-            self.fontR = pg.font.Font(font_path + regular_file, size_regular)
-            log_debug(f"  Font regular: {font_path + regular_file}", "basic")
-        else:
-            self.fontR = pg.font.SysFont("DejaVuSans", size_regular)
-            log_debug(f"  Font regular: SysFont DejaVuSans (fallback, file={regular_file})", "basic")
+        self.fontR = load_font_cached(font_path + regular_file if regular_file else None, size_regular)
+        log_debug(f"  Font regular: {regular_file} size={size_regular}", "basic")
         
         # Bold font
         bold_file = self.meter_config_volumio.get(FONT_BOLD)
-        if bold_file and os.path.exists(font_path + bold_file):
-            self.fontB = pg.font.Font(font_path + bold_file, size_bold)
-            log_debug(f"  Font bold: {font_path + bold_file}", "basic")
-        else:
-            self.fontB = pg.font.SysFont("DejaVuSans", size_bold, bold=True)
-            log_debug(f"  Font bold: SysFont DejaVuSans (fallback, file={bold_file})", "basic")
+        self.fontB = load_font_cached(font_path + bold_file if bold_file else None, size_bold, bold=True)
+        log_debug(f"  Font bold: {bold_file} size={size_bold}", "basic")
         
         # Digital font for time (default; used when per-field font/size not set)
         default_digi_path = os.path.join(os.path.dirname(__file__), 'fonts', 'DSEG7Classic-Italic.ttf')
-        if os.path.exists(default_digi_path):
-            self.fontDigi = pg.font.Font(default_digi_path, size_digi)
-            log_debug(f"  Font digi: {default_digi_path}", "basic")
-        else:
-            self.fontDigi = pg.font.SysFont("DejaVuSans", size_digi)
-            log_debug(f"  Font digi: SysFont DejaVuSans (fallback)", "basic")
+        self.fontDigi = load_font_cached(default_digi_path, size_digi)
+        log_debug(f"  Font digi: {default_digi_path} size={size_digi}", "basic")
 
         # Per-field time fonts (remaining, elapsed, total): optional font path + fontsize; fallback to fontDigi
         meter_path = os.path.join(self.config.get(BASE_PATH), self.config.get(SCREEN_INFO)[METER_FOLDER])
@@ -1594,11 +1872,8 @@ class CassetteHandler:
                 return self.fontDigi
             key = (path, size)
             if key not in self._time_font_cache:
-                if os.path.exists(path):
-                    self._time_font_cache[key] = pg.font.Font(path, size)
-                    log_debug(f"  Time font: loaded {path} size={size}", "verbose")
-                else:
-                    self._time_font_cache[key] = pg.font.SysFont("DejaVuSans", size)
+                self._time_font_cache[key] = load_font_cached(path, size)
+                log_debug(f"  Time font: loaded {path} size={size}", "verbose")
             return self._time_font_cache[key]
 
         path_remaining = resolve_time_font_path(mc_vol.get(TIME_REMAINING_FONT))
@@ -1630,6 +1905,62 @@ class CassetteHandler:
         self.font_time_elapsed = self.fontDigiElapsed if (not style_elapsed or style_elapsed == "digi") else self._font_for_style(norm_time_style(style_elapsed))
         self.font_time_total = self.fontDigiTotal if (not style_total or style_total == "digi") else self._font_for_style(norm_time_style(style_total))
     
+    def _wait_meter_delay(self):
+        """Keep meter.run() calls at least meter_delay_ms apart.
+        
+        Sleeps only for the part of the delay the frame has not already
+        spent (rendering, clock.tick), instead of adding the full delay to
+        every frame.
+        """
+        if self.meter_delay_ms > 0:
+            wait_ms = self._meter_run_ms + self.meter_delay_ms - pg.time.get_ticks()
+            if wait_ms > 0:
+                time_module.sleep(wait_ms / 1000.0)
+        self._meter_run_ms = pg.time.get_ticks()
+    
+    def _read_persist(self):
+        """Return (duration_sec, start_ts, display_mode) from the persist file.
+        
+        The file is only re-read when its mtime or size changes, so idle
+        frames cost one stat() instead of an exists/open/read. Returns None
+        when the file is missing; duration and start are None when it is
+        malformed.
+        """
+        try:
+            st = os.stat(self._persist_file)
+        except OSError:
+            self._persist_cache = None
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cache = self._persist_cache
+        if cache is None or cache[0] != stamp:
+            p_duration = start_ts = None
+            mode = "freeze"
+            try:
+                with open(self._persist_file, 'r') as f:
+                    parts = f.read().strip().split(':')
+                if len(parts) >= 2:
+                    p_duration, start_ts = int(parts[0]), int(parts[1]) / 1000.0
+                if len(parts) >= 3:
+                    mode = parts[2]
+            except Exception:
+                pass
+            cache = self._persist_cache = (stamp, p_duration, start_ts, mode)
+        return cache[1:]
+    
+    def _draw_time_field(self, text, font, color, pos, rect, dirty_rects):
+        """Clear a time field from bgr_surface and draw text at pos.
+        
+        Shared by the remaining, elapsed and total time layers; returns the
+        rendered surface.
+        """
+        if self.bgr_surface and rect:
+            self.screen.blit(self.bgr_surface, rect.topleft, rect)
+            dirty_rects.append(rect)
+        surf = font.render(text, True, color)
+        self.screen.blit(surf, pos)
+        return surf
+    
     def _font_for_style(self, style):
         """Get font for style."""
         if style == FONT_STYLE_B:
@@ -1638,6 +1969,27 @@ class CassetteHandler:
             return self.fontR
         else:
             return self.fontL
+
+    def _text_width(self, font, text, rendered=False):
+        """Get width of text in font, measured once per font.
+        rendered=True measures the rendered surface, which includes italic overhang.
+
+        Fonts come from load_font_cached and are shared across meter inits,
+        so the module-level cache also hits when switching back to a meter.
+        """
+        key = (font, text, rendered)
+        width = _FONT_METRIC_CACHE.get(key)
+        if width is not None:
+            _FONT_METRIC_CACHE.move_to_end(key)
+            return width
+        if rendered:
+            width = font.render(text, True, (255, 255, 255)).get_width()
+        else:
+            width = font.size(text)[0]
+        _FONT_METRIC_CACHE[key] = width
+        if len(_FONT_METRIC_CACHE) > _FONT_METRIC_CACHE_MAX:
+            _FONT_METRIC_CACHE.popitem(last=False)
+        return width
     
     def _draw_static_assets(self, mc):
         """Draw static background."""
@@ -1699,11 +2051,10 @@ class CassetteHandler:
         :return: List of dirty rects
         """
         if not self.enabled:
-            meter_rects = self.meter.run()
-            if meter_rects:
-                return meter_rects if isinstance(meter_rects, list) else [meter_rects]
-            return []
+            return list(iter_meter_rects(self.meter.run()))
         
+        # Consumers only read these rects (collidelist, coalesce, display.update),
+        # so handler-owned rects are appended without copying
         dirty_rects = []
         
         # Extract metadata
@@ -1715,9 +2066,9 @@ class CassetteHandler:
         bitdepth = meta.get("bitdepth", "")
         track_type = meta.get("trackType", "")
         bitrate = meta.get("bitrate", "")
-        status = meta.get("status", "")
+        status = resolve_status(meta.get("status", ""))
         volatile = meta.get("volatile", False)
-        is_playing = status == "play"
+        is_playing = status == STATUS_PLAY
         duration = meta.get("duration", 0) or 0
         
         # Get queue mode from config
@@ -1746,6 +2097,9 @@ class CassetteHandler:
         # This allows progress bar to reflect queue progress when queue mode is active
         meta["_effective_progress_pct"] = effective_progress_pct
         
+        # Wall clock sampled once per frame for seek interpolation and the persist countdown
+        now_wall = time.time()
+        
         # Seek interpolation - calculate current position based on elapsed time
         # CRITICAL: Don't use 'or' fallback - 0 is a valid seek position!
         seek_raw = meta.get("_seek_raw")
@@ -1759,7 +2113,7 @@ class CassetteHandler:
         # Webradio excluded by duration=0 check
         if is_playing and duration > 0:
             if seek_update_time > 0:
-                elapsed_ms = (time.time() - seek_update_time) * 1000
+                elapsed_ms = (now_wall - seek_update_time) * 1000
                 seek = min(duration * 1000, seek_raw + elapsed_ms)
                 meta["seek"] = seek  # Update for indicators (progress bar)
         
@@ -1848,19 +2202,22 @@ class CassetteHandler:
         
         # Clear all dirty regions from background
         if clear_regions and self.bgr_surface:
-            for region in clear_regions:
-                # Blit from background surface to clear this region
-                self.screen.blit(self.bgr_surface, region.topleft, region)
+            # One blits() call instead of a Python-level blit per region
+            self.screen.blits([(self.bgr_surface, region.topleft, region) for region in clear_regions],
+                              doreturn=False)
         
         # PERFORMANCE: Helper to check if component overlaps any cleared region
         # Only force redraw components that actually need it
+        # Union of all cleared regions: a single colliderect rejects most
+        # components without walking the list.
+        clear_union = clear_regions[0].unionall(clear_regions[1:]) if clear_regions else None
+        
         def overlaps_cleared(component_rect):
-            if not component_rect or not clear_regions:
+            if not component_rect or clear_union is None:
                 return False
-            for region in clear_regions:
-                if region and component_rect.colliderect(region):
-                    return True
-            return False
+            if not component_rect.colliderect(clear_union):
+                return False
+            return len(clear_regions) == 1 or component_rect.collidelist(clear_regions) != -1
         
         # =================================================================
         # RENDER ALL LAYERS IN Z-ORDER
@@ -1891,50 +2248,27 @@ class CassetteHandler:
                     dirty_rects.append(rect)
         
         # LAYER 4: Meters (draw AFTER reels/art so needles are visible)
-        meter_rects = self.meter.run()
-        if meter_rects:
-            if isinstance(meter_rects, list):
-                for item in meter_rects:
-                    if item:
-                        if isinstance(item, tuple) and len(item) >= 2:
-                            rect = item[1]
-                            if rect:
-                                dirty_rects.append(rect)
-                        elif hasattr(item, 'x'):
-                            dirty_rects.append(item)
-            elif isinstance(meter_rects, tuple) and len(meter_rects) >= 2:
-                rect = meter_rects[1]
-                if rect:
-                    dirty_rects.append(rect)
-            elif hasattr(meter_rects, 'x'):
-                dirty_rects.append(meter_rects)
+        # Performance: space meter runs for audio buffer accumulation
+        self._wait_meter_delay()
+        dirty_rects.extend(iter_meter_rects(self.meter.run()))
         
         # LAYER 5: Text fields - smart forcing based on overlap with cleared regions
         # PERFORMANCE FIX: Only force scrollers that actually overlap reel areas
-        if self.artist_scroller:
-            if overlaps_cleared(self.artist_scroller._backing_rect):
-                self.artist_scroller.force_redraw()
-        if self.title_scroller:
-            if overlaps_cleared(self.title_scroller._backing_rect):
-                self.title_scroller.force_redraw()
-        if self.album_scroller:
-            if overlaps_cleared(self.album_scroller._backing_rect):
-                self.album_scroller.force_redraw()
-        if self.next_title_scroller:
-            if overlaps_cleared(self.next_title_scroller._backing_rect):
-                self.next_title_scroller.force_redraw()
-        if self.next_artist_scroller:
-            if overlaps_cleared(self.next_artist_scroller._backing_rect):
-                self.next_artist_scroller.force_redraw()
-        if self.next_album_scroller:
-            if overlaps_cleared(self.next_album_scroller._backing_rect):
-                self.next_album_scroller.force_redraw()
+        # (nothing was cleared on a static frame, so skip the checks entirely)
+        if clear_regions:
+            for sc in self._scrollers:
+                if overlaps_cleared(sc._backing_rect):
+                    sc.force_redraw()
 
         if self.artist_scroller:
-            display_artist = artist
-            if not self.album_pos and album:
-                display_artist = f"{artist} - {album}" if artist else album
-            self.artist_scroller.update_text(display_artist)
+            # Rebuild the "artist - album" line only when either source changes
+            if artist != self._artist_src or album != self._album_src:
+                display_artist = artist
+                if not self.album_pos and album:
+                    display_artist = f"{artist} - {album}" if artist else album
+                self._display_artist = display_artist
+                self._artist_src, self._album_src = artist, album
+            self.artist_scroller.update_text(self._display_artist)
             rect = self.artist_scroller.draw(self.screen)
             if rect:
                 dirty_rects.append(rect)
@@ -1999,34 +2333,21 @@ class CassetteHandler:
             indicator_dirty_rects = dirty_rects[indicator_dirty_start:]
 
         def overlaps_indicator_dirty(rect):
-            if not rect or not indicator_dirty_rects:
-                return False
-            for dirty in indicator_dirty_rects:
-                if dirty and rect.colliderect(dirty):
-                    return True
-            return False
+            return bool(rect and indicator_dirty_rects) and rect.collidelist(indicator_dirty_rects) != -1
         
         # LAYER 7: Time remaining (FORCE when reels animate)
         if self.time_pos:
-            current_time = time_module.time()
+            current_time = now_wall
             
             # Check for persist file (countdown mode for external control)
             persist_countdown_sec = None
             persist_display_mode = "freeze"
-            persist_file = os.path.join(tempfile.gettempdir(), 'peppy_persist')
-            if not is_playing and os.path.exists(persist_file):
-                try:
-                    with open(persist_file, 'r') as f:
-                        parts = f.read().strip().split(':')
-                        if len(parts) >= 2:
-                            p_duration = int(parts[0])
-                            start_ts = int(parts[1]) / 1000.0
-                            elapsed_persist = current_time - start_ts
-                            persist_countdown_sec = max(0, p_duration - int(elapsed_persist))
-                        if len(parts) >= 3:
-                            persist_display_mode = parts[2]
-                except Exception:
-                    pass
+            if not is_playing:
+                persist = self._read_persist()
+                if persist:
+                    p_duration, start_ts, persist_display_mode = persist
+                    if p_duration is not None:
+                        persist_countdown_sec = max(0, p_duration - int(current_time - start_ts))
             
             time_remain_sec = meta.get("_time_remain", -1)
             time_last_update = meta.get("_time_update", 0)
@@ -2054,20 +2375,13 @@ class CassetteHandler:
                 display_sec = -1
             
             if display_sec >= 0:
-                mins = display_sec // 60
-                secs = display_sec % 60
-                time_str = f"{mins:02d}:{secs:02d}"
+                time_str = format_mmss(display_sec)
                 
                 needs_redraw = time_str != self.last_time_str or force_flag or overlaps_indicator_dirty(self.time_rect)
                 
                 if needs_redraw:
                     self.last_time_str = time_str
                     
-                    # LAYER COMPOSITION: Clear from bgr_surface
-                    if self.bgr_surface and self.time_rect:
-                        self.screen.blit(self.bgr_surface, self.time_rect.topleft, self.time_rect)
-                        dirty_rects.append(self.time_rect.copy())
-                    
                     # Color: orange for persist countdown, red for <10s, else skin color
                     if show_persist_countdown:
                         t_color = (242, 165, 0)  # Orange
@@ -2076,8 +2390,8 @@ class CassetteHandler:
                     else:
                         t_color = self.time_color
                     
-                    self.last_time_surf = self.font_time_remaining.render(time_str, True, t_color)
-                    self.screen.blit(self.last_time_surf, self.time_pos)
+                    self.last_time_surf = self._draw_time_field(time_str, self.font_time_remaining, t_color,
+                                                                self.time_pos, self.time_rect, dirty_rects)
                     
                     if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("time", False):
                         log_debug(f"[Time] OUTPUT: rendered '{time_str}' at {self.time_pos}, color={t_color}", "trace", "time")
@@ -2086,7 +2400,7 @@ class CassetteHandler:
         if self.time_elapsed_pos and self.font_time_elapsed:
             seek_ms = meta.get("seek") or 0
             elapsed_sec = max(0, int(seek_ms) // 1000)
-            elapsed_str = f"{elapsed_sec // 60:02d}:{elapsed_sec % 60:02d}"
+            elapsed_str = format_mmss(elapsed_sec)
             needs_redraw = (
                 elapsed_str != self.last_elapsed_str or force_flag or
                 (self.time_elapsed_rect and overlaps_cleared(self.time_elapsed_rect)) or
@@ -2094,16 +2408,13 @@ class CassetteHandler:
             )
             if needs_redraw:
                 self.last_elapsed_str = elapsed_str
-                if self.bgr_surface and self.time_elapsed_rect:
-                    self.screen.blit(self.bgr_surface, self.time_elapsed_rect.topleft, self.time_elapsed_rect)
-                    dirty_rects.append(self.time_elapsed_rect.copy())
-                surf = self.font_time_elapsed.render(elapsed_str, True, self.time_elapsed_color)
-                self.screen.blit(surf, self.time_elapsed_pos)
+                self._draw_time_field(elapsed_str, self.font_time_elapsed, self.time_elapsed_color,
+                                      self.time_elapsed_pos, self.time_elapsed_rect, dirty_rects)
 
         # LAYER 7c: Total time (when time.total.pos set, anti-collision: force redraw when reels overlap)
         if self.time_total_pos and self.font_time_total:
             duration_sec = max(0, int(meta.get("duration") or 0))
-            total_str = f"{duration_sec // 60:02d}:{duration_sec % 60:02d}"
+            total_str = format_mmss(duration_sec)
             needs_redraw = (
                 total_str != self.last_total_str or force_flag or
                 (self.time_total_rect and overlaps_cleared(self.time_total_rect)) or
@@ -2111,56 +2422,23 @@ class CassetteHandler:
             )
             if needs_redraw:
                 self.last_total_str = total_str
-                if self.bgr_surface and self.time_total_rect:
-                    self.screen.blit(self.bgr_surface, self.time_total_rect.topleft, self.time_total_rect)
-                    dirty_rects.append(self.time_total_rect.copy())
-                surf = self.font_time_total.render(total_str, True, self.time_total_color)
-                self.screen.blit(surf, self.time_total_pos)
+                self._draw_time_field(total_str, self.font_time_total, self.time_total_color,
+                                      self.time_total_pos, self.time_total_rect, dirty_rects)
 
         # LAYER 8: Sample rate / format icon
         # PERFORMANCE FIX: Separate format CHANGE (expensive) from force BLIT (cheap)
         # Profiler showed 46% CPU wasted reloading/scaling/colorizing icon every frame
         if self.type_rect:
-            fmt = (track_type or "").strip().lower().replace(" ", "_")
-            if fmt == "dsf":
-                fmt = "dsd"
-            
-            # Strip signal strength indicators and other suffixes
-            # DAB sends "DAB ●◦◦◦◦" -> "dab_●◦◦◦◦", need just "dab"
-            # FM sends "FM ◦◦◦◦◦" -> "fm_◦◦◦◦◦", need just "fm"
-            import re
-            fmt_clean = re.sub(r'[^a-z0-9_].*', '', fmt)  # Keep only alphanumeric prefix
-            if fmt_clean:
-                fmt = fmt_clean
-            
-            # Normalize common trackType variants to icon names
-            format_map = {
-                'dab_radio': 'dab',
-                'dab_': 'dab',
-                'dab': 'dab',
-                'rtlsdr': 'dab',
-                'rtlsdr_radio': 'dab',
-                'fm_radio': 'fm',
-                'fm_': 'fm',
-                'fm': 'fm',
-                'webradio': 'radio',
-                'web_radio': 'radio',
-                'internet_radio': 'radio',
-                'tidal_connect': 'tidal',
-                'qobuz_connect': 'qobuz',
-                'spotify': 'spotify',
-                'spotify_connect': 'spotify',
-                'airplay': 'airplay',
-                'bluetooth': 'bluetooth',
-                'upnp': 'upnp',
-                'dlna': 'upnp',
-            }
-            fmt_before = fmt
-            fmt = format_map.get(fmt, fmt)
-            
-            # TRACE: Log format icon processing
-            if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("metadata", False):
-                log_debug(f"[FormatIcon] INPUT: track_type='{track_type}', fmt_normalized='{fmt_before}', fmt_mapped='{fmt}'", "trace", "metadata")
+            # Format resolution only depends on the raw trackType
+            resolved = self._fmt_resolve_cache.get(track_type)
+            if resolved is None:
+                resolved = resolve_format_icon(track_type)
+                self._fmt_resolve_cache[track_type] = resolved
+                
+                # TRACE: Log format icon processing
+                if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("metadata", False):
+                    log_debug(f"[FormatIcon] INPUT: track_type='{track_type}', fmt_mapped='{resolved[0]}', icon='{resolved[1]}'", "trace", "metadata")
+            fmt, icon_path, icon_exists = resolved
             
             # Only reload icon when format actually changes (once per track)
             format_changed = fmt != self.last_track_type
@@ -2169,45 +2447,14 @@ class CassetteHandler:
                 self.last_track_type = fmt
                 self.last_format_icon_surf = None  # Clear cache
                 
-                # Check for icon file
-                file_path = os.path.dirname(__file__)
-                local_icons = {'tidal', 'cd', 'qobuz', 'dab', 'fm', 'radio'}
-                if fmt in local_icons:
-                    icon_path = os.path.join(file_path, 'format-icons', f"{fmt}.svg")
-                else:
-                    icon_path = f"/volumio/http/www3/app/assets-common/format-icons/{fmt}.svg"
-                
-                if not os.path.exists(icon_path):
+                if not icon_exists:
                     # Render text fallback
                     if self.sample_font and fmt:
                         self.last_format_icon_surf = self.sample_font.render(fmt[:4], True, self.type_color)
                 else:
                     try:
-                        img = None
-                        # Prefer cairosvg: rasterizes at exact target dimensions,
-                        # consistent across platforms (Linux/Windows/Mac).
-                        # pg.image.load() uses SDL_image nanosvg which produces
-                        # platform-dependent default raster sizes for the same SVG.
-                        if CAIROSVG_AVAILABLE and PIL_AVAILABLE:
-                            png_bytes = cairosvg.svg2png(url=icon_path, 
-                                                          output_width=self.type_rect.width,
-                                                          output_height=self.type_rect.height)
-                            pil_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
-                            img = pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
-                            img = img.convert_alpha()
-                        elif pg.version.ver.startswith("2"):
-                            # Fallback: Pygame 2 native SVG (platform-dependent size)
-                            img = pg.image.load(icon_path)
-                            w, h = img.get_width(), img.get_height()
-                            sc = min(self.type_rect.width / float(w), self.type_rect.height / float(h))
-                            new_size = (max(1, int(w * sc)), max(1, int(h * sc)))
-                            try:
-                                img = pg.transform.smoothscale(img, new_size)
-                            except Exception:
-                                img = pg.transform.scale(img, new_size)
-                            img = img.convert_alpha()
+                        img = rasterize_format_icon(icon_path, self.type_rect.size, self.type_color)
                         if img:
-                            set_color(img, pg.Color(self.type_color[0], self.type_color[1], self.type_color[2]))
                             self.last_format_icon_surf = img
                     except Exception as e:
                         print(f"[FormatIcon] error: {e}")
@@ -2222,7 +2469,7 @@ class CassetteHandler:
                 dx = self.type_rect.x + (self.type_rect.width - self.last_format_icon_surf.get_width()) // 2
                 dy = self.type_rect.y + (self.type_rect.height - self.last_format_icon_surf.get_height()) // 2
                 self.screen.blit(self.last_format_icon_surf, (dx, dy))
-                dirty_rects.append(self.type_rect.copy())
+                dirty_rects.append(self.type_rect)
         
         # Sample rate
         if self.sample_pos and self.sample_box:
@@ -2238,7 +2485,7 @@ class CassetteHandler:
                 # LAYER COMPOSITION: Clear from bgr_surface
                 if self.bgr_surface and self.sample_rect:
                     self.screen.blit(self.bgr_surface, self.sample_rect.topleft, self.sample_rect)
-                    dirty_rects.append(self.sample_rect.copy())
+                    dirty_rects.append(self.sample_rect)
                 
                 self.last_sample_surf = self.sample_font.render(sample_text, True, self.type_color)
                 
@@ -2250,23 +2497,21 @@ class CassetteHandler:
         
         # LAYER 9: Foreground mask
         if self.fgr_surf and dirty_rects:
-            fgr_x, fgr_y = self.fgr_pos
-            if self.fgr_regions:
-                for region in self.fgr_regions:
-                    screen_rect = region.move(fgr_x, fgr_y)
-                    for dirty in dirty_rects:
-                        if screen_rect.colliderect(dirty):
-                            self.screen.blit(self.fgr_surf, screen_rect.topleft, region)
-                            break
+            if self.fgr_screen_regions:
+                # Batch all touched regions into a single blits() call
+                fgr = self.fgr_surf
+                self.screen.blits(
+                    [(fgr, screen_rect.topleft, region)
+                     for screen_rect, region in self.fgr_screen_regions
+                     if screen_rect.collidelist(dirty_rects) != -1],
+                    doreturn=False)
             else:
                 self.screen.blit(self.fgr_surf, self.fgr_pos)
         
-        # Performance: meter timing delay for audio buffer accumulation
-        # Prevents render loop from spinning too fast when reels animate
-        if self.meter_delay_sec > 0:
-            time_module.sleep(self.meter_delay_sec)
-        
-        return dirty_rects
+        # Merge overlapping dirty rects for the display update only; the
+        # foreground pass above tests the exact rects, since a union also
+        # covers area that was never cleared
+        return coalesce_rects(dirty_rects)
     
     def cleanup(self):
         """Release resources on shutdown."""
@@ -2281,6 +2526,7 @@ class CassetteHandler:
         self.next_title_scroller = None
         self.next_artist_scroller = None
         self.next_album_scroller = None
+        self._scrollers = []
         self.bgr_surface = None
         if self.compositor:
             self.compositor.cleanup()
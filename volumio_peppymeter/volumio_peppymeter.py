@@ -32,6 +32,7 @@ from random import choice
 import requests
 import socket
 import struct
+from collections import OrderedDict
 import pygame as pg
 import socketio
 import cProfile
@@ -209,6 +210,34 @@ except ImportError:
 # =============================================================================
 # Foreground Region Detection - OPTIMIZATION for selective blitting
 # =============================================================================
+def _foreground_regions_numpy(surface, min_gap, padding):
+    """Vectorized compute_foreground_regions: one alpha scan instead of get_at per pixel."""
+    w, h = surface.get_size()
+    alpha = pg.surfarray.pixels_alpha(surface)  # (w, h) view, locks surface
+    try:
+        xs = np.flatnonzero(alpha.any(axis=1))
+        if xs.size == 0:
+            return []
+        # Split opaque columns into regions wherever the gap exceeds min_gap
+        breaks = np.flatnonzero(np.diff(xs) > min_gap)
+        starts = np.concatenate((xs[:1], xs[breaks + 1])).tolist()
+        ends = np.concatenate((xs[breaks], xs[-1:])).tolist()
+        regions = []
+        for region_start, region_end in zip(starts, ends):
+            ys = np.flatnonzero(alpha[region_start:region_end + 1].any(axis=0))
+            min_y = int(ys[0])
+            max_y = int(ys[-1])
+            regions.append(pg.Rect(
+                max(0, region_start - padding),
+                max(0, min_y - padding),
+                min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
+                min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
+            ))
+        return regions
+    finally:
+        del alpha  # Release surface lock
+
+
 def compute_foreground_regions(surface, min_gap=50, padding=2):
     """
     Analyze a foreground surface and return list of opaque region rects.
@@ -225,58 +254,56 @@ def compute_foreground_regions(surface, min_gap=50, padding=2):
     if surface is None:
         return []
     
+    if NUMPY_AVAILABLE:
+        try:
+            return _foreground_regions_numpy(surface, min_gap, padding)
+        except Exception:
+            pass  # No per-pixel alpha or surfarray failure - use scan below
+    
     try:
-        # Get surface dimensions
         w, h = surface.get_size()
         
-        # Find columns that have any opaque pixels
-        opaque_columns = {}
+        # Opaque y extent per column as (x, min_y, max_y). Each column is
+        # scanned from both ends and stops at the first opaque pixel.
+        columns = []
         for x in range(w):
+            min_y = -1
             for y in range(h):
-                try:
-                    pixel = surface.get_at((x, y))
-                    if len(pixel) >= 4 and pixel[3] > 0:  # Has alpha and is opaque
-                        if x not in opaque_columns:
-                            opaque_columns[x] = []
-                        opaque_columns[x].append(y)
-                except Exception:
-                    continue
+                if surface.get_at((x, y))[3] > 0:
+                    min_y = y
+                    break
+            if min_y < 0:
+                continue
+            max_y = min_y
+            for y in range(h - 1, min_y, -1):
+                if surface.get_at((x, y))[3] > 0:
+                    max_y = y
+                    break
+            columns.append((x, min_y, max_y))
         
-        if not opaque_columns:
+        if not columns:
             return []
         
-        # Group columns into horizontal regions based on gaps
-        x_sorted = sorted(opaque_columns.keys())
+        # Group columns into horizontal regions based on gaps; the sentinel
+        # column past the right edge closes the final region
         regions = []
-        region_start = x_sorted[0]
-        region_end = x_sorted[0]
-        
-        for i in range(1, len(x_sorted)):
-            if x_sorted[i] - x_sorted[i-1] > min_gap:
-                # Gap detected - save current region
-                min_y = min(min(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-                max_y = max(max(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
+        region_start, min_y, max_y = columns[0]
+        region_end = region_start
+        for x, col_min, col_max in columns[1:] + [(w + min_gap + 1, 0, 0)]:
+            if x - region_end > min_gap:
                 regions.append(pg.Rect(
                     max(0, region_start - padding),
                     max(0, min_y - padding),
                     min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
                     min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
                 ))
-                region_start = x_sorted[i]
-            region_end = x_sorted[i]
-        
-        # Save final region
-        min_y = min(min(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-        max_y = max(max(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-        regions.append(pg.Rect(
-            max(0, region_start - padding),
-            max(0, min_y - padding),
-            min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
-            min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
-        ))
+                region_start, min_y, max_y = x, col_min, col_max
+            else:
+                min_y = min(min_y, col_min)
+                max_y = max(max_y, col_max)
+            region_end = x
         
         return regions
-        
     except Exception as e:
         # Fallback: return empty list, full blit will be used
         return []
@@ -308,6 +335,13 @@ try:
 except Exception:
     CAIROSVG_AVAILABLE = False
 
+# Optional numpy for vectorized surface analysis
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
 try:
     from PIL import Image, ImageOps, ImageDraw
     PIL_AVAILABLE = True
@@ -818,7 +852,6 @@ class MetadataWatcher:
             self.metadata["repeatSingle"] = data.get("repeatSingle", False) or False
             
             # Update time tracking
-            import time
             service = data.get("service", "")
             
             # Store duration and seek for progress calculation (tonearm, etc)
@@ -925,7 +958,6 @@ class MetadataWatcher:
                     self.sio.sleep(0.5)
             except Exception as e:
                 print(f"MetadataWatcher connect error: {e}")
-                import time
                 time.sleep(1)  # Retry delay
             finally:
                 if self.sio.connected:
@@ -3852,40 +3884,79 @@ def as_float(val, default=0.0):
 
 def set_color(surface, color):
     """Colorize a surface with given color (preserving alpha). Modifies surface in place."""
-    # Check if numpy is available (required for surfarray)
-    numpy_available = False
+    # Force RGB to white, then multiply by the target color. Both fills run
+    # in pygame's C blitter (no surface lock, no tint allocation) and keep
+    # per-pixel alpha unchanged since the alpha operands are 0 (max) and 255 (mult).
+    r, g, b = color.r, color.g, color.b
     try:
-        import numpy
-        numpy_available = True
-    except ImportError:
-        pass
+        surface.fill((255, 255, 255, 0), special_flags=pg.BLEND_RGBA_MAX)
+        surface.fill((r, g, b, 255), special_flags=pg.BLEND_RGBA_MULT)
+    except Exception as e:
+        print(f"[set_color] Failed: {e}")
+
+
+def coalesce_rects(rects):
+    """Merge overlapping dirty rects into their unions.
     
-    if numpy_available:
+    A merged rect is re-checked against the ones already kept, so the
+    result never contains two overlapping rects.
+    """
+    merged = []
+    for r in sorted((pg.Rect(r) for r in rects if r), key=lambda r: (r.y, r.x)):
+        i = r.collidelist(merged)
+        while i != -1:
+            r.union_ip(merged.pop(i))
+            i = r.collidelist(merged)
+        merged.append(r)
+    return merged
+
+_FORMAT_ICON_CACHE = OrderedDict()
+_FORMAT_ICON_CACHE_MAX = 16
+
+
+def rasterize_format_icon(icon_path, size, color):
+    """Rasterize a format icon SVG to fit size and tint it with color.
+    
+    Results are cached by (icon_path, size, color), so formats that recur
+    across tracks (flac, dsd, radio...) skip the SVG decode, scale and
+    set_color pass. Returns None when no SVG backend is available.
+    Returned surfaces are shared and must not be modified.
+    """
+    key = (icon_path, tuple(size), tuple(color[:3]))
+    img = _FORMAT_ICON_CACHE.get(key)
+    if img is not None:
+        _FORMAT_ICON_CACHE.move_to_end(key)
+        return img
+    width, height = key[1]
+    # Prefer cairosvg: rasterizes at exact target dimensions,
+    # consistent across platforms (Linux/Windows/Mac).
+    # pg.image.load() uses SDL_image nanosvg which produces
+    # platform-dependent default raster sizes for the same SVG.
+    if CAIROSVG_AVAILABLE and PIL_AVAILABLE:
+        png_bytes = cairosvg.svg2png(url=icon_path,
+                                     output_width=width,
+                                     output_height=height)
+        pil_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+        img = pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
+        img = img.convert_alpha()
+    elif pg.version.ver.startswith("2"):
+        # Fallback: Pygame 2 native SVG (platform-dependent size)
+        img = pg.image.load(icon_path)
+        w, h = img.get_width(), img.get_height()
+        sc = min(width / float(w), height / float(h))
+        new_size = (max(1, int(w * sc)), max(1, int(h * sc)))
         try:
-            r, g, b = color.r, color.g, color.b
-            # Get pixel array for direct manipulation (requires numpy)
-            arr = pg.surfarray.pixels3d(surface)
-            alpha = pg.surfarray.pixels_alpha(surface)
-            # Replace all non-transparent pixel colors with target color
-            mask = alpha > 0
-            arr[mask] = [r, g, b]
-            del arr
-            del alpha
-            return
+            img = pg.transform.smoothscale(img, new_size)
         except Exception:
-            pass
-    
-    # Fallback: pixel-by-pixel (slow but works without numpy)
-    try:
-        r, g, b = color.r, color.g, color.b
-        w, h = surface.get_size()
-        for x in range(w):
-            for y in range(h):
-                px = surface.get_at((x, y))
-                if px.a > 0:
-                    surface.set_at((x, y), (r, g, b, px.a))
-    except Exception:
-        pass
+            img = pg.transform.scale(img, new_size)
+        img = img.convert_alpha()
+    else:
+        return None
+    set_color(img, pg.Color(key[2][0], key[2][1], key[2][2]))
+    _FORMAT_ICON_CACHE[key] = img
+    if len(_FORMAT_ICON_CACHE) > _FORMAT_ICON_CACHE_MAX:
+        _FORMAT_ICON_CACHE.popitem(last=False)
+    return img
 
 
 def get_memory():
@@ -4544,31 +4615,8 @@ def start_display_output(pm, callback, meter_config_volumio, volumio_host='local
             return type_rect.copy()
         
         try:
-            img = None
-            # Prefer cairosvg: rasterizes at exact target dimensions,
-            # consistent across platforms (Linux/Windows/Mac).
-            # pg.image.load() uses SDL_image nanosvg which produces
-            # platform-dependent default raster sizes for the same SVG.
-            if CAIROSVG_AVAILABLE and PIL_AVAILABLE:
-                png_bytes = cairosvg.svg2png(url=icon_path, 
-                                              output_width=type_rect.width,
-                                              output_height=type_rect.height)
-                pil_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
-                img = pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
-                img = img.convert_alpha()
-            elif pg.version.ver.startswith("2"):
-                # Fallback: Pygame 2 native SVG (platform-dependent size)
-                img = pg.image.load(icon_path)
-                w, h = img.get_width(), img.get_height()
-                sc = min(type_rect.width / float(w), type_rect.height / float(h))
-                new_size = (max(1, int(w * sc)), max(1, int(h * sc)))
-                try:
-                    img = pg.transform.smoothscale(img, new_size)
-                except Exception:
-                    img = pg.transform.scale(img, new_size)
-                img = img.convert_alpha()
+            img = rasterize_format_icon(icon_path, type_rect.size, type_color)
             if img:
-                set_color(img, pg.Color(type_color[0], type_color[1], type_color[2]))
                 dx = type_rect.x + (type_rect.width - img.get_width()) // 2
                 dy = type_rect.y + (type_rect.height - img.get_height()) // 2
                 screen.blit(img, (dx, dy))
@@ -4602,6 +4650,27 @@ def start_display_output(pm, callback, meter_config_volumio, volumio_host='local
         _append_rects(extra_rects)
         return merged
     
+    # Past this many rects or this much dirty area, one full-screen update is
+    # cheaper than SDL walking the rect list
+    full_update_rect_count = 40
+    full_update_area = int(SCREEN_WIDTH * SCREEN_HEIGHT * 0.6)
+    
+    def _update_display(rects):
+        """Present dirty rects, or the whole screen when that is cheaper."""
+        if not rects or len(rects) > full_update_rect_count:
+            pg.display.update()
+            return
+        try:
+            # Overlapping rects (e.g. vinyl, art and tonearm backings) would
+            # be counted twice, so measure the merged regions instead
+            area = sum(r.width * r.height for r in coalesce_rects(rects))
+        except (TypeError, ValueError):
+            area = 0  # non-Rect entries: let SDL take the list as given
+        if area > full_update_area:
+            pg.display.update()
+        else:
+            pg.display.update(rects)
+    
     clock = Clock()
     pm.meter.start()
     
@@ -4729,10 +4798,7 @@ def start_display_output(pm, callback, meter_config_volumio, volumio_host='local
             spectrum_rects = callback.peppy_meter_update()
             meter_rects = _merge_dirty_rects(meter_rects, spectrum_rects)
             # OPTIMIZATION: Use dirty rectangle update
-            if meter_rects:
-                pg.display.update(meter_rects)
-            else:
-                pg.display.update()
+            _update_display(meter_rects)
         else:
             # Check for handler delegation
             handler = ov.get("handler")
@@ -4780,10 +4846,7 @@ def start_display_output(pm, callback, meter_config_volumio, volumio_host='local
                 dirty_rects = _merge_dirty_rects(dirty_rects, spectrum_rects)
                 
                 # Display update
-                if dirty_rects:
-                    pg.display.update(dirty_rects)
-                else:
-                    pg.display.update()
+                _update_display(dirty_rects)
                 
                 # Handle events
                 for event in pg.event.get():
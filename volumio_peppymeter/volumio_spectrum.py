@@ -26,6 +26,8 @@ DEBUG_LOG_FILE = '/tmp/peppy_debug.log'
 _DEBUG_LEVEL = "off"
 _DEBUG_TRACE = {}
 
+_LEVEL_ORDER = {"off": 0, "basic": 1, "verbose": 2, "trace": 3}
+
 def init_spectrum_debug(level, trace_dict):
     """Initialize debug settings from main module.
     
@@ -46,9 +48,8 @@ def _log_debug(msg, level="basic", component=None):
     if _DEBUG_LEVEL == "off":
         return
     
-    level_order = {"off": 0, "basic": 1, "verbose": 2, "trace": 3}
-    current_level = level_order.get(_DEBUG_LEVEL, 0)
-    required_level = level_order.get(level, 1)
+    current_level = _LEVEL_ORDER.get(_DEBUG_LEVEL, 0)
+    required_level = _LEVEL_ORDER.get(level, 1)
     
     if current_level < required_level:
         return
@@ -144,20 +145,29 @@ class SpectrumOutput(Thread):
             except Exception as e:
                 _log_debug(f"[Spectrum] failed to update config.txt spectrum key: {e}", "verbose")
 
-        os.chdir(self.SpectrumPath) # to find the config file
-        self.sp = None
-        self.sp = Spectrum(self.util, standalone=False)
-        # overwrite from folder calculated spectrum dimensions
-        self.sp.config[SCREEN_WIDTH] = self.w
-        self.sp.config[SCREEN_HEIGHT] = self.h
-        # set current spectrum and re-read config
-        self.sp.config[AVAILABLE_SPECTRUM_NAMES] = [self.s]
-        self.sp.spectrum_configs = self.sp.config_parser.get_spectrum_configs()
-        self.sp.init_spectrums()
-        # start spectrum without UI refresh loop
-        # self.sp.callback_start = lambda x: x # <-- dummy function to prevent update_ui on start
-        self.sp.callback_start = self.VolumeFadeIn
-        self.sp.start()
+        # The upstream spectrum config parsers resolve config.txt from the
+        # working directory, so chdir only for the duration of the spectrum
+        # setup and restore the previous cwd afterwards. The cwd is process
+        # global; leaving it pointed at the spectrum folder would leak into
+        # every other thread doing relative file I/O.
+        prev_cwd = os.getcwd()
+        os.chdir(self.SpectrumPath)
+        try:
+            self.sp = None
+            self.sp = Spectrum(self.util, standalone=False)
+            # overwrite from folder calculated spectrum dimensions
+            self.sp.config[SCREEN_WIDTH] = self.w
+            self.sp.config[SCREEN_HEIGHT] = self.h
+            # set current spectrum and re-read config
+            self.sp.config[AVAILABLE_SPECTRUM_NAMES] = [self.s]
+            self.sp.spectrum_configs = self.sp.config_parser.get_spectrum_configs()
+            self.sp.init_spectrums()
+            # start spectrum without UI refresh loop
+            # self.sp.callback_start = lambda x: x # <-- dummy function to prevent update_ui on start
+            self.sp.callback_start = self.VolumeFadeIn
+            self.sp.start()
+        finally:
+            os.chdir(prev_cwd)
         
         # TRACE: Log run complete
         if _DEBUG_LEVEL == "trace" and _DEBUG_TRACE.get("spectrum", False):
@@ -15,9 +15,14 @@
 # This module is intentionally self-contained with duplicated components
 # to eliminate dead code paths and reduce CPU overhead.
 
+import atexit
+import hashlib
 import json
 import os
+import queue
+import re
 import tempfile
+import threading
 import io
 import math
 import time
@@ -25,12 +30,26 @@ import urllib.request
 import urllib.error
 import requests
 import pygame as pg
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    from PIL import Image, ImageOps, ImageDraw
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# PIL is imported lazily on first album art / icon load: the module is imported
+# for every skin and PIL start-up is noticeable on a Pi. None = not tried yet.
+Image = ImageOps = ImageDraw = None
+PIL_AVAILABLE = None
+
+
+def _ensure_pil():
+    """Import PIL on first use; return True if it is available."""
+    global PIL_AVAILABLE, Image, ImageOps, ImageDraw
+    if PIL_AVAILABLE is None:
+        try:
+            from PIL import Image as _Image, ImageOps as _ImageOps, ImageDraw as _ImageDraw
+            Image, ImageOps, ImageDraw = _Image, _ImageOps, _ImageDraw
+            PIL_AVAILABLE = True
+        except ImportError:
+            PIL_AVAILABLE = False
+    return PIL_AVAILABLE
 
 try:
     import cairosvg
@@ -38,6 +57,33 @@ try:
 except ImportError:
     CAIROSVG_AVAILABLE = False
 
+# Optional numpy for vectorized surface analysis
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional OpenCV for the per-frame rotation fallback (no precomputed frames).
+# Imported lazily like PIL - it is large and most setups never need it.
+cv2 = None
+CV2_AVAILABLE = None
+
+
+def _ensure_cv2():
+    """Import OpenCV on first use; return True if it (and numpy) is available."""
+    global CV2_AVAILABLE, cv2
+    if CV2_AVAILABLE is None:
+        CV2_AVAILABLE = False
+        if NUMPY_AVAILABLE:
+            try:
+                import cv2 as _cv2
+                cv2 = _cv2
+                CV2_AVAILABLE = True
+            except ImportError:
+                pass
+    return CV2_AVAILABLE
+
 # =============================================================================
 # Configuration Constants (turntable-specific subset)
 # =============================================================================
@@ -149,6 +195,114 @@ DEBUG_LOG_FILE = '/tmp/peppy_debug.log'
 # Default to off until config is loaded
 DEBUG_LEVEL_CURRENT = "off"
 
+# Trace lines (per-frame, high volume) are queued by log_debug as
+# (time_ns, msg) and formatted and written in batches by a daemon thread, so
+# the render loop never blocks on file I/O or timestamp formatting. They are
+# dropped if the queue is full, and carry the time they were logged even
+# though they may reach the file after lines other modules append directly.
+# basic/verbose lines are written synchronously so they stay in order with
+# the rest of the shared log. If the writer cannot open the file, trace
+# lines fall back to synchronous writes too.
+_LOG_QUEUE = queue.Queue(maxsize=4096)
+_LOG_BATCH_MAX = 64
+_LOG_FLUSH_INTERVAL = 0.25  # seconds
+_LOG_STOP = object()
+_log_thread = None
+_log_thread_lock = threading.Lock()
+_log_async_failed = False
+
+
+def _write_log_sync(msg):
+    """Append one timestamped line to DEBUG_LOG_FILE."""
+    try:
+        now = time.time()
+        ts = time.strftime('%H:%M:%S', time.localtime(now))
+        with open(DEBUG_LOG_FILE, 'a') as f:
+            f.write(f"[{ts}.{int(now * 1000) % 1000:03d}] {msg}\n")
+    except Exception:
+        pass
+
+
+def _log_writer():
+    """Drain _LOG_QUEUE to DEBUG_LOG_FILE, flushing at most every _LOG_FLUSH_INTERVAL."""
+    global _log_async_failed
+    try:
+        f = open(DEBUG_LOG_FILE, 'a')
+    except Exception:
+        # Route later lines through _write_log_sync instead of filling a
+        # queue nobody drains
+        _log_async_failed = True
+        return
+    with f:
+        pending = False
+        last_flush = time.monotonic()
+        # HH:MM:SS prefix is formatted once per wall-clock second
+        last_sec = -1
+        sec_str = ""
+        while True:
+            try:
+                item = _LOG_QUEUE.get(timeout=_LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                if pending:
+                    f.flush()
+                    pending = False
+                    last_flush = time.monotonic()
+                continue
+            items = []
+            stop = item is _LOG_STOP
+            if not stop:
+                items.append(item)
+                try:
+                    while len(items) < _LOG_BATCH_MAX:
+                        item = _LOG_QUEUE.get_nowait()
+                        if item is _LOG_STOP:
+                            stop = True
+                            break
+                        items.append(item)
+                except queue.Empty:
+                    pass
+            try:
+                if items:
+                    batch = []
+                    for ts_ns, msg in items:
+                        sec = ts_ns // 1_000_000_000
+                        if sec != last_sec:
+                            last_sec = sec
+                            sec_str = time.strftime('%H:%M:%S', time.localtime(sec))
+                        batch.append(f"[{sec_str}.{(ts_ns // 1_000_000) % 1000:03d}] {msg}\n")
+                    f.write("".join(batch))
+                    pending = True
+                now = time.monotonic()
+                if pending and (stop or now - last_flush >= _LOG_FLUSH_INTERVAL):
+                    f.flush()
+                    pending = False
+                    last_flush = now
+            except Exception:
+                pass
+            if stop:
+                return
+
+
+def _start_log_writer():
+    """Start the log writer thread on first use."""
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is None:
+            _log_thread = threading.Thread(target=_log_writer, name="turntable-log", daemon=True)
+            _log_thread.start()
+            atexit.register(_stop_log_writer)
+
+
+def _stop_log_writer():
+    """Drain queued lines and stop the writer (registered with atexit)."""
+    if _log_thread is None:
+        return
+    try:
+        _LOG_QUEUE.put(_LOG_STOP, timeout=0.5)
+    except queue.Full:
+        return
+    _log_thread.join(timeout=1.0)
+
 # =============================================================================
 # Remote vinyl fetch (peppy_remote)
 # =============================================================================
@@ -209,6 +363,33 @@ DEBUG_TRACE = {
 }
 
 
+# Precomputed trace guards for hot call sites: one global bool test instead of
+# a level compare plus dict lookup per frame. Refreshed by _refresh_trace_flags().
+_TRACE_ALBUMART = False
+_TRACE_INIT = False
+_TRACE_METADATA = False
+_TRACE_SCROLLING = False
+_TRACE_SEEK = False
+_TRACE_TIME = False
+_TRACE_TONEARM = False
+_TRACE_VINYL = False
+
+
+def _refresh_trace_flags():
+    """Recompute the _TRACE_* guards from DEBUG_LEVEL_CURRENT and DEBUG_TRACE."""
+    global _TRACE_ALBUMART, _TRACE_INIT, _TRACE_METADATA, _TRACE_SCROLLING, _TRACE_SEEK, _TRACE_TIME
+    global _TRACE_TONEARM, _TRACE_VINYL
+    trace = DEBUG_LEVEL_CURRENT == "trace"
+    _TRACE_ALBUMART = trace and DEBUG_TRACE.get("albumart", False)
+    _TRACE_INIT = trace and DEBUG_TRACE.get("init", False)
+    _TRACE_METADATA = trace and DEBUG_TRACE.get("metadata", False)
+    _TRACE_SCROLLING = trace and DEBUG_TRACE.get("scrolling", False)
+    _TRACE_SEEK = trace and DEBUG_TRACE.get("seek", False)
+    _TRACE_TIME = trace and DEBUG_TRACE.get("time", False)
+    _TRACE_TONEARM = trace and DEBUG_TRACE.get("tonearm", False)
+    _TRACE_VINYL = trace and DEBUG_TRACE.get("vinyl", False)
+
+
 def init_turntable_debug(level, trace_dict):
     """Initialize debug settings from main module."""
     global DEBUG_LEVEL_CURRENT, DEBUG_TRACE
@@ -216,6 +397,7 @@ def init_turntable_debug(level, trace_dict):
     # Copy all values from main module's trace dict
     for key, value in trace_dict.items():
         DEBUG_TRACE[key] = value
+    _refresh_trace_flags()
 
 
 def log_debug(msg, level="basic", component=None):
@@ -249,32 +431,46 @@ def log_debug(msg, level="basic", component=None):
         if component and not DEBUG_TRACE.get(component, False):
             return
     
+    if level != "trace" or _log_async_failed:
+        _write_log_sync(msg)
+        return
+    if _log_thread is None:
+        _start_log_writer()
     try:
-        import datetime
-        ts = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        with open(DEBUG_LOG_FILE, 'a') as f:
-            f.write(f"[{ts}] {msg}\n")
+        _LOG_QUEUE.put_nowait((time.time_ns(), msg))
     except Exception:
-        pass
+        pass  # queue.Full: drop rather than stall the render loop
 
 
 # =============================================================================
 # Helper Functions (self-contained)
 # =============================================================================
+def _clamp_channel(v):
+    """Clamp a color channel to 0-255."""
+    return max(0, min(255, int(v)))
+
+
 def sanitize_color(val, default=(255, 255, 255)):
     """Convert various color formats to RGB tuple, clamped to 0-255."""
-    def clamp(v):
-        return max(0, min(255, int(v)))
-    
     try:
+        # Tuples are by far the common input; test the exact type first
+        if type(val) is tuple:
+            if len(val) >= 3:
+                r, g, b = val[0], val[1], val[2]
+                # Already-valid int channels are returned without clamping
+                if (type(r) is int and type(g) is int and type(b) is int
+                        and 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+                    return (r, g, b)
+                return (_clamp_channel(r), _clamp_channel(g), _clamp_channel(b))
+            return default
         if isinstance(val, pg.Color):
-            return (clamp(val.r), clamp(val.g), clamp(val.b))
+            return (_clamp_channel(val.r), _clamp_channel(val.g), _clamp_channel(val.b))
         if isinstance(val, (tuple, list)) and len(val) >= 3:
-            return (clamp(val[0]), clamp(val[1]), clamp(val[2]))
+            return (_clamp_channel(val[0]), _clamp_channel(val[1]), _clamp_channel(val[2]))
         if isinstance(val, str):
             parts = [p.strip() for p in val.split(",")]
             if len(parts) >= 3:
-                return (clamp(parts[0]), clamp(parts[1]), clamp(parts[2]))
+                return (_clamp_channel(parts[0]), _clamp_channel(parts[1]), _clamp_channel(parts[2]))
     except Exception:
         pass
     return default
@@ -282,64 +478,86 @@ def sanitize_color(val, default=(255, 255, 255)):
 
 def as_int(val, default=0):
     """Safely convert value to integer."""
+    t = type(val)
+    if t is int:
+        return val
     if val is None:
         return default
     try:
-        if isinstance(val, (int, float)):
+        if t is float:
             return int(val)
-        if isinstance(val, str):
+        if t is str:
             val = val.strip()
             if not val:
                 return default
-            return int(float(val))
+            try:
+                return int(val)
+            except ValueError:
+                return int(float(val))
         return int(val)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return default
 
 
 def as_float(val, default=0.0):
     """Safely convert value to float."""
+    t = type(val)
+    if t is float:
+        return val
     if val is None:
         return default
     try:
         return float(val)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return default
 
 
+def _parse_bool(val):
+    """Parse a config flag: strings '1'/'true'/'yes' (any case), else truthiness."""
+    if isinstance(val, str):
+        return val.strip().lower() in ('1', 'true', 'yes')
+    return bool(val)
+
+
 def set_color(surface, color):
     """Recolor a surface to the specified color while preserving alpha.
     
     Used for format icons which are white SVGs that need to match skin color.
-    Attempts fast numpy method first, falls back to per-pixel if needed.
+    Recolors with two blend fills so it works without numpy.
     
     :param surface: pygame.Surface with per-pixel alpha
     :param color: pygame.Color or RGB tuple
     """
+    # Force RGB to white, then multiply by the target color. Both fills run
+    # in pygame's C blitter (no surface lock, no tint allocation) and keep
+    # per-pixel alpha unchanged since the alpha operands are 0 (max) and 255 (mult).
+    r, g, b = color.r, color.g, color.b
     try:
-        # Try numpy-accelerated method first (much faster)
-        import numpy as np
-        arr = pg.surfarray.pixels3d(surface)
-        arr[:, :, 0] = color.r
-        arr[:, :, 1] = color.g
-        arr[:, :, 2] = color.b
-        del arr  # Release surface lock
-        return
-    except Exception:
-        pass
-    
-    # Fallback to per-pixel method (slower but always works)
-    try:
-        width, height = surface.get_size()
-        for x in range(width):
-            for y in range(height):
-                pixel = surface.get_at((x, y))
-                if len(pixel) >= 4 and pixel[3] > 0:  # Has alpha and is visible
-                    surface.set_at((x, y), (color.r, color.g, color.b, pixel[3]))
+        surface.fill((255, 255, 255, 0), special_flags=pg.BLEND_RGBA_MAX)
+        surface.fill((r, g, b, 255), special_flags=pg.BLEND_RGBA_MULT)
     except Exception as e:
         print(f"[set_color] Failed: {e}")
 
 
+# Playback status codes - resolved once per frame by the handler so the
+# per-renderer angle/state updates compare ints instead of lowercasing strings
+STATUS_STOP = 0
+STATUS_PLAY = 1
+STATUS_PAUSE = 2
+STATUS_UNKNOWN = 3
+
+STATUS_MAP = {
+    "stop": STATUS_STOP,
+    "play": STATUS_PLAY,
+    "pause": STATUS_PAUSE,
+}
+
+
+def resolve_status(status):
+    """Map a Volumio status string to a STATUS_* code."""
+    return STATUS_MAP.get((status or "").lower(), STATUS_UNKNOWN)
+
+
 # Rotation quality presets (FPS, step_degrees)
 ROTATION_PRESETS = {
     "low":    (4, 12),
@@ -349,6 +567,133 @@ ROTATION_PRESETS = {
 
 USE_PRECOMPUTED_FRAMES = True
 
+# Smooth rotation: cap per-update elapsed time so a stalled frame doesn't jump the disc
+MAX_ROTATION_DT_MS = 500
+
+# Vinyl/art angles are integer millidegrees; frame index is angle // step
+ANGLE_MILLI_FULL = 360000
+
+# Quadratic ease-out for vinyl deceleration, indexed by progress * DECEL_LUT_STEPS
+DECEL_LUT_STEPS = 255
+DECEL_EASE_LUT = tuple(1.0 - (i / DECEL_LUT_STEPS) ** 2 for i in range(DECEL_LUT_STEPS + 1))
+
+# Common trackType variants normalized to format icon names
+FORMAT_ICON_ALIASES = {
+    'dab_radio': 'dab',
+    'dab_': 'dab',
+    'dab': 'dab',
+    'rtlsdr': 'dab',
+    'rtlsdr_radio': 'dab',
+    'fm_radio': 'fm',
+    'fm_': 'fm',
+    'fm': 'fm',
+    'webradio': 'radio',
+    'web_radio': 'radio',
+    'internet_radio': 'radio',
+    'tidal_connect': 'tidal',
+    'qobuz_connect': 'qobuz',
+    'spotify': 'spotify',
+    'spotify_connect': 'spotify',
+    'airplay': 'airplay',
+    'bluetooth': 'bluetooth',
+    'upnp': 'upnp',
+    'dlna': 'upnp',
+}
+LOCAL_FORMAT_ICONS = {'tidal', 'cd', 'qobuz', 'dab', 'fm', 'radio'}
+# Signal strength indicators and other suffixes after the format name
+# ("dab_●◦◦◦◦" -> "dab")
+FORMAT_SUFFIX_RE = re.compile(r'[^a-z0-9_].*')
+
+
+def resolve_format_icon(track_type):
+    """Normalize a raw trackType and locate its format icon.
+    
+    Returns (fmt, icon_path, icon_exists). The result only depends on
+    track_type, so handlers cache it per raw string to skip the regex,
+    alias lookup and stat() on redraws.
+    """
+    fmt = (track_type or "").strip().lower().replace(" ", "_")
+    if fmt == "dsf":
+        fmt = "dsd"
+    
+    # Strip signal strength indicators and other suffixes
+    # DAB sends "DAB ●◦◦◦◦" -> "dab_●◦◦◦◦", need just "dab"
+    # FM sends "FM ◦◦◦◦◦" -> "fm_◦◦◦◦◦", need just "fm"
+    fmt_clean = FORMAT_SUFFIX_RE.sub('', fmt)  # Keep only alphanumeric prefix
+    if fmt_clean:
+        fmt = fmt_clean
+    fmt = FORMAT_ICON_ALIASES.get(fmt, fmt)
+    
+    if fmt in LOCAL_FORMAT_ICONS:
+        icon_path = os.path.join(os.path.dirname(__file__), 'format-icons', f"{fmt}.svg")
+    else:
+        icon_path = f"/volumio/http/www3/app/assets-common/format-icons/{fmt}.svg"
+    return fmt, icon_path, os.path.exists(icon_path)
+
+
+def rotate_surface(surf, angle, cv_cache):
+    """Rotate surf like pg.transform.rotate (expanded bounds, CCW degrees).
+    
+    Used when no precomputed frame exists. With OpenCV available the
+    rotation runs through cv2.warpAffine on an RGBA copy of surf that is
+    kept in cv_cache (a dict owned by the caller) until surf changes.
+    
+    The angle is quantized to 1/10 degree and the last result is kept in
+    cv_cache, so a paused or barely moving disc is not re-rotated every
+    frame.
+    """
+    tenths = int(round(angle * 10.0)) % 3600
+    last = cv_cache.get("last")
+    if last is not None and last[0] is surf and last[1] == tenths:
+        return last[2]
+    rot = _rotate_surface(surf, tenths / 10.0, cv_cache)
+    cv_cache["last"] = (surf, tenths, rot)
+    return rot
+
+
+def _rotate_surface(surf, angle, cv_cache):
+    """Uncached body of rotate_surface."""
+    if _ensure_cv2():
+        try:
+            if cv_cache.get("surf") is not surf:
+                w, h = surf.get_size()
+                cv_cache["rgba"] = np.frombuffer(pg.image.tostring(surf, "RGBA"), np.uint8).reshape(h, w, 4)
+                cv_cache["surf"] = surf
+            rgba = cv_cache["rgba"]
+            h, w = rgba.shape[:2]
+            rad = math.radians(angle)
+            cos_a, sin_a = abs(math.cos(rad)), abs(math.sin(rad))
+            out_w = int(math.ceil(w * cos_a + h * sin_a))
+            out_h = int(math.ceil(w * sin_a + h * cos_a))
+            # Rotate about the pixel center so frames line up with pygame's exact 90° turns
+            m = cv2.getRotationMatrix2D(((w - 1) / 2.0, (h - 1) / 2.0), angle, 1.0)
+            m[0, 2] += (out_w - w) / 2.0
+            m[1, 2] += (out_h - h) / 2.0
+            out = cv2.warpAffine(rgba, m, (out_w, out_h), flags=cv2.INTER_LINEAR,
+                                 borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0, 0))
+            return pg.image.frombuffer(out.tobytes(), (out_w, out_h), "RGBA")
+        except Exception:
+            pass
+    try:
+        return pg.transform.rotate(surf, angle)
+    except Exception:
+        return pg.transform.rotate(surf, int(angle))
+
+
+def rotate_frame(surf, angle, cv_cache):
+    """rotate_surface for a frame that will be cached and blitted repeatedly.
+    
+    The OpenCV result wraps a plain RGBA buffer, so it is converted to the
+    display format once here rather than on every blit.
+    """
+    rot = rotate_surface(surf, angle, cv_cache)
+    if CV2_AVAILABLE:
+        try:
+            rot = rot.convert_alpha()
+        except Exception:
+            pass
+    return rot
+
 
 def get_rotation_params(quality, custom_fps=8):
     """Get rotation FPS and step degrees based on quality setting."""
@@ -358,66 +703,260 @@ def get_rotation_params(quality, custom_fps=8):
     return ROTATION_PRESETS.get(quality, ROTATION_PRESETS["medium"])
 
 
+def convert_for_blit(surf):
+    """Convert surf to the display format, dropping per-pixel alpha when no
+    pixel is transparent so blits are plain copies instead of blends."""
+    if surf.get_flags() & pg.SRCALPHA:
+        opaque = False
+        if NUMPY_AVAILABLE:
+            try:
+                alpha = pg.surfarray.pixels_alpha(surf)
+                try:
+                    opaque = int(alpha.min()) == 255
+                finally:
+                    del alpha  # Release surface lock
+            except Exception:
+                pass
+        if not opaque:
+            return surf.convert_alpha()
+    return surf.convert()
+
+_FONT_CACHE = OrderedDict()
+_FONT_CACHE_MAX = 16
+
+# Text widths keyed by (font, text, rendered); fonts are the shared
+# load_font_cached objects, so entries stay valid across meter inits
+_FONT_METRIC_CACHE = OrderedDict()
+_FONT_METRIC_CACHE_MAX = 64
+
+
+def load_font_cached(path, size, bold=False):
+    """Load a font file, falling back to SysFont DejaVuSans when it is missing.
+    
+    Fonts are cached by (path, size, bold), so switching back to a meter
+    skips the file check and the FreeType face load. Returned fonts are
+    shared and must not have their style changed.
+    """
+    key = (path, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is not None:
+        _FONT_CACHE.move_to_end(key)
+        return font
+    if path and os.path.exists(path):
+        font = pg.font.Font(path, size)
+    else:
+        log_debug(f"  Font: SysFont DejaVuSans (fallback, file={path})", "basic")
+        key = (None, size, bold)
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            font = pg.font.SysFont("DejaVuSans", size, bold=bold)
+    _FONT_CACHE[key] = font
+    _FONT_CACHE.move_to_end(key)
+    if len(_FONT_CACHE) > _FONT_CACHE_MAX:
+        _FONT_CACHE.popitem(last=False)
+    return font
+
+
+_FORMAT_ICON_CACHE = OrderedDict()
+_FORMAT_ICON_CACHE_MAX = 16
+
+
+def rasterize_format_icon(icon_path, size, color):
+    """Rasterize a format icon SVG to fit size and tint it with color.
+    
+    Results are cached by (icon_path, size, color), so formats that recur
+    across tracks (flac, dsd, radio...) skip the SVG decode, scale and
+    set_color pass. Returns None when no SVG backend is available.
+    Returned surfaces are shared and must not be modified.
+    """
+    key = (icon_path, tuple(size), tuple(color[:3]))
+    img = _FORMAT_ICON_CACHE.get(key)
+    if img is not None:
+        _FORMAT_ICON_CACHE.move_to_end(key)
+        return img
+    width, height = key[1]
+    # Prefer cairosvg: rasterizes at exact target dimensions,
+    # consistent across platforms (Linux/Windows/Mac).
+    # pg.image.load() uses SDL_image nanosvg which produces
+    # platform-dependent default raster sizes for the same SVG.
+    if CAIROSVG_AVAILABLE and _ensure_pil():
+        png_bytes = cairosvg.svg2png(url=icon_path,
+                                     output_width=width,
+                                     output_height=height)
+        pil_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+        img = pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
+        img = img.convert_alpha()
+    elif pg.version.ver.startswith("2"):
+        # Fallback: Pygame 2 native SVG (platform-dependent size)
+        img = pg.image.load(icon_path)
+        w, h = img.get_width(), img.get_height()
+        sc = min(width / float(w), height / float(h))
+        new_size = (max(1, int(w * sc)), max(1, int(h * sc)))
+        try:
+            img = pg.transform.smoothscale(img, new_size)
+        except Exception:
+            img = pg.transform.scale(img, new_size)
+        img = img.convert_alpha()
+    else:
+        return None
+    set_color(img, pg.Color(key[2][0], key[2][1], key[2][2]))
+    _FORMAT_ICON_CACHE[key] = img
+    if len(_FORMAT_ICON_CACHE) > _FORMAT_ICON_CACHE_MAX:
+        _FORMAT_ICON_CACHE.popitem(last=False)
+    return img
+
+
+def _foreground_regions_numpy(surface, min_gap, padding):
+    """Vectorized compute_foreground_regions: one alpha scan instead of get_at per pixel."""
+    w, h = surface.get_size()
+    alpha = pg.surfarray.pixels_alpha(surface)  # (w, h) view, locks surface
+    try:
+        xs = np.flatnonzero(alpha.any(axis=1))
+        if xs.size == 0:
+            return []
+        # Split opaque columns into regions wherever the gap exceeds min_gap
+        breaks = np.flatnonzero(np.diff(xs) > min_gap)
+        starts = np.concatenate((xs[:1], xs[breaks + 1])).tolist()
+        ends = np.concatenate((xs[breaks], xs[-1:])).tolist()
+        regions = []
+        for region_start, region_end in zip(starts, ends):
+            ys = np.flatnonzero(alpha[region_start:region_end + 1].any(axis=0))
+            min_y = int(ys[0])
+            max_y = int(ys[-1])
+            regions.append(pg.Rect(
+                max(0, region_start - padding),
+                max(0, min_y - padding),
+                min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
+                min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
+            ))
+        return regions
+    finally:
+        del alpha  # Release surface lock
+
+
 def compute_foreground_regions(surface, min_gap=50, padding=2):
     """Analyze foreground surface and return list of opaque region rects."""
     if surface is None:
         return []
     
+    if NUMPY_AVAILABLE:
+        try:
+            return _foreground_regions_numpy(surface, min_gap, padding)
+        except Exception:
+            pass  # No per-pixel alpha or surfarray failure - use scan below
+    
     try:
         w, h = surface.get_size()
-        opaque_columns = {}
+        
+        # Opaque y extent per column as (x, min_y, max_y). Each column is
+        # scanned from both ends and stops at the first opaque pixel.
+        columns = []
         for x in range(w):
+            min_y = -1
             for y in range(h):
-                try:
-                    pixel = surface.get_at((x, y))
-                    if len(pixel) >= 4 and pixel[3] > 0:
-                        if x not in opaque_columns:
-                            opaque_columns[x] = []
-                        opaque_columns[x].append(y)
-                except Exception:
-                    continue
+                if surface.get_at((x, y))[3] > 0:
+                    min_y = y
+                    break
+            if min_y < 0:
+                continue
+            max_y = min_y
+            for y in range(h - 1, min_y, -1):
+                if surface.get_at((x, y))[3] > 0:
+                    max_y = y
+                    break
+            columns.append((x, min_y, max_y))
         
-        if not opaque_columns:
+        if not columns:
             return []
         
-        x_sorted = sorted(opaque_columns.keys())
+        # Group columns into horizontal regions based on gaps; the sentinel
+        # column past the right edge closes the final region
         regions = []
-        region_start = x_sorted[0]
-        region_end = x_sorted[0]
-        
-        for i in range(1, len(x_sorted)):
-            if x_sorted[i] - x_sorted[i-1] > min_gap:
-                min_y = min(min(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-                max_y = max(max(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
+        region_start, min_y, max_y = columns[0]
+        region_end = region_start
+        for x, col_min, col_max in columns[1:] + [(w + min_gap + 1, 0, 0)]:
+            if x - region_end > min_gap:
                 regions.append(pg.Rect(
                     max(0, region_start - padding),
                     max(0, min_y - padding),
                     min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
                     min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
                 ))
-                region_start = x_sorted[i]
-            region_end = x_sorted[i]
-        
-        min_y = min(min(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-        max_y = max(max(opaque_columns[x]) for x in range(region_start, region_end + 1) if x in opaque_columns)
-        regions.append(pg.Rect(
-            max(0, region_start - padding),
-            max(0, min_y - padding),
-            min(w - max(0, region_start - padding), region_end - region_start + 1 + 2 * padding),
-            min(h - max(0, min_y - padding), max_y - min_y + 1 + 2 * padding)
-        ))
+                region_start, min_y, max_y = x, col_min, col_max
+            else:
+                min_y = min(min_y, col_min)
+                max_y = max(max_y, col_max)
+            region_end = x
         
         return regions
     except Exception:
         return []
 
 
+_FGR_REGION_CACHE = OrderedDict()
+_FGR_REGION_CACHE_MAX = 8
+
+
+def compute_foreground_regions_cached(path, surface):
+    """compute_foreground_regions for a skin file, cached by path and mtime.
+    
+    The alpha scan only depends on the file, so switching back to a meter
+    reuses its regions. Returns fresh Rect copies the caller may modify.
+    """
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        return compute_foreground_regions(surface)
+    regions = _FGR_REGION_CACHE.get(key)
+    if regions is None:
+        regions = compute_foreground_regions(surface)
+        _FGR_REGION_CACHE[key] = regions
+        if len(_FGR_REGION_CACHE) > _FGR_REGION_CACHE_MAX:
+            _FGR_REGION_CACHE.popitem(last=False)
+    else:
+        _FGR_REGION_CACHE.move_to_end(key)
+    return [r.copy() for r in regions]
+
+
+def iter_meter_rects(meter_rects):
+    """Yield the dirty rects from a meter.run() result.
+    
+    meter.run() returns a list of rects or (component, rect) tuples, a
+    single such tuple, or a single rect.
+    """
+    if not meter_rects:
+        return
+    if not isinstance(meter_rects, list):
+        meter_rects = (meter_rects,)
+    for item in meter_rects:
+        if isinstance(item, tuple):
+            if len(item) >= 2 and item[1]:
+                yield item[1]
+        elif item and hasattr(item, 'x'):
+            yield item
+
+
+def format_mmss(sec):
+    """Format whole seconds as MM:SS (minutes keep counting past 99)."""
+    return "%02d:%02d" % divmod(sec, 60)
+
+
 # =============================================================================
 # ScrollingLabel - Text animation with self-backing
 # =============================================================================
 class ScrollingLabel:
     """Single-threaded scrolling text label with bidirectional or one-way scroll and self-backing."""
     
+    # Rendered text shared across labels, keyed by (font, text, color).
+    # Surfaces are only ever blitted from, so sharing them is safe.
+    _render_cache = OrderedDict()
+    _RENDER_CACHE_MAX = 64
+    
+    # Opaque backing surfaces released by recaptures, keyed by (w, h) and
+    # reused by the next capture of that size instead of allocating a copy
+    _backing_pool = {}
+    _BACKING_POOL_MAX = 4
+    
     def __init__(self, font, color, pos, box_width, center=False,
                  speed_px_per_sec=40, pause_ms=400, scroll_direction="default",
                  loop_segment_pixels=None):
@@ -435,13 +974,16 @@ class ScrollingLabel:
         self.surf = None
         self.text_w = 0
         self.text_h = 0
+        self._scroll_limit = 0  # max scroll offset, set per text in update_text
         self.offset = 0.0
         self.direction = 1
         self._last_time = pg.time.get_ticks()
         self._pause_until = 0
         self._backing = None
         self._backing_rect = None
+        self._layout_rect = None  # get_rect() fallback before a backing is captured
         self._bgr_surface = None  # Layer composition: use bgr for clearing
+        self._capture_deferred = False  # capture backing on first draw (see defer_backing_capture)
         self._needs_redraw = True
         self._last_draw_offset = -1
         # Pre-compute max line height including descenders (prevents ghost
@@ -453,6 +995,39 @@ class ScrollingLabel:
         """Set background surface for layer composition clearing."""
         self._bgr_surface = bgr_surface
 
+    def _release_backing(self):
+        """Drop the current backing; only opaque surfaces are pooled since
+        a blit into a per-pixel-alpha surface would blend instead of copy."""
+        old = self._backing
+        self._backing = None
+        if old is not None and not (old.get_flags() & pg.SRCALPHA):
+            pool = ScrollingLabel._backing_pool.setdefault(old.get_size(), [])
+            if len(pool) < ScrollingLabel._BACKING_POOL_MAX:
+                pool.append(old)
+
+    @staticmethod
+    def capture_backings(labels, surface):
+        """Capture backings for several labels in one pass.
+
+        All previous backings are released to the pool first so same-sized
+        labels (e.g. next title/artist/album) reuse each other's surfaces
+        instead of allocating new copies.
+        """
+        for label in labels:
+            label._release_backing()
+        for label in labels:
+            label.capture_backing(surface)
+
+    def defer_backing_capture(self):
+        """Capture the backing on the first draw that has text instead of now.
+        
+        Only deferred when a background surface is set, since that never
+        changes; labels that never get text (e.g. an unused next-track field)
+        never copy a backing at all.
+        """
+        self._release_backing()
+        self._capture_deferred = self._bgr_surface is not None
+
     def capture_backing(self, surface):
         """Capture backing surface for this label's area.
         
@@ -469,27 +1044,41 @@ class ScrollingLabel:
         # Use bgr_surface if available (pure static bg), otherwise use passed surface
         source = self._bgr_surface if self._bgr_surface else surface
         
+        self._release_backing()
+        self._capture_deferred = False
+        
         try:
-            self._backing = source.subsurface(self._backing_rect).copy()
+            # A pooled surface is only fully overwritten when the rect lies
+            # inside the source; otherwise take the subsurface path below
+            pool = ScrollingLabel._backing_pool.get(self._backing_rect.size)
+            if (pool and not (source.get_flags() & pg.SRCALPHA)
+                    and source.get_rect().contains(self._backing_rect)):
+                backing = pool.pop()
+                backing.blit(source, (0, 0), self._backing_rect)
+                self._backing = backing
+            else:
+                self._backing = source.subsurface(self._backing_rect).copy()
         except Exception:
             self._backing = pg.Surface((self._backing_rect.width, self._backing_rect.height))
             self._backing.fill((0, 0, 0))
         
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("scrolling", False):
+        if _TRACE_SCROLLING:
             log_debug(f"[Scrolling] CAPTURE: pos={self.pos}, box_w={self.box_width}, backing_rect={self._backing_rect}", "trace", "scrolling")
 
-    def update_text(self, new_text, segment_pixels=None):
+    def update_text(self, new_text, segment_pixels=None, now_ms=None):
         """Update text content, reset scroll position if changed.
-        segment_pixels: optional; when set (e.g. ticker loop), use for seamless wrap."""
+        segment_pixels: optional; when set (e.g. ticker loop), use for seamless wrap.
+        now_ms: optional frame timestamp from the caller (saves a get_ticks call)."""
         new_text = new_text or ""
         if segment_pixels is not None and segment_pixels > 0:
             self.loop_segment_pixels = int(segment_pixels)
         if new_text == self.text and self.surf is not None:
             return False
         self.text = new_text
-        self.surf = self.font.render(self.text, True, self.color)
+        self.surf = self._render(new_text)
         self.text_w, self.text_h = self.surf.get_size()
         limit = max(0, self.text_w - self.box_width) if self.box_width > 0 else 0
+        self._scroll_limit = limit
         if self.scroll_direction == "rtl":
             self.offset = float(limit)
             self.direction = -1
@@ -497,18 +1086,39 @@ class ScrollingLabel:
             self.offset = 0.0
             self.direction = 1
         self._pause_until = 0
-        self._last_time = pg.time.get_ticks()
+        self._last_time = now_ms if now_ms is not None else pg.time.get_ticks()
         self._needs_redraw = True
         self._last_draw_offset = -1
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("scrolling", False):
+        if _TRACE_SCROLLING:
             log_debug(f"[Scrolling] UPDATE: text='{new_text[:30]}', text_w={self.text_w}, box_w={self.box_width}, scrolls={self.text_w > self.box_width}", "trace", "scrolling")
         return True
 
+    def _render(self, text):
+        """Render text through the shared LRU cache (empty strings bypass it)."""
+        if not text:
+            return self.font.render(text, True, self.color)
+        cache = ScrollingLabel._render_cache
+        key = (self.font, text, tuple(self.color))
+        surf = cache.get(key)
+        if surf is not None:
+            cache.move_to_end(key)
+            return surf
+        surf = self.font.render(text, True, self.color)
+        try:
+            # Match the display pixel format so scroll blits skip conversion
+            surf = surf.convert_alpha()
+        except Exception:
+            pass
+        cache[key] = surf
+        if len(cache) > self._RENDER_CACHE_MAX:
+            cache.popitem(last=False)
+        return surf
+
     def force_redraw(self):
         """Force redraw on next draw() call."""
         self._needs_redraw = True
         self._last_draw_offset = -1
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("scrolling", False):
+        if _TRACE_SCROLLING:
             log_debug(f"[Scrolling] FORCE: text='{self.text[:20]}...', pos={self.pos}", "trace", "scrolling")
 
     def get_rect(self):
@@ -519,14 +1129,15 @@ class ScrollingLabel:
         """
         if self._backing_rect:
             return self._backing_rect
-        if self.pos and self.box_width > 0 and self.font:
-            height = self._font_height
-            return pg.Rect(self.pos[0], self.pos[1], self.box_width, height)
-        return None
+        # Layout is fixed after __init__, so the fallback rect is built once
+        if self._layout_rect is None and self.pos and self.box_width > 0 and self.font:
+            self._layout_rect = pg.Rect(self.pos[0], self.pos[1], self.box_width, self._font_height)
+        return self._layout_rect
 
-    def draw(self, surface):
+    def draw(self, surface, now_ms=None):
         """Draw label, handling scroll animation with self-backing.
         Returns dirty rect if drawn, None if skipped.
+        now_ms: optional frame timestamp shared by all labels in a frame.
         
         OPTIMIZED: Backing is captured from bgr_surface (pure static bg),
         so we just use the small backing for fast clearing without collision.
@@ -534,6 +1145,11 @@ class ScrollingLabel:
         if not self.surf or not self.pos or self.box_width <= 0:
             return None
         
+        if self._capture_deferred:
+            if not self.text:
+                return None  # nothing drawn yet, so nothing to clear
+            self.capture_backing(self._bgr_surface)
+        
         x, y = self.pos
         box_rect = pg.Rect(x, y, self.box_width, self.text_h)
         
@@ -554,17 +1170,21 @@ class ScrollingLabel:
             self._needs_redraw = False
             
             dirty = self._backing_rect.copy() if self._backing_rect else box_rect.copy()
-            if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("scrolling", False):
+            if _TRACE_SCROLLING:
                 log_debug(f"[Scrolling] OUTPUT: static, dirty_rect={dirty}", "trace", "scrolling")
             return dirty
         
         # Scrolling text
-        now = pg.time.get_ticks()
+        now = now_ms if now_ms is not None else pg.time.get_ticks()
+        # Paused at an end with nothing new to show - skip all frame work
+        if now < self._pause_until and not self._needs_redraw and int(self.offset) == self._last_draw_offset:
+            self._last_time = now
+            return None
         dt = (now - self._last_time) / 1000.0
         self._last_time = now
         
         if now >= self._pause_until:
-            limit = max(0, self.text_w - self.box_width)
+            limit = self._scroll_limit
             self.offset += self.direction * self.speed * dt
             
             if self.scroll_direction == "default":
@@ -600,24 +1220,23 @@ class ScrollingLabel:
         if current_offset_int == self._last_draw_offset and not self._needs_redraw:
             return None
         
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("scrolling", False):
+        if _TRACE_SCROLLING:
             log_debug(f"[Scrolling] SCROLL: text='{self.text[:20]}...', offset={current_offset_int}, forced={self._needs_redraw}, backing={self._backing_rect}", "trace", "scrolling")
         
         # OPTIMIZED: Use small backing (captured from bgr_surface = pure static bg)
         if self._backing and self._backing_rect:
             surface.blit(self._backing, self._backing_rect.topleft)
         
-        prev_clip = surface.get_clip()
-        surface.set_clip(box_rect)
-        draw_x = box_rect.x - current_offset_int
-        surface.blit(self.surf, (draw_x, box_rect.y))
-        surface.set_clip(prev_clip)
+        # Blit only the visible window of the text via a source area - no clip
+        # rect push/pop; SDL clips the area to surf and shifts dest as needed
+        surface.blit(self.surf, box_rect.topleft,
+                     pg.Rect(current_offset_int, 0, self.box_width, self.text_h))
         
         self._last_draw_offset = current_offset_int
         self._needs_redraw = False
         
         dirty = self._backing_rect.copy() if self._backing_rect else box_rect.copy()
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("scrolling", False):
+        if _TRACE_SCROLLING:
             log_debug(f"[Scrolling] OUTPUT: dirty_rect={dirty}", "trace", "scrolling")
         return dirty
 
@@ -636,6 +1255,19 @@ class AlbumArtRenderer:
     a real LP with label), halving per-frame blit count.
     """
 
+    # Rotation frame lists keyed by (art content digest, step, size), shared
+    # so returning to recently shown art reuses its frames. Kept small: each
+    # full list holds 360/step rotated copies of the art.
+    _frame_cache = OrderedDict()
+    _MAX_CACHED_ARTS = 2
+
+    # Alpha masks keyed by (size, mask file, circle); they depend only on
+    # skin settings, not on the art, so each is built once
+    _mask_cache = {}
+
+    # Background fetch/decode worker shared by all instances (see load_from_url)
+    _executor = None
+
     def __init__(self, base_path, meter_folder, art_pos, art_dim, screen_size,
                  font_color=(255, 255, 255), border_width=0,
                  mask_filename=None, rotate_enabled=False, rotate_rpm=0.0,
@@ -652,6 +1284,7 @@ class AlbumArtRenderer:
         self.mask_filename = mask_filename
         self.rotate_enabled = bool(rotate_enabled)
         self.rotate_rpm = float(rotate_rpm) * float(speed_multiplier)
+        self._rotate_active = self.rotate_enabled and self.rotate_rpm > 0.0
         self.angle_step_deg = float(angle_step_deg)
         self.spindle_radius = max(1, int(spindle_radius))
         self.ring_radius = ring_radius or max(3, min(art_dim[0], art_dim[1]) // 10)
@@ -668,17 +1301,29 @@ class AlbumArtRenderer:
                            int(art_pos[1] + art_dim[1] // 2)) if (art_pos and art_dim) else None
 
         # Runtime cache
+        # Keep-alive pool for art fetches; images are already compressed, so
+        # ask for them unencoded rather than paying for gzip on both ends
         self._requests = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=1)
+        self._requests.mount("http://", adapter)
+        self._requests.mount("https://", adapter)
+        self._requests.headers.update({"Accept-Encoding": "identity", "Connection": "keep-alive"})
         self._current_url = None
         self._scaled_surf = None
         self._rot_frames = None
-        self._current_angle = 0.0
+        self._cv_cache = {}  # rotate_surface source cache
+        self._future = None  # pending background load (see load_from_url)
+        self._circle_masked = False  # art alpha is the inscribed circle (see _crop_rotated)
+        self._angle_milli = 0  # rotation angle in 1/1000 degree
+        self._step_milli = max(1, self.rotation_step) * 1000
         self._last_blit_tick = 0
         self._blit_interval_ms = int(1000 / max(1, self.rotation_fps))
+        # rpm * 360 deg / 60000 ms = rpm * 6 millidegrees per ms
+        self._milli_per_ms = self.rotate_rpm * 6.0
         self._needs_redraw = True
         self._need_first_blit = False
         # SMOOTH_ROTATION: rollback remove next 2 lines
-        self._smooth_rotation = str(smooth_rotation).strip().lower() in ('1', 'true', 'yes') if isinstance(smooth_rotation, str) else bool(smooth_rotation)
+        self._smooth_rotation = _parse_bool(smooth_rotation)
 
         # Mask path
         self._mask_path = None
@@ -689,27 +1334,92 @@ class AlbumArtRenderer:
         self._backing_rect = None
         self._backing_surf = None
 
+        # Border + LP center markers, drawn once into an art-sized overlay;
+        # keyed by whether the markers are included (see _get_decor)
+        self._decor = {}
+
+    def _has_markers(self):
+        """True when the LP spindle + inner ring markers are drawn."""
+        return bool(self._rotate_active and self.art_center)
+
+    def _get_decor(self, with_markers=True):
+        """Return the cached border/spindle overlay (None when nothing to draw).
+        
+        :param with_markers: False when the markers are already baked into
+                             the composited vinyl, leaving only the border
+        """
+        if with_markers in self._decor:
+            return self._decor[with_markers]
+        self._decor[with_markers] = None
+        markers = with_markers and self._has_markers()
+        if not self.border_width and not markers:
+            return None
+        try:
+            surf = pg.Surface(self.art_dim, pg.SRCALPHA)
+            local_center = (self.art_center[0] - self.art_pos[0], self.art_center[1] - self.art_pos[1]) if self.art_center else None
+            if self.border_width:
+                if self.circle and local_center:
+                    rad = min(self.art_dim[0], self.art_dim[1]) // 2
+                    pg.draw.circle(surf, self.font_color, local_center, rad, self.border_width)
+                else:
+                    pg.draw.rect(surf, self.font_color, surf.get_rect(), self.border_width)
+            if markers:
+                pg.draw.circle(surf, self.font_color, local_center, self.spindle_radius, 0)
+                pg.draw.circle(surf, self.font_color, local_center, self.ring_radius, 1)
+            try:
+                surf = surf.convert_alpha()
+            except Exception:
+                pass
+            self._decor[with_markers] = surf
+        except Exception:
+            pass
+        return self._decor[with_markers]
+
+    @property
+    def _current_angle(self):
+        """Rotation angle in degrees (stored as integer millidegrees)."""
+        return self._angle_milli / 1000.0
+
+    @_current_angle.setter
+    def _current_angle(self, value):
+        self._angle_milli = int(round(value * 1000.0)) % ANGLE_MILLI_FULL
+
     def _apply_mask_with_pil(self, img_bytes):
-        """Load via PIL, apply file mask or circular mask; return pygame surface."""
+        """Load via PIL, apply file mask or circular mask; return (rgba_bytes, size).
+        
+        Runs on the album art worker thread, so it makes no pygame calls.
+        """
         try:
             pil_img = Image.open(img_bytes).convert("RGBA")
             pil_img = pil_img.resize(self.art_dim)
 
-            if self._mask_path and os.path.exists(self._mask_path):
-                mask = Image.open(self._mask_path).convert('L')
-                if mask.size != pil_img.size:
-                    mask = mask.resize(pil_img.size)
-                pil_img.putalpha(ImageOps.invert(mask))
-            elif self.circle:
-                mask = Image.new('L', pil_img.size, 0)
-                draw = ImageDraw.Draw(mask)
-                draw.ellipse((0, 0, pil_img.size[0], pil_img.size[1]), fill=255)
+            mask = self._get_mask(pil_img.size)
+            if mask is not None:
                 pil_img.putalpha(mask)
 
-            return pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
+            return pil_img.tobytes(), pil_img.size
         except Exception:
             return None
 
+    def _get_mask(self, size):
+        """Return the cached 'L' alpha mask for size (file mask or circle), or None."""
+        mask_path = self._mask_path if (self._mask_path and os.path.exists(self._mask_path)) else None
+        key = (tuple(size), mask_path, self.circle)
+        if key in AlbumArtRenderer._mask_cache:
+            return AlbumArtRenderer._mask_cache[key]
+        mask = None
+        if mask_path:
+            mask = Image.open(mask_path).convert('L')
+            if mask.size != tuple(size):
+                mask = mask.resize(size)
+            mask = ImageOps.invert(mask)
+        elif self.circle:
+            mask = Image.new('L', size, 0)
+            draw = ImageDraw.Draw(mask)
+            draw.ellipse((0, 0, size[0], size[1]), fill=255)
+        AlbumArtRenderer._mask_cache[key] = mask
+        return mask
+
     def _load_surface_from_bytes(self, img_bytes):
         """Load pygame surface directly from bytes (no mask)."""
         try:
@@ -722,53 +1432,130 @@ class AlbumArtRenderer:
                 surf = None
         return surf
 
-    def load_from_url(self, url):
-        """Fetch image from URL, build scaled surface, pre-compute rotation frames.
+    @classmethod
+    def _get_executor(cls):
+        """Single shared worker for album art fetch/decode (created on first use)."""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="albumart")
+        return cls._executor
+
+    def load_from_url(self, url, force=False):
+        """Start fetching the image for url in the background.
         
-        COMPOSITE MODE: If coupled to vinyl with rotation enabled, composites
-        art directly onto vinyl surface instead of precomputing separate frames.
+        Download, PIL decode, mask and resize run on the worker thread;
+        check_pending_load() builds the surfaces on the main thread once the
+        result is ready. The previous art is dropped immediately.
+        
+        :param force: reload even if url is already loaded or loading
         """
+        if url and url == self._current_url and not force:
+            if self._scaled_surf is not None:
+                self._need_first_blit = True
+                return
+            if self._future is not None:
+                return  # same url already loading
         self._current_url = url
+        # Previous track's art must not stay baked into the vinyl while
+        # the new one loads
+        if self._is_composited and self.vinyl_renderer:
+            self.vinyl_renderer.clear_composited_art()
+        # Drop a superseded fetch; if it already runs, _fetch_art bails out
+        if self._future is not None:
+            self._future.cancel()
         self._scaled_surf = None
         self._rot_frames = None
-        self._current_angle = 0.0
+        self._angle_milli = 0
         self._needs_redraw = True
         self._need_first_blit = False
         self._is_composited = False
+        self._circle_masked = False
+        self._future = None
 
         if not url:
             return
 
         try:
-            real_url = url if not url.startswith("/") else f"http://localhost:3000{url}"
-            resp = self._requests.get(real_url, timeout=3)
-            if not (resp.ok and "image" in resp.headers.get("Content-Type", "").lower()):
-                return
+            self._future = self._get_executor().submit(self._fetch_art, url)
+        except Exception:
+            self._future = None
 
-            img_bytes = io.BytesIO(resp.content)
+    def _fetch_art(self, url):
+        """Worker: fetch and decode art. Returns ("rgba", bytes, size), ("raw", bytes) or None.
+        
+        Returns None early once url has been superseded by a newer load.
+        """
+        if url != self._current_url:
+            return None
+        try:
+            real_url = url if not url.startswith("/") else f"http://localhost:3000{url}"
+            resp = self._requests.get(real_url, timeout=3, stream=False)
+            try:
+                if not (resp.ok and "image" in resp.headers.get("Content-Type", "").lower()):
+                    return None
+                content = resp.content
+            finally:
+                resp.close()  # hand the connection back to the pool
+            if url != self._current_url:
+                return None  # superseded while downloading; skip the decode
+            if _ensure_pil():
+                decoded = self._apply_mask_with_pil(io.BytesIO(content))
+                if decoded is not None:
+                    return ("rgba",) + decoded
+            return ("raw", content)
+        except Exception:
+            return None
 
-            surf = None
-            if PIL_AVAILABLE:
-                surf = self._apply_mask_with_pil(img_bytes)
+    def check_pending_load(self):
+        """Install a finished background load; return True when new art is ready.
+        
+        COMPOSITE MODE: If coupled to vinyl with rotation enabled, composites
+        art directly onto vinyl surface instead of preparing separate frames.
+        """
+        future = self._future
+        if future is None or not future.done():
+            return False
+        self._future = None
+        try:
+            result = future.result()
+        except Exception:
+            result = None
+        if not result:
+            return False
 
-            if surf is None:
-                surf = self._load_surface_from_bytes(img_bytes)
+        try:
+            if result[0] == "rgba":
+                # Wrap the worker's bytes without copying; convert_alpha below
+                # makes the one copy into display format
+                surf = pg.image.frombuffer(result[1], result[2], "RGBA")
+                self._circle_masked = (self.circle and self.art_dim[0] == self.art_dim[1]
+                                       and not (self._mask_path and os.path.exists(self._mask_path)))
+            else:
+                surf = self._load_surface_from_bytes(io.BytesIO(result[1]))
 
             if surf:
-                try:
-                    scaled = pg.transform.smoothscale(surf, self.art_dim)
-                except Exception:
-                    scaled = pg.transform.scale(surf, self.art_dim)
+                if surf.get_size() == tuple(self.art_dim):
+                    scaled = surf  # PIL path already resized to art_dim
+                else:
+                    try:
+                        scaled = pg.transform.smoothscale(surf, self.art_dim)
+                    except Exception:
+                        scaled = pg.transform.scale(surf, self.art_dim)
                 
                 try:
-                    self._scaled_surf = scaled.convert_alpha()
+                    # Static art is usually opaque - blit it without blending.
+                    # Rotated art keeps alpha for its transparent corners.
+                    if self._rotate_active:
+                        self._scaled_surf = scaled.convert_alpha()
+                    else:
+                        self._scaled_surf = convert_for_blit(scaled)
                 except Exception:
                     self._scaled_surf = scaled
                 
                 # COMPOSITE MODE: If coupled to vinyl and rotation enabled,
                 # composite art onto vinyl surface (like real LP with label)
-                if self.vinyl_renderer and self.rotate_enabled and self.rotate_rpm > 0.0:
-                    if self.vinyl_renderer.composite_album_art(self._scaled_surf, self.art_dim):
+                if self.vinyl_renderer and self._rotate_active:
+                    markers = (self.font_color, self.spindle_radius, self.ring_radius) if self._has_markers() else None
+                    if self.vinyl_renderer.composite_album_art(self._scaled_surf, self.art_dim, markers):
                         self._is_composited = True
                         self._rot_frames = None  # Don't need separate frames
                         log_debug("[AlbumArt] Composited onto vinyl - will skip separate blit", "basic")
@@ -776,73 +1563,138 @@ class AlbumArtRenderer:
                         # Fallback to separate rotation frames
                         self._is_composited = False
                         if USE_PRECOMPUTED_FRAMES and self._scaled_surf:
-                            try:
-                                self._rot_frames = [
-                                    pg.transform.rotate(self._scaled_surf, -a)
-                                    for a in range(0, 360, self.rotation_step)
-                                ]
-                            except Exception:
-                                self._rot_frames = None
+                            self._rot_frames = self._get_frame_slots()
                 else:
                     # Not coupled or not rotating - use separate frames
                     self._is_composited = False
-                    if USE_PRECOMPUTED_FRAMES and self.rotate_enabled and self.rotate_rpm > 0.0 and self._scaled_surf:
-                        try:
-                            self._rot_frames = [
-                                pg.transform.rotate(self._scaled_surf, -a)
-                                for a in range(0, 360, self.rotation_step)
-                            ]
-                        except Exception:
-                            self._rot_frames = None
+                    if USE_PRECOMPUTED_FRAMES and self._rotate_active and self._scaled_surf:
+                        self._rot_frames = self._get_frame_slots()
                 
                 self._need_first_blit = True
+                return True
 
         except Exception:
             pass
+        return False
+
+    def _get_frame_slots(self):
+        """Return the rotation frame list for the current art (shared via _frame_cache).
+        
+        Slots start as None and are rotated on first use by _get_frame, so a
+        track change costs one rotation instead of 360/step.
+        """
+        try:
+            digest = hashlib.blake2b(pg.image.tostring(self._scaled_surf, "RGBA"), digest_size=8).digest()
+        except Exception:
+            return None
+        key = (digest, self.rotation_step, tuple(self.art_dim))
+        cache = AlbumArtRenderer._frame_cache
+        frames = cache.get(key)
+        if frames is not None:
+            cache.move_to_end(key)
+            return frames
+        frames = [None] * len(range(0, 360, self.rotation_step))
+        cache[key] = frames
+        if len(cache) > self._MAX_CACHED_ARTS:
+            cache.popitem(last=False)
+        return frames
+
+    def _get_frame(self, idx):
+        """Return rotation frame idx, rotating and storing it on first use.
+        
+        When the step divides 90, frames past the first quadrant are made by
+        turning the matching first-quadrant frame by a multiple of 90 degrees,
+        which pygame does as an exact pixel transpose instead of resampling.
+        """
+        rot = self._rot_frames[idx]
+        if rot is None:
+            try:
+                per_quadrant = 90 // self.rotation_step if 90 % self.rotation_step == 0 else 0
+                if per_quadrant and idx >= per_quadrant:
+                    quadrant, base_idx = divmod(idx, per_quadrant)
+                    base = self._get_frame(base_idx)
+                    if base is None:
+                        return None
+                    rot = pg.transform.rotate(base, -90 * quadrant)
+                else:
+                    rot = rotate_frame(self._scaled_surf, -idx * self.rotation_step, self._cv_cache)
+            except Exception:
+                return None
+            rot = self._crop_rotated(rot)
+            self._rot_frames[idx] = rot
+        return rot
+
+    def _crop_rotated(self, rot):
+        """Trim a rotated circle-masked frame back to art_dim.
+        
+        The inscribed circle is the same at every angle, so everything the
+        rotation adds outside the art square is transparent and only costs
+        blit time.
+        """
+        if not self._circle_masked:
+            return rot
+        w, h = rot.get_size()
+        dim_w, dim_h = self.art_dim
+        if w <= dim_w and h <= dim_h:
+            return rot
+        try:
+            return rot.subsurface(((w - dim_w) // 2, (h - dim_h) // 2, dim_w, dim_h)).copy()
+        except Exception:
+            return rot
 
     def _update_angle(self, status, now_ticks, volatile=False):
-        """Update rotation angle based on RPM and playback status."""
-        if not self.rotate_enabled or self.rotate_rpm <= 0.0:
+        """Update rotation angle based on RPM and playback status.
+        
+        :param status: STATUS_* code (see resolve_status)
+        """
+        if not self._rotate_active:
             return
 
-        status = (status or "").lower()
-        if volatile and status in ("stop", "pause"):
-            status = "play"
-        if status == "play":
-            # SMOOTH_ROTATION: rollback replace block with: dt = self._blit_interval_ms / 1000.0
-            if getattr(self, '_smooth_rotation', False) and self._last_blit_tick > 0:
-                dt = (now_ticks - self._last_blit_tick) / 1000.0
-                dt = min(max(dt, 0.0), 0.5)
+        if volatile and status in (STATUS_STOP, STATUS_PAUSE):
+            status = STATUS_PLAY
+        if status == STATUS_PLAY:
+            # SMOOTH_ROTATION: rollback replace block with: dt_ms = self._blit_interval_ms
+            if self._smooth_rotation and self._last_blit_tick > 0:
+                dt_ms = now_ticks - self._last_blit_tick
+                if dt_ms > MAX_ROTATION_DT_MS:
+                    dt_ms = MAX_ROTATION_DT_MS
+                elif dt_ms < 0:
+                    dt_ms = 0
             else:
-                dt = self._blit_interval_ms / 1000.0
-            self._current_angle = (self._current_angle + self.rotate_rpm * 6.0 * dt) % 360.0
-            if getattr(self, '_smooth_rotation', False):
+                dt_ms = self._blit_interval_ms
+            self._angle_milli = (self._angle_milli + int(self._milli_per_ms * dt_ms)) % ANGLE_MILLI_FULL
+            if self._smooth_rotation:
                 self._last_blit_tick = now_ticks
 
-    def check_pending_load(self):
-        """Compatibility stub - sync loading has no pending loads."""
-        return False
-
     def will_blit(self, now_ticks):
         """Check if rotation blit is needed (FPS gating)."""
         if self._scaled_surf is None:
             return False
         if self._need_first_blit:
             return True
-        if not self.rotate_enabled or self.rotate_rpm <= 0.0:
+        if not self._rotate_active:
             return self._needs_redraw
         # SMOOTH_ROTATION: rollback remove next 2 lines
-        if getattr(self, '_smooth_rotation', False) and self.rotate_enabled and self.rotate_rpm > 0.0:
+        if self._smooth_rotation:
             return True
 
         return (now_ticks - self._last_blit_tick) >= self._blit_interval_ms
 
     def get_backing_rect(self):
-        """Get backing rect for this renderer, extended for rotation if needed."""
+        """Get backing rect for this renderer, extended for rotation if needed.
+        
+        Depends only on construction-time settings, so it is computed once.
+        """
+        if self._backing_rect is None:
+            self._backing_rect = self._compute_backing_rect()
+        return self._backing_rect
+
+    def _compute_backing_rect(self):
+        """Compute the backing rect (see get_backing_rect)."""
         if not self.art_pos or not self.art_dim:
             return None
         
-        if self.rotate_enabled and self.rotate_rpm > 0.0:
+        if self._rotate_active:
             diag = int(max(self.art_dim[0], self.art_dim[1]) * math.sqrt(2)) + 2
             center_x = self.art_pos[0] + self.art_dim[0] // 2
             center_y = self.art_pos[1] + self.art_dim[1] // 2
@@ -876,99 +1728,77 @@ class AlbumArtRenderer:
         if not self.art_pos or not self.art_dim or not self._scaled_surf:
             return None
 
+        # Nothing visible inside the screen clip - skip rotation and blits
+        backing = self.get_backing_rect()
+        if backing and not backing.colliderect(screen.get_clip()):
+            if advance_angle and not self._smooth_rotation:
+                self._last_blit_tick = now_ticks
+            return None
+
         # COMPOSITE MODE: Art is already baked into vinyl surface
         # Skip blitting art, but still draw decorations (border, spindle)
         if self._is_composited:
             dirty_rect = pg.Rect(self.art_pos[0], self.art_pos[1], self.art_dim[0], self.art_dim[1])
             
-            # Border
-            if self.border_width:
-                try:
-                    if self.circle and self.art_center:
-                        rad = min(self.art_dim[0], self.art_dim[1]) // 2
-                        pg.draw.circle(screen, self.font_color, self.art_center, rad, self.border_width)
-                    else:
-                        pg.draw.rect(screen, self.font_color, pg.Rect(self.art_pos, self.art_dim), self.border_width)
-                except Exception:
-                    pass
-            
-            # LP center markers (spindle + inner ring)
-            if self.rotate_enabled and self.art_center and self.rotate_rpm > 0.0:
-                try:
-                    pg.draw.circle(screen, self.font_color, self.art_center, self.spindle_radius, 0)
-                    pg.draw.circle(screen, self.font_color, self.art_center, self.ring_radius, 1)
-                except Exception:
-                    pass
+            # Border only - LP center markers are baked into the vinyl surface
+            decor = self._get_decor(with_markers=False)
+            if decor:
+                screen.blit(decor, self.art_pos)
             
             return dirty_rect
 
         # NORMAL MODE: Render art separately
-        if advance_angle and not self.will_blit(now_ticks):
+        # (coupled art is gated by the vinyl's will_blit in the handler)
+        if advance_angle and not self.vinyl_renderer and not self.will_blit(now_ticks):
             return None
 
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("albumart", False):
+        if _TRACE_ALBUMART:
             coupled = f"coupled_to_vinyl={self.vinyl_renderer is not None}" if self.rotate_enabled else "static"
             log_debug(f"[AlbumArt] INPUT: status={status}, angle={self._current_angle:.1f}, advance={advance_angle}, {coupled}", "trace", "albumart")
 
         dirty_rect = None
         # Keep timing semantics aligned with VinylRenderer:
         # in smooth mode, _update_angle() owns _last_blit_tick updates.
-        if advance_angle and not getattr(self, '_smooth_rotation', False):
+        if advance_angle and not self._smooth_rotation:
             self._last_blit_tick = now_ticks
 
-        if self.rotate_enabled and self.art_center and self.rotate_rpm > 0.0:
+        if self._rotate_active and self.art_center:
             if advance_angle:
                 # If coupled to vinyl, use vinyl's angle
                 if self.vinyl_renderer:
-                    self._current_angle = self.vinyl_renderer.get_current_angle()
+                    self._angle_milli = self.vinyl_renderer._angle_milli
                 else:
                     self._update_angle(status, now_ticks, volatile=volatile)
             
             # Use pre-computed frame lookup if available
             if self._rot_frames:
-                idx = int(self._current_angle // self.rotation_step) % len(self._rot_frames)
-                rot = self._rot_frames[idx]
+                idx = (self._angle_milli // self._step_milli) % len(self._rot_frames)
+                rot = self._get_frame(idx)
             else:
-                try:
-                    rot = pg.transform.rotate(self._scaled_surf, -self._current_angle)
-                except Exception:
-                    rot = pg.transform.rotate(self._scaled_surf, int(-self._current_angle))
+                rot = self._crop_rotated(rotate_surface(self._scaled_surf, -self._current_angle, self._cv_cache))
             
             if rot:
-                rot_rect = rot.get_rect(center=self.art_center)
-                screen.blit(rot, rot_rect.topleft)
+                art_blit = (rot, rot.get_rect(center=self.art_center).topleft)
                 dirty_rect = self.get_backing_rect()
             else:
-                screen.blit(self._scaled_surf, self.art_pos)
+                art_blit = (self._scaled_surf, self.art_pos)
                 dirty_rect = pg.Rect(self.art_pos[0], self.art_pos[1], self.art_dim[0], self.art_dim[1])
         else:
-            screen.blit(self._scaled_surf, self.art_pos)
+            art_blit = (self._scaled_surf, self.art_pos)
             dirty_rect = pg.Rect(self.art_pos[0], self.art_pos[1], self.art_dim[0], self.art_dim[1])
 
+        # Art plus border/center-marker overlay in one blits() call
+        decor = self._get_decor()
+        if decor:
+            screen.blits((art_blit, (decor, self.art_pos)), doreturn=False)
+        else:
+            screen.blit(*art_blit)
+
         self._needs_redraw = False
         self._need_first_blit = False
 
-        # Border
-        if self.border_width and dirty_rect:
-            try:
-                if self.circle and self.art_center:
-                    rad = min(self.art_dim[0], self.art_dim[1]) // 2
-                    pg.draw.circle(screen, self.font_color, self.art_center, rad, self.border_width)
-                else:
-                    pg.draw.rect(screen, self.font_color, pg.Rect(self.art_pos, self.art_dim), self.border_width)
-            except Exception:
-                pass
-
-        # LP center markers (spindle + inner ring)
-        if self.rotate_enabled and self.art_center and self.rotate_rpm > 0.0 and dirty_rect:
-            try:
-                pg.draw.circle(screen, self.font_color, self.art_center, self.spindle_radius, 0)
-                pg.draw.circle(screen, self.font_color, self.art_center, self.ring_radius, 1)
-            except Exception:
-                pass
-
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("albumart", False):
-            mode = "rotating" if (self.rotate_enabled and self.rotate_rpm > 0.0) else "static"
+        if _TRACE_ALBUMART:
+            mode = "rotating" if self._rotate_active else "static"
             log_debug(f"[AlbumArt] OUTPUT: {mode}, angle={self._current_angle:.1f}, rect={dirty_rect}", "trace", "albumart")
 
         return dirty_rect
@@ -1013,19 +1843,34 @@ class VinylRenderer:
         self._base_surf = None      # Original vinyl (without art) - kept for recompositing
         self._original_surf = None  # Current surface (may have art composited)
         self._rot_frames = None
-        self._current_angle = 0.0
+        self._cv_cache = {}  # rotate_surface source cache
+        self._backing_rect = None  # cached by get_backing_rect, keyed on surface size
+        self._backing_size = None
+        self._angle_milli = 0  # rotation angle in 1/1000 degree
+        self._step_milli = max(1, self.rotation_step) * 1000
         self._loaded = False
         self._last_blit_tick = 0
         self._blit_interval_ms = int(1000 / max(1, self.rotation_fps))
+        # rpm * 360 deg / 60000 ms = rpm * 6 millidegrees per ms, signed by direction
+        self._milli_per_ms = self.rotate_rpm * 6.0 * self.direction_mult
         self._needs_redraw = True
         self._need_first_blit = False
         self._has_composited_art = False  # True when album art is baked into vinyl
         self._regeneration_queue = None
         # SMOOTH_ROTATION: rollback remove next 2 lines
-        self._smooth_rotation = str(smooth_rotation).strip().lower() in ('1', 'true', 'yes') if isinstance(smooth_rotation, str) else bool(smooth_rotation)
+        self._smooth_rotation = _parse_bool(smooth_rotation)
         
         self._load_image()
 
+    @property
+    def _current_angle(self):
+        """Rotation angle in degrees (stored as integer millidegrees)."""
+        return self._angle_milli / 1000.0
+
+    @_current_angle.setter
+    def _current_angle(self, value):
+        self._angle_milli = int(round(value * 1000.0)) % ANGLE_MILLI_FULL
+
     def _apply_dimension(self, surf):
         """Apply optional vinyl.dimension scaling while preserving legacy default behavior."""
         if surf is None:
@@ -1121,7 +1966,7 @@ class VinylRenderer:
                 if not self._regeneration_queue:
                     break
                 angle, idx = self._regeneration_queue.pop(0)
-                self._rot_frames[idx] = pg.transform.rotate(self._original_surf, -angle)
+                self._build_frame(idx)
             if not self._regeneration_queue:
                 self._regeneration_queue = None
                 log_debug(f"[VinylRenderer] Regenerated {len(self._rot_frames)} rotation frames (incremental)", "verbose")
@@ -1130,7 +1975,26 @@ class VinylRenderer:
             self._rot_frames = None
             self._regeneration_queue = None
     
-    def composite_album_art(self, art_surf, art_dim):
+    def _build_frame(self, idx):
+        """Fill and return rotation frame idx.
+        
+        When the step divides 90, frames past the first quadrant are made by
+        turning the matching first-quadrant frame by a multiple of 90 degrees
+        (an exact transpose in pygame) instead of resampling the full disc.
+        """
+        rot = self._rot_frames[idx]
+        if rot is not None:
+            return rot
+        per_quadrant = 90 // self.rotation_step if 90 % self.rotation_step == 0 else 0
+        if per_quadrant and idx >= per_quadrant:
+            quadrant, base_idx = divmod(idx, per_quadrant)
+            rot = pg.transform.rotate(self._build_frame(base_idx), -90 * quadrant)
+        else:
+            rot = rotate_frame(self._original_surf, -idx * self.rotation_step, self._cv_cache)
+        self._rot_frames[idx] = rot
+        return rot
+
+    def composite_album_art(self, art_surf, art_dim, markers=None):
         """Composite album art onto vinyl surface center.
         
         This creates a single surface with vinyl + art that rotates as one unit,
@@ -1138,6 +2002,9 @@ class VinylRenderer:
         
         :param art_surf: Scaled album art surface (with transparency if circular)
         :param art_dim: (width, height) of the album art
+        :param markers: optional (color, spindle_radius, ring_radius); the LP
+                        center markers are circles, so they are baked in and
+                        rotate with the disc instead of being drawn per frame
         :return: True if composite successful, False otherwise
         """
         if not self._base_surf or not art_surf:
@@ -1159,6 +2026,12 @@ class VinylRenderer:
             # Blit art onto vinyl
             self._original_surf.blit(art_surf, (art_x, art_y))
             
+            if markers:
+                color, spindle_radius, ring_radius = markers
+                art_center = (art_x + art_w // 2, art_y + art_h // 2)
+                pg.draw.circle(self._original_surf, color, art_center, spindle_radius, 0)
+                pg.draw.circle(self._original_surf, color, art_center, ring_radius, 1)
+            
             # Regenerate rotation frames with composited surface
             self._regenerate_rotation_frames()
             
@@ -1174,6 +2047,16 @@ class VinylRenderer:
             self._has_composited_art = False
             return False
     
+    def clear_composited_art(self):
+        """Drop baked-in album art and go back to the plain vinyl."""
+        if not self._has_composited_art or not self._base_surf:
+            return
+        self._original_surf = self._base_surf.copy()
+        self._has_composited_art = False
+        self._regenerate_rotation_frames()
+        self._needs_redraw = True
+        self._need_first_blit = True
+    
     def has_composited_art(self):
         """Return True if album art is composited onto this vinyl."""
         return self._has_composited_art
@@ -1181,24 +2064,26 @@ class VinylRenderer:
     def _update_angle(self, status, now_ticks, volatile=False, decel_factor=1.0):
         """Update rotation angle based on RPM, direction, and playback status.
         
+        :param status: STATUS_* code (see resolve_status)
         :param decel_factor: 1.0 = full speed, 0.0 = stopped (for deceleration)
         """
         if self.rotate_rpm <= 0.0:
             return
         
-        status = (status or "").lower()
-        if volatile and status in ("stop", "pause"):
-            status = "play"
-        if status == "play" or decel_factor > 0.0:
-            # SMOOTH_ROTATION: rollback replace block with: dt = self._blit_interval_ms / 1000.0
-            if getattr(self, '_smooth_rotation', False) and self._last_blit_tick > 0:
-                dt = (now_ticks - self._last_blit_tick) / 1000.0
-                dt = min(max(dt, 0.0), 0.5)
+        if volatile and status in (STATUS_STOP, STATUS_PAUSE):
+            status = STATUS_PLAY
+        if status == STATUS_PLAY or decel_factor > 0.0:
+            # SMOOTH_ROTATION: rollback replace block with: dt_ms = self._blit_interval_ms
+            if self._smooth_rotation and self._last_blit_tick > 0:
+                dt_ms = now_ticks - self._last_blit_tick
+                if dt_ms > MAX_ROTATION_DT_MS:
+                    dt_ms = MAX_ROTATION_DT_MS
+                elif dt_ms < 0:
+                    dt_ms = 0
             else:
-                dt = self._blit_interval_ms / 1000.0
-            effective_rpm = self.rotate_rpm * decel_factor
-            self._current_angle = (self._current_angle + effective_rpm * 6.0 * dt * self.direction_mult) % 360.0
-            if getattr(self, '_smooth_rotation', False):
+                dt_ms = self._blit_interval_ms
+            self._angle_milli = (self._angle_milli + int(self._milli_per_ms * decel_factor * dt_ms)) % ANGLE_MILLI_FULL
+            if self._smooth_rotation:
                 self._last_blit_tick = now_ticks
     
     def get_current_angle(self):
@@ -1214,24 +2099,28 @@ class VinylRenderer:
         if not self.center or self.rotate_rpm <= 0.0:
             return self._needs_redraw
         # SMOOTH_ROTATION: rollback remove next 2 lines
-        if getattr(self, '_smooth_rotation', False) and self.rotate_rpm > 0.0:
+        if self._smooth_rotation:
             return True
         
         return (now_ticks - self._last_blit_tick) >= self._blit_interval_ms
     
     def get_backing_rect(self):
-        """Get bounding rectangle for backing surface (extended for rotation)."""
+        """Get bounding rectangle for backing surface (extended for rotation).
+        
+        Cached per surface size; compositing art keeps the vinyl size, so
+        the rect is only rebuilt when a differently sized disc is loaded.
+        """
         if not self._original_surf or not self.center:
             return None
         
-        w = self._original_surf.get_width()
-        h = self._original_surf.get_height()
-        diag = int(max(w, h) * math.sqrt(2)) + 4
-        
-        ext_x = self.center[0] - diag // 2
-        ext_y = self.center[1] - diag // 2
-        
-        return pg.Rect(ext_x, ext_y, diag, diag)
+        size = self._original_surf.get_size()
+        if size != self._backing_size:
+            diag = int(max(size) * math.sqrt(2)) + 4
+            ext_x = self.center[0] - diag // 2
+            ext_y = self.center[1] - diag // 2
+            self._backing_rect = pg.Rect(ext_x, ext_y, diag, diag)
+            self._backing_size = size
+        return self._backing_rect
     
     def get_visual_rect(self):
         """Get visual bounding rectangle (actual image extent, not rotation-extended).
@@ -1265,10 +2154,18 @@ class VinylRenderer:
         if not force and not self.will_blit(now_ticks):
             return None
         
-        log_debug(f"[Vinyl] RENDER: status={status}, angle={self._current_angle:.1f}, decel={decel_factor:.2f}, advance={advance_angle}", "trace", "vinyl")
+        # Nothing visible inside the screen clip - skip rotation and blit
+        backing = self.get_backing_rect()
+        if backing and not backing.colliderect(screen.get_clip()):
+            if advance_angle and not self._smooth_rotation:
+                self._last_blit_tick = now_ticks
+            return None
+        
+        if _TRACE_VINYL:
+            log_debug(f"[Vinyl] RENDER: status={status}, angle={self._current_angle:.1f}, decel={decel_factor:.2f}, advance={advance_angle}", "trace", "vinyl")
         
         # Only update timing when advancing (so forced redraws don't reset FPS schedule). SMOOTH_ROTATION: skip when smooth (set in _update_angle)
-        if advance_angle and not getattr(self, '_smooth_rotation', False):
+        if advance_angle and not self._smooth_rotation:
             self._last_blit_tick = now_ticks
         
         if not self.center:
@@ -1288,18 +2185,14 @@ class VinylRenderer:
             self._regenerate_rotation_batch(4)
         
         if self._rot_frames:
-            idx = int(self._current_angle // self.rotation_step) % len(self._rot_frames)
+            idx = (self._angle_milli // self._step_milli) % len(self._rot_frames)
             rot = self._rot_frames[idx]
             if rot is None:
-                try:
-                    rot = pg.transform.rotate(self._original_surf, -self._current_angle)
-                except Exception:
-                    rot = pg.transform.rotate(self._original_surf, int(-self._current_angle))
+                # Not built yet - build this slot now and keep it, so the
+                # regeneration batch skips it
+                rot = self._build_frame(idx)
         else:
-            try:
-                rot = pg.transform.rotate(self._original_surf, -self._current_angle)
-            except Exception:
-                rot = pg.transform.rotate(self._original_surf, int(-self._current_angle))
+            rot = rotate_surface(self._original_surf, -self._current_angle, self._cv_cache)
         
         rot_rect = rot.get_rect(center=self.center)
         screen.blit(rot, rot_rect.topleft)
@@ -1312,10 +2205,12 @@ class VinylRenderer:
 # =============================================================================
 # TonearmRenderer - Tonearm animation based on track progress
 # =============================================================================
-TONEARM_STATE_REST = "rest"
-TONEARM_STATE_DROP = "drop"
-TONEARM_STATE_TRACKING = "tracking"
-TONEARM_STATE_LIFT = "lift"
+# Integer states so the per-frame state checks are int compares
+TONEARM_STATE_REST = 0
+TONEARM_STATE_DROP = 1
+TONEARM_STATE_TRACKING = 2
+TONEARM_STATE_LIFT = 3
+TONEARM_STATE_NAMES = ("rest", "drop", "tracking", "lift")
 
 
 class TonearmRenderer:
@@ -1325,6 +2220,11 @@ class TonearmRenderer:
     Drop and lift animations provide realistic arm movement.
     """
     
+    # Frame dicts keyed by (image path, mtime, pivot_image, pivot_screen, step),
+    # shared so a handler rebuilt for the same skin reuses the built frames
+    _frame_cache = OrderedDict()
+    _MAX_CACHED_ARMS = 2
+    
     def __init__(self, base_path, meter_folder, filename,
                  pivot_screen, pivot_image,
                  angle_rest, angle_start, angle_end,
@@ -1346,21 +2246,23 @@ class TonearmRenderer:
         self._loaded = False
         self._state = TONEARM_STATE_REST
         self._current_angle = self.angle_rest
-        self._animation_start_time = 0
+        self._animation_start_ms = 0  # pg.time.get_ticks() clock
         self._animation_start_angle = 0
         self._animation_end_angle = 0
-        self._animation_duration = 0
-        self._last_status = ""
+        self._animation_duration_ms = 0
+        self._last_status = STATUS_UNKNOWN
         self._last_blit_tick = 0
         self._blit_interval_ms = int(1000 / max(1, self.rotation_fps))
         self._needs_redraw = True
         self._last_drawn_angle = None
         self._pending_drop_target = None
-        self._last_update_time = 0
+        self._last_update_ms = 0
+        self._tracked_progress_pct = None  # last progress handled in TRACKING
         self._early_lift = False
         
         self._last_blit_rect = None
         self._last_backing = None
+        self._backing_pool = None  # reused screen-capture surface (see render)
         
         # Layer composition: capture backing from bgr_surface (pure static bg)
         self._bgr_surface = None
@@ -1370,9 +2272,11 @@ class TonearmRenderer:
         
         self._arm_length = 0
         
-        # Precomputed rotation frames for CPU optimization
+        # Rotation frames cached on first use, keyed by angle rounded to _rot_step
         self._rot_frames = {}
-        self._rot_step = 0.5  # Degree step for precomputed frames
+        self._rot_step = 0.5  # Degree step for cached frames
+        self._frame_key_range = None  # (min, max) cacheable key, set by _load_image
+        self._cv_cache = {}  # rotate_surface source cache
         
         self._load_image()
     
@@ -1401,7 +2305,7 @@ class TonearmRenderer:
         return self._state in (TONEARM_STATE_DROP, TONEARM_STATE_LIFT)
     
     def _load_image(self):
-        """Load the tonearm PNG file and precompute rotation frames."""
+        """Load the tonearm PNG file and set up the rotation frame cache."""
         if not self.filename:
             return
         
@@ -1422,50 +2326,83 @@ class TonearmRenderer:
                     for cx, cy in corners
                 )
                 
-                # Precompute rotation frames for CPU optimization
-                # Range covers: rest -> start -> end (all tonearm positions)
-                if USE_PRECOMPUTED_FRAMES:
-                    angle_min = min(self.angle_rest, self.angle_start, self.angle_end) - 1.0
-                    angle_max = max(self.angle_rest, self.angle_start, self.angle_end) + 1.0
-                    
-                    angle = angle_min
-                    frame_count = 0
-                    while angle <= angle_max:
-                        key = round(angle / self._rot_step) * self._rot_step
-                        if key not in self._rot_frames:
-                            try:
-                                self._rot_frames[key] = pg.transform.rotate(self._original_surf, angle)
-                                frame_count += 1
-                            except Exception:
-                                pass
-                        angle += self._rot_step
-                    
-                    log_debug(f"[TonearmRenderer] Loaded '{self.filename}', arm_length={self._arm_length:.1f}, precomputed {frame_count} frames")
+                # Rotation frames are cached on first use (see render) for angles in
+                # rest -> start -> end, so startup does no rotation work at all
+                key = (img_path, os.path.getmtime(img_path), tuple(self.pivot_image),
+                       tuple(self.pivot_screen), self._rot_step)
+                cache = TonearmRenderer._frame_cache
+                frames = cache.get(key)
+                if frames is None:
+                    frames = cache[key] = {}
+                    if len(cache) > self._MAX_CACHED_ARMS:
+                        cache.popitem(last=False)
                 else:
-                    log_debug(f"[TonearmRenderer] Loaded '{self.filename}', arm_length={self._arm_length:.1f}")
+                    cache.move_to_end(key)
+                self._rot_frames = frames
+                angle_min = min(self.angle_rest, self.angle_start, self.angle_end) - 1.0
+                angle_max = max(self.angle_rest, self.angle_start, self.angle_end) + 1.0
+                self._frame_key_range = (math.floor(angle_min / self._rot_step) * self._rot_step,
+                                         math.ceil(angle_max / self._rot_step) * self._rot_step)
+                
+                log_debug(f"[TonearmRenderer] Loaded '{self.filename}', arm_length={self._arm_length:.1f}")
             else:
                 print(f"[TonearmRenderer] File not found: {img_path}")
         except Exception as e:
             print(f"[TonearmRenderer] Failed to load '{self.filename}': {e}")
     
+    def _make_frame(self, angle, cache=True):
+        """Rotate the arm by angle and crop away the transparent rotate bounds.
+        
+        Returns (surface, blit_rect): the cropped frame and where it goes on
+        screen so the image pivot lands on pivot_screen. Both depend only on
+        the angle, so precomputed frames need no trig in render.
+        """
+        if cache:
+            rotated = rotate_frame(self._original_surf, angle, self._cv_cache)
+        else:
+            rotated = rotate_surface(self._original_surf, angle, self._cv_cache)
+        rot_w, rot_h = rotated.get_size()
+        bbox = rotated.get_bounding_rect()
+        if bbox.width and bbox.height and bbox.size != (rot_w, rot_h):
+            rotated = rotated.subsurface(bbox).copy() if cache else rotated.subsurface(bbox)
+        else:
+            bbox.topleft = (0, 0)
+        
+        # Rotate the pivot's offset from the image center to find it in the
+        # rotated image
+        px, py = self.pivot_image
+        img_w, img_h = self._original_surf.get_size()
+        dx, dy = px - img_w / 2, py - img_h / 2
+        rad = math.radians(-angle)
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
+        rot_px = rot_w / 2 + dx * cos_a - dy * sin_a
+        rot_py = rot_h / 2 + dx * sin_a + dy * cos_a
+        
+        scr_px, scr_py = self.pivot_screen
+        # Frames are cropped to their opaque pixels; shift by the crop offset
+        blit_x = int(scr_px - rot_px) + bbox.x
+        blit_y = int(scr_py - rot_py) + bbox.y
+        return rotated, pg.Rect(blit_x, blit_y, rotated.get_width(), rotated.get_height())
+    
     def _start_animation(self, target_angle, duration):
-        """Start an animation from current angle to target angle."""
-        self._animation_start_time = time.time()
+        """Start an animation from current angle to target angle (duration in seconds)."""
+        self._animation_start_ms = pg.time.get_ticks()
         self._animation_start_angle = self._current_angle
         self._animation_end_angle = target_angle
-        self._animation_duration = duration
+        self._animation_duration_ms = int(duration * 1000)
     
     def _update_animation(self):
         """Update animation progress, return True if animation complete."""
-        if self._animation_duration <= 0:
+        if self._animation_duration_ms <= 0:
             self._current_angle = self._animation_end_angle
             return True
         
-        elapsed = time.time() - self._animation_start_time
-        progress = min(1.0, elapsed / self._animation_duration)
+        elapsed_ms = pg.time.get_ticks() - self._animation_start_ms
+        progress = min(1.0, elapsed_ms / self._animation_duration_ms)
         
-        # Ease-out for natural arm movement
-        eased = 1 - (1 - progress) ** 2
+        # Ease-out for natural arm movement: 1 - (1 - progress)^2
+        remaining = 1.0 - progress
+        eased = 1.0 - remaining * remaining
         
         self._current_angle = (
             self._animation_start_angle + 
@@ -1475,36 +2412,39 @@ class TonearmRenderer:
         return progress >= 1.0
     
     def update(self, status, progress_pct, time_remaining_sec=None):
-        """Update tonearm state based on playback status and progress."""
+        """Update tonearm state based on playback status and progress.
+        
+        :param status: STATUS_* code (see resolve_status)
+        """
         if not self._loaded:
             return False
         
-        now = time.time()
+        now_ms = pg.time.get_ticks()
         
         # Freeze detection
         if self._state in (TONEARM_STATE_DROP, TONEARM_STATE_LIFT):
-            if self._last_update_time > 0:
-                gap_sec = now - self._last_update_time
-                if gap_sec > 0.3:
+            if self._last_update_ms > 0:
+                gap_ms = now_ms - self._last_update_ms
+                if gap_ms > 300:
                     remaining_angle = abs(self._animation_end_angle - self._current_angle)
                     total_angle = abs(self._animation_end_angle - self._animation_start_angle)
                     if total_angle > 0.1:
                         remaining_pct = remaining_angle / total_angle
-                        remaining_duration = self._animation_duration * remaining_pct
-                        if remaining_duration > 0.05:
-                            self._animation_start_time = now
+                        remaining_duration_ms = int(self._animation_duration_ms * remaining_pct)
+                        if remaining_duration_ms > 50:
+                            self._animation_start_ms = now_ms
                             self._animation_start_angle = self._current_angle
-                            self._animation_duration = remaining_duration
-                            log_debug(f"[Tonearm] Update freeze ({gap_sec*1000:.0f}ms), restart animation", "trace", "tonearm")
+                            self._animation_duration_ms = remaining_duration_ms
+                            if _TRACE_TONEARM:
+                                log_debug(f"[Tonearm] Update freeze ({gap_ms}ms), restart animation", "trace", "tonearm")
         
-        self._last_update_time = now
+        self._last_update_ms = now_ms
         
-        status = (status or "").lower()
         self._last_status = status
         
         # State machine
         if self._state == TONEARM_STATE_REST:
-            if status == "play":
+            if status == STATUS_PLAY:
                 progress_pct = max(0.0, min(100.0, progress_pct or 0.0))
                 if self._early_lift and progress_pct > 10.0:
                     return self._needs_redraw
@@ -1514,14 +2454,16 @@ class TonearmRenderer:
                     self.angle_start + 
                     (self.angle_end - self.angle_start) * (progress_pct / 100.0)
                 )
-                log_debug(f"[Tonearm] REST->DROP: progress={progress_pct:.1f}%", "trace", "tonearm")
+                if _TRACE_TONEARM:
+                    log_debug(f"[Tonearm] REST->DROP: progress={progress_pct:.1f}%", "trace", "tonearm")
                 self._state = TONEARM_STATE_DROP
                 self._start_animation(target_angle, self.drop_duration)
                 self._needs_redraw = True
         
         elif self._state == TONEARM_STATE_DROP:
-            if status != "play":
-                log_debug(f"[Tonearm] DROP->LIFT: playback stopped", "trace", "tonearm")
+            if status != STATUS_PLAY:
+                if _TRACE_TONEARM:
+                    log_debug(f"[Tonearm] DROP->LIFT: playback stopped", "trace", "tonearm")
                 self._state = TONEARM_STATE_LIFT
                 self._early_lift = False
                 self._start_animation(self.angle_rest, self.lift_duration)
@@ -1532,30 +2474,36 @@ class TonearmRenderer:
                         self.angle_start + 
                         (self.angle_end - self.angle_start) * (progress_pct / 100.0)
                     )
-                    log_debug(f"[Tonearm] DROP->TRACKING: sync_angle={sync_angle:.1f}", "trace", "tonearm")
+                    if _TRACE_TONEARM:
+                        log_debug(f"[Tonearm] DROP->TRACKING: sync_angle={sync_angle:.1f}", "trace", "tonearm")
                     self._current_angle = sync_angle
                     self._state = TONEARM_STATE_TRACKING
+                    self._tracked_progress_pct = None
                 self._needs_redraw = True
         
         elif self._state == TONEARM_STATE_TRACKING:
             # Early lift for end-of-track
             if time_remaining_sec is not None and time_remaining_sec < 1.5 and time_remaining_sec > 0:
-                log_debug(f"[Tonearm] TRACKING->LIFT: early lift", "trace", "tonearm")
+                if _TRACE_TONEARM:
+                    log_debug(f"[Tonearm] TRACKING->LIFT: early lift", "trace", "tonearm")
                 self._state = TONEARM_STATE_LIFT
                 self._pending_drop_target = None
                 self._early_lift = True
                 self._start_animation(self.angle_rest, self.lift_duration)
                 self._needs_redraw = True
                 self._last_blit_tick = 0
-            elif status != "play":
-                log_debug(f"[Tonearm] TRACKING->LIFT: playback stopped", "trace", "tonearm")
+            elif status != STATUS_PLAY:
+                if _TRACE_TONEARM:
+                    log_debug(f"[Tonearm] TRACKING->LIFT: playback stopped", "trace", "tonearm")
                 self._state = TONEARM_STATE_LIFT
                 self._pending_drop_target = None
                 self._early_lift = False
                 self._start_animation(self.angle_rest, self.lift_duration)
                 self._needs_redraw = True
                 self._last_blit_tick = 0
-            else:
+            elif progress_pct != self._tracked_progress_pct:
+                # Same progress as last tick means same target: nothing to do
+                self._tracked_progress_pct = progress_pct
                 progress_pct = max(0.0, min(100.0, progress_pct or 0.0))
                 target_angle = (
                     self.angle_start + 
@@ -1564,7 +2512,8 @@ class TonearmRenderer:
                 
                 # Detect large jump (track change, seek)
                 if abs(target_angle - self._current_angle) > 2.0:
-                    log_debug(f"[Tonearm] TRACKING->LIFT: jump detected", "trace", "tonearm")
+                    if _TRACE_TONEARM:
+                        log_debug(f"[Tonearm] TRACKING->LIFT: jump detected", "trace", "tonearm")
                     self._state = TONEARM_STATE_LIFT
                     self._pending_drop_target = target_angle
                     self._early_lift = False
@@ -1578,25 +2527,29 @@ class TonearmRenderer:
         elif self._state == TONEARM_STATE_LIFT:
             if self._update_animation():
                 if self._early_lift:
-                    log_debug("[Tonearm] LIFT->REST: early lift complete", "trace", "tonearm")
+                    if _TRACE_TONEARM:
+                        log_debug("[Tonearm] LIFT->REST: early lift complete", "trace", "tonearm")
                     self._state = TONEARM_STATE_REST
                     self._pending_drop_target = None
                 elif self._pending_drop_target is not None:
-                    log_debug(f"[Tonearm] LIFT->DROP: pending target", "trace", "tonearm")
+                    if _TRACE_TONEARM:
+                        log_debug(f"[Tonearm] LIFT->DROP: pending target", "trace", "tonearm")
                     self._state = TONEARM_STATE_DROP
                     self._start_animation(self._pending_drop_target, self.drop_duration)
                     self._pending_drop_target = None
-                elif status == "play":
+                elif status == STATUS_PLAY:
                     progress_pct = max(0.0, min(100.0, progress_pct or 0.0))
                     target_angle = (
                         self.angle_start + 
                         (self.angle_end - self.angle_start) * (progress_pct / 100.0)
                     )
-                    log_debug(f"[Tonearm] LIFT->DROP: using progress", "trace", "tonearm")
+                    if _TRACE_TONEARM:
+                        log_debug(f"[Tonearm] LIFT->DROP: using progress", "trace", "tonearm")
                     self._state = TONEARM_STATE_DROP
                     self._start_animation(target_angle, self.drop_duration)
                 else:
-                    log_debug(f"[Tonearm] LIFT->REST: not playing", "trace", "tonearm")
+                    if _TRACE_TONEARM:
+                        log_debug(f"[Tonearm] LIFT->REST: not playing", "trace", "tonearm")
                     self._state = TONEARM_STATE_REST
                     self._pending_drop_target = None
             self._needs_redraw = True
@@ -1635,22 +2588,18 @@ class TonearmRenderer:
         min_angle = min(self.angle_rest, self.angle_start, self.angle_end)
         max_angle = max(self.angle_rest, self.angle_start, self.angle_end)
         
-        points = []
-        for angle in range(int(min_angle), int(max_angle) + 1, 5):
-            rad = math.radians(angle)
-            x = px + arm_len * math.cos(rad)
-            y = py - arm_len * math.sin(rad)
-            points.append((x, y))
-        
-        points.append((px, py))
-        
-        if not points:
-            return None
+        # Bounding box of the swept arc: its two end angles plus any axis
+        # crossing (multiple of 90 degrees) in between, and the pivot itself
+        sweep = [math.radians(min_angle), math.radians(max_angle)]
+        sweep.extend(math.radians(k * 90)
+                     for k in range(math.ceil(min_angle / 90), math.floor(max_angle / 90) + 1))
+        xs = [px + arm_len * math.cos(rad) for rad in sweep]
+        ys = [py - arm_len * math.sin(rad) for rad in sweep]
         
-        min_x = min(p[0] for p in points)
-        max_x = max(p[0] for p in points)
-        min_y = min(p[1] for p in points)
-        max_y = max(p[1] for p in points)
+        min_x = min(min(xs), px)
+        max_x = max(max(xs), px)
+        min_y = min(min(ys), py)
+        max_y = max(max(ys), py)
         
         px_img, py_img = self.pivot_image
         img_h = self._original_surf.get_height()
@@ -1670,51 +2619,50 @@ class TonearmRenderer:
         if self._last_backing is None or self._last_blit_rect is None:
             return None
         
-        log_debug(f"[Tonearm] RESTORE: rect={self._last_blit_rect}, state={self._state}", "trace", "tonearm")
+        if _TRACE_TONEARM:
+            log_debug(f"[Tonearm] RESTORE: rect={self._last_blit_rect}, state={TONEARM_STATE_NAMES[self._state]}", "trace", "tonearm")
         
         if not self._exclusion_zones or self._state == TONEARM_STATE_TRACKING:
             screen.blit(self._last_backing, self._last_blit_rect.topleft)
             return self._last_blit_rect.copy()
         
         br = self._last_blit_rect
-        overlaps = []
-        for zone in self._exclusion_zones:
-            if br.colliderect(zone):
-                overlaps.append(br.clip(zone))
+        zones = self._exclusion_zones
+        hits = [zones[i] for i in br.collidelistall(zones)]
         
-        if not overlaps:
+        if not hits:
             screen.blit(self._last_backing, self._last_blit_rect.topleft)
             return self._last_blit_rect.copy()
         
-        # Chunk-based restore around exclusions
-        ex_left = min(o.left for o in overlaps)
-        ex_right = max(o.right for o in overlaps)
-        ex_top = min(o.top for o in overlaps)
-        ex_bottom = max(o.bottom for o in overlaps)
+        bx, by, bw, bh = br
+        
+        # Chunk-based restore around exclusions: union of the zones,
+        # clipped to the backing rect (same as clipping each zone first)
+        ex_left = max(bx, min(z.left for z in hits))
+        ex_right = min(bx + bw, max(z.right for z in hits))
+        ex_top = max(by, min(z.top for z in hits))
+        ex_bottom = min(by + bh, max(z.bottom for z in hits))
         
-        bx, by = br.topleft
-        bw, bh = br.size
+        backing = self._last_backing
+        chunks = []
         
         # Above exclusion zones
         if ex_top > by:
             h = ex_top - by
-            src_rect = pg.Rect(0, 0, bw, h)
-            screen.blit(self._last_backing, (bx, by), src_rect)
+            chunks.append((backing, (bx, by), pg.Rect(0, 0, bw, h)))
         
         # Below exclusion zones
         if ex_bottom < by + bh:
             h = (by + bh) - ex_bottom
             local_y = ex_bottom - by
-            src_rect = pg.Rect(0, local_y, bw, h)
-            screen.blit(self._last_backing, (bx, ex_bottom), src_rect)
+            chunks.append((backing, (bx, ex_bottom), pg.Rect(0, local_y, bw, h)))
         
         # Left of exclusion zones
         if ex_left > bx:
             w = ex_left - bx
             h = ex_bottom - ex_top
             local_y = ex_top - by
-            src_rect = pg.Rect(0, local_y, w, h)
-            screen.blit(self._last_backing, (bx, ex_top), src_rect)
+            chunks.append((backing, (bx, ex_top), pg.Rect(0, local_y, w, h)))
         
         # Right of exclusion zones
         if ex_right < bx + bw:
@@ -1722,8 +2670,10 @@ class TonearmRenderer:
             h = ex_bottom - ex_top
             local_x = ex_right - bx
             local_y = ex_top - by
-            src_rect = pg.Rect(local_x, local_y, w, h)
-            screen.blit(self._last_backing, (ex_right, ex_top), src_rect)
+            chunks.append((backing, (ex_right, ex_top), pg.Rect(local_x, local_y, w, h)))
+        
+        if chunks:
+            screen.blits(chunks, doreturn=False)
         
         return self._last_blit_rect.copy()
     
@@ -1746,24 +2696,24 @@ class TonearmRenderer:
         if not force and not self.will_blit(now_ticks):
             return None
         
-        # Freeze detection
-        actual_now = pg.time.get_ticks()
+        # Freeze detection (now_ticks is the same pg.time clock as the animation)
         if self._state in (TONEARM_STATE_DROP, TONEARM_STATE_LIFT):
             if self._last_blit_tick > 0:
-                gap_ms = actual_now - self._last_blit_tick
+                gap_ms = now_ticks - self._last_blit_tick
                 if gap_ms > 300:
                     remaining_angle = abs(self._animation_end_angle - self._current_angle)
                     total_angle = abs(self._animation_end_angle - self._animation_start_angle)
                     if total_angle > 0.1:
                         remaining_pct = remaining_angle / total_angle
-                        remaining_duration = self._animation_duration * remaining_pct
-                        if remaining_duration > 0.1:
-                            self._animation_start_time = time.time()
+                        remaining_duration_ms = int(self._animation_duration_ms * remaining_pct)
+                        if remaining_duration_ms > 100:
+                            self._animation_start_ms = now_ticks
                             self._animation_start_angle = self._current_angle
-                            self._animation_duration = remaining_duration
-                            log_debug(f"[Tonearm] Freeze detected ({gap_ms}ms)", "trace", "tonearm")
+                            self._animation_duration_ms = remaining_duration_ms
+                            if _TRACE_TONEARM:
+                                log_debug(f"[Tonearm] Freeze detected ({gap_ms}ms)", "trace", "tonearm")
         
-        self._last_blit_tick = actual_now
+        self._last_blit_tick = now_ticks
         
         # Skip if angle unchanged (TRACKING state only)
         if not force and not self._needs_redraw and self._state == TONEARM_STATE_TRACKING:
@@ -1771,35 +2721,22 @@ class TonearmRenderer:
                 if abs(self._current_angle - self._last_drawn_angle) < 0.1:
                     return None
         
-        # Rotate around pivot point - use precomputed frame if available
+        # Rotate around pivot point - use cached frame, building it on first use
         frame_key = round(self._current_angle / self._rot_step) * self._rot_step
-        if frame_key in self._rot_frames:
-            rotated = self._rot_frames[frame_key]
-        else:
-            # Fallback to real-time rotation
-            rotated = pg.transform.rotate(self._original_surf, self._current_angle)
-        
-        px, py = self.pivot_image
-        img_w = self._original_surf.get_width()
-        img_h = self._original_surf.get_height()
-        
-        cx, cy = img_w / 2, img_h / 2
-        dx, dy = px - cx, py - cy
-        
-        rad = math.radians(-self._current_angle)
-        new_dx = dx * math.cos(rad) - dy * math.sin(rad)
-        new_dy = dx * math.sin(rad) + dy * math.cos(rad)
-        
-        rot_w = rotated.get_width()
-        rot_h = rotated.get_height()
-        rot_cx, rot_cy = rot_w / 2, rot_h / 2
-        rot_px = rot_cx + new_dx
-        rot_py = rot_cy + new_dy
-        
-        scr_px, scr_py = self.pivot_screen
-        blit_x = int(scr_px - rot_px)
-        blit_y = int(scr_py - rot_py)
-        blit_rect = pg.Rect(blit_x, blit_y, rot_w, rot_h)
+        frame = self._rot_frames.get(frame_key)
+        if frame is None:
+            key_range = self._frame_key_range
+            if USE_PRECOMPUTED_FRAMES and key_range:
+                # The arm only moves between rest, start and end, so snapping
+                # into that sweep always lands on a cacheable key
+                frame_key = min(max(frame_key, key_range[0]), key_range[1])
+                frame = self._rot_frames.get(frame_key)
+                if frame is None:
+                    frame = self._rot_frames[frame_key] = self._make_frame(frame_key)
+            else:
+                # Real-time rotation (frame caching disabled)
+                frame = self._make_frame(self._current_angle, cache=False)
+        rotated, blit_rect = frame
         
         # Capture backing BEFORE drawing tonearm
         # LAYER COMPOSITION: Use bgr_surface (pure static bg) to avoid
@@ -1809,15 +2746,29 @@ class TonearmRenderer:
         clipped_rect = blit_rect.clip(source_rect)
         if clipped_rect.width > 0 and clipped_rect.height > 0:
             try:
-                self._last_backing = capture_source.subsurface(clipped_rect).copy()
+                if capture_source is self._bgr_surface:
+                    # bgr_surface never changes, so a view into it is enough
+                    self._last_backing = capture_source.subsurface(clipped_rect)
+                else:
+                    # The screen is about to be drawn over: copy into one
+                    # reused surface, grown as needed, instead of a new copy
+                    w, h = clipped_rect.size
+                    pool = self._backing_pool
+                    if pool is None or pool.get_width() < w or pool.get_height() < h:
+                        if pool is not None:
+                            w, h = max(w, pool.get_width()), max(h, pool.get_height())
+                        pool = self._backing_pool = pg.Surface((w, h), 0, capture_source)
+                    pool.blit(capture_source, (0, 0), clipped_rect)
+                    self._last_backing = pool.subsurface((0, 0) + clipped_rect.size)
                 self._last_blit_rect = clipped_rect
             except Exception:
                 self._last_backing = None
                 self._last_blit_rect = None
         
-        screen.blit(rotated, (blit_x, blit_y))
+        screen.blit(rotated, blit_rect)
         
-        log_debug(f"[Tonearm] RENDER: angle={self._current_angle:.1f}, rect={blit_rect}", "trace", "tonearm")
+        if _TRACE_TONEARM:
+            log_debug(f"[Tonearm] RENDER: angle={self._current_angle:.1f}, rect={blit_rect}", "trace", "tonearm")
         
         self._needs_redraw = False
         self._last_drawn_angle = self._current_angle
@@ -1825,8 +2776,8 @@ class TonearmRenderer:
         return blit_rect
     
     def get_state(self):
-        """Return current state for debugging."""
-        return self._state
+        """Return current state name for debugging."""
+        return TONEARM_STATE_NAMES[self._state]
     
     def get_angle(self):
         """Return current angle for debugging."""
@@ -1862,6 +2813,8 @@ class TurntableHandler:
     - Single reel + tonearm = treat reel as vinyl
     """
     
+    _image_executor = None
+    
     def __init__(self, screen, meter, config, meter_config, meter_config_volumio):
         """
         Initialize turntable handler.
@@ -1889,7 +2842,8 @@ class TurntableHandler:
         # Higher values = lower CPU but meters may feel sluggish
         # Lower values = higher CPU but more responsive meters
         self.meter_delay_ms = max(0, min(20, self.global_config.get(METER_DELAY, 10)))
-        self.meter_delay_sec = self.meter_delay_ms / 1000.0  # Convert to seconds for time.sleep()
+        self._meter_run_ms = 0  # get_ticks() of the last meter.run() in render
+        self._meter_delay_logged = False
         
         # Background surface for layer composition
         self.bgr_surface = None
@@ -1913,6 +2867,7 @@ class TurntableHandler:
         self.next_title_scroller = None
         self.next_artist_scroller = None
         self.next_album_scroller = None
+        self._scrollers = []  # all non-None scrollers, set in init_for_meter
 
         # Positions and fonts
         self.time_pos = None
@@ -1941,6 +2896,8 @@ class TurntableHandler:
         self.fgr_surf = None
         self.fgr_pos = (0, 0)
         self.fgr_regions = []
+        self.fgr_screen_regions = []  # (screen_rect, source_rect) pairs
+        self._skin_image_futures = {}  # path -> pending decode (see _prefetch_skin_images)
         
         # Caches
         self.last_time_str = ""
@@ -1951,6 +2908,12 @@ class TurntableHandler:
         self.last_sample_surf = None
         self.last_track_type = ""
         self.last_format_icon_surf = None
+        self._fmt_resolve_cache = {}  # raw trackType -> resolve_format_icon()
+        self._persist_file = os.path.join(tempfile.gettempdir(), 'peppy_persist')
+        self._persist_cache = None  # see _read_persist
+        self._artist_src = self._album_src = None
+        self._display_artist = ""
+        self._format_icon_pos = (0, 0)
         
         log_debug("TurntableHandler initialized", "basic")
     
@@ -1959,9 +2922,13 @@ class TurntableHandler:
         mc = self.config.get(meter_name, {}) if meter_name else {}
         mc_vol = self.global_config.get(meter_name, {}) if meter_name else {}
         self.mc_vol = mc_vol
+        # Skin location, resolved once for the renderers and asset loads below
+        base_path = self.config.get(BASE_PATH)
+        meter_folder = self.config.get(SCREEN_INFO)[METER_FOLDER]
+        self._meter_path = os.path.join(base_path, meter_folder)
         
         log_debug(f"=== TurntableHandler: Initializing meter: {meter_name} ===", "basic")
-        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("init", False):
+        if _TRACE_INIT:
             log_debug(f"[Init] TurntableHandler: meter={meter_name}, extended={mc_vol.get(EXTENDED_CONF, False)}", "trace", "init")
         
         # Reset caches
@@ -1973,6 +2940,10 @@ class TurntableHandler:
         self.last_sample_surf = None
         self.last_track_type = ""
         self.last_format_icon_surf = None
+        self._fmt_resolve_cache.clear()
+        self._artist_src = self._album_src = None
+        self._display_artist = ""
+        self._format_icon_pos = (0, 0)
         
         # Fill screen black
         self.screen.fill((0, 0, 0))
@@ -1987,6 +2958,9 @@ class TurntableHandler:
         
         self.enabled = True
         
+        # Start decoding skin images while fonts load
+        self._prefetch_skin_images(mc)
+        
         # Load fonts
         self._load_fonts(mc_vol)
         
@@ -2106,7 +3080,7 @@ class TurntableHandler:
             if sample_max:
                 self.sample_box = sample_max
             else:
-                self.sample_box = self.sample_font.size('-44.1 kHz 24 bit-')[0]
+                self.sample_box = self._text_width(self.sample_font, '-44.1 kHz 24 bit-')
         else:
             self.sample_box = 0
         
@@ -2122,7 +3096,7 @@ class TurntableHandler:
         rot_speed_mult = self.global_config.get(ROTATION_SPEED, 1.0)
         # SMOOTH_ROTATION: rollback remove next 2 lines
         smooth_rot_raw = self.global_config.get(SMOOTH_ROTATION, False)
-        smooth_rot = str(smooth_rot_raw).strip().lower() in ('1', 'true', 'yes') if smooth_rot_raw is not None else False
+        smooth_rot = _parse_bool(smooth_rot_raw)
         
         # Vinyl configuration - check for standard vinyl OR single reel edge case
         vinyl_file = mc_vol.get(VINYL_FILE)
@@ -2183,8 +3157,8 @@ class TurntableHandler:
             theme_filename = self._vinyl_theme_fallback or vinyl_file
             self._last_vinyl_uri = None
             self.vinyl_renderer = VinylRenderer(
-                base_path=self.config.get(BASE_PATH),
-                meter_folder=self.config.get(SCREEN_INFO)[METER_FOLDER],
+                base_path=base_path,
+                meter_folder=meter_folder,
                 filename=theme_filename,
                 pos=vinyl_pos,
                 center=vinyl_center,
@@ -2210,8 +3184,8 @@ class TurntableHandler:
             screen_size = (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
             
             self.album_renderer = AlbumArtRenderer(
-                base_path=self.config.get(BASE_PATH),
-                meter_folder=self.config.get(SCREEN_INFO)[METER_FOLDER],
+                base_path=base_path,
+                meter_folder=meter_folder,
                 art_pos=art_pos,
                 art_dim=art_dim,
                 screen_size=screen_size,
@@ -2244,8 +3218,8 @@ class TurntableHandler:
         
         if tonearm_file and tonearm_pivot_screen and tonearm_pivot_image:
             self.tonearm_renderer = TonearmRenderer(
-                base_path=self.config.get(BASE_PATH),
-                meter_folder=self.config.get(SCREEN_INFO)[METER_FOLDER],
+                base_path=base_path,
+                meter_folder=meter_folder,
                 filename=tonearm_file,
                 pivot_screen=tonearm_pivot_screen,
                 pivot_image=tonearm_pivot_image,
@@ -2278,8 +3252,8 @@ class TurntableHandler:
                 self.indicator_renderer = IndicatorRenderer(
                     config=mc_vol,
                     meter_config=self.global_config,
-                    base_path=self.config.get(BASE_PATH),
-                    meter_folder=self.config.get(SCREEN_INFO)[METER_FOLDER],
+                    base_path=base_path,
+                    meter_folder=meter_folder,
                     fonts=fonts_dict
                 )
                 log_debug(f"  IndicatorRenderer created", "verbose")
@@ -2307,30 +3281,21 @@ class TurntableHandler:
         self.ticker_end_spaces = max(0, int(mc_vol.get(PLAY_TICKER_END_SPACES, 8)))
         self.ticker_scroller = ScrollingLabel(ticker_font, ticker_color, ticker_pos, ticker_box, center=self.center_flag, speed_px_per_sec=ticker_speed, scroll_direction=ticker_direction, loop_segment_pixels=None) if (ticker_enabled and ticker_pos and ticker_box) else None
         self.ticker_append_next = bool(mc_vol.get(PLAY_TICKER_APPEND_NEXT)) if ticker_enabled else False
+        self._scrollers = [sc for sc in (self.artist_scroller, self.title_scroller, self.album_scroller,
+                                         self.next_title_scroller, self.next_artist_scroller,
+                                         self.next_album_scroller, self.ticker_scroller) if sc]
+        self._ticker_key = None
+        self._ticker_display = ""
+        self._ticker_segment_px = 0
 
         # LAYER COMPOSITION: Set background surface on scrollers for proper clearing
+        scrollers = self._scrollers
         if self.bgr_surface:
-            if self.artist_scroller:
-                self.artist_scroller.set_background_surface(self.bgr_surface)
-                self.artist_scroller.capture_backing(self.screen)
-            if self.title_scroller:
-                self.title_scroller.set_background_surface(self.bgr_surface)
-                self.title_scroller.capture_backing(self.screen)
-            if self.album_scroller:
-                self.album_scroller.set_background_surface(self.bgr_surface)
-                self.album_scroller.capture_backing(self.screen)
-            if self.next_title_scroller:
-                self.next_title_scroller.set_background_surface(self.bgr_surface)
-                self.next_title_scroller.capture_backing(self.screen)
-            if self.next_artist_scroller:
-                self.next_artist_scroller.set_background_surface(self.bgr_surface)
-                self.next_artist_scroller.capture_backing(self.screen)
-            if self.next_album_scroller:
-                self.next_album_scroller.set_background_surface(self.bgr_surface)
-                self.next_album_scroller.capture_backing(self.screen)
-            if self.ticker_scroller:
-                self.ticker_scroller.set_background_surface(self.bgr_surface)
-                self.ticker_scroller.capture_backing(self.screen)
+            # Backings come from the static bgr_surface, so they are captured
+            # lazily on each scroller's first draw with text
+            for sc in scrollers:
+                sc.set_background_surface(self.bgr_surface)
+                sc.defer_backing_capture()
             # Tonearm also needs bgr_surface to avoid capturing meter needles
             if self.tonearm_renderer:
                 self.tonearm_renderer.set_background_surface(self.bgr_surface)
@@ -2341,20 +3306,7 @@ class TurntableHandler:
                 self.indicator_renderer.capture_backings(self.bgr_surface)
         else:
             # Fallback to old backing capture if no bgr_surface
-            if self.artist_scroller:
-                self.artist_scroller.capture_backing(self.screen)
-            if self.title_scroller:
-                self.title_scroller.capture_backing(self.screen)
-            if self.album_scroller:
-                self.album_scroller.capture_backing(self.screen)
-            if self.next_title_scroller:
-                self.next_title_scroller.capture_backing(self.screen)
-            if self.next_artist_scroller:
-                self.next_artist_scroller.capture_backing(self.screen)
-            if self.next_album_scroller:
-                self.next_album_scroller.capture_backing(self.screen)
-            if self.ticker_scroller:
-                self.ticker_scroller.capture_backing(self.screen)
+            ScrollingLabel.capture_backings(scrollers, self.screen)
             # Indicators fallback
             if self.indicator_renderer and self.indicator_renderer.has_indicators():
                 self.indicator_renderer.capture_backings(self.screen)
@@ -2369,19 +3321,19 @@ class TurntableHandler:
         
         # Time rect (for clearing from bgr_surface; use effective time font per field)
         if self.time_pos and self.font_time_remaining:
-            time_width = self.font_time_remaining.render('00:00', True, (255,255,255)).get_width() + 4  # render() includes italic overhang; size() does not
+            time_width = self._text_width(self.font_time_remaining, '00:00', rendered=True) + 4  # render() includes italic overhang; size() does not
             time_height = self.font_time_remaining.get_linesize()
             self.time_rect = pg.Rect(self.time_pos[0], self.time_pos[1], time_width, time_height)
         else:
             self.time_rect = None
         if self.time_elapsed_pos and self.font_time_elapsed:
-            time_width = self.font_time_elapsed.render('00:00', True, (255,255,255)).get_width() + 4  # render() includes italic overhang; size() does not
+            time_width = self._text_width(self.font_time_elapsed, '00:00', rendered=True) + 4  # render() includes italic overhang; size() does not
             time_height = self.font_time_elapsed.get_linesize()
             self.time_elapsed_rect = pg.Rect(self.time_elapsed_pos[0], self.time_elapsed_pos[1], time_width, time_height)
         else:
             self.time_elapsed_rect = None
         if self.time_total_pos and self.font_time_total:
-            time_width = self.font_time_total.render('00:00', True, (255,255,255)).get_width() + 4  # render() includes italic overhang; size() does not
+            time_width = self._text_width(self.font_time_total, '00:00', rendered=True) + 4  # render() includes italic overhang; size() does not
             time_height = self.font_time_total.get_linesize()
             self.time_total_rect = pg.Rect(self.time_total_pos[0], self.time_total_pos[1], time_width, time_height)
         else:
@@ -2400,18 +3352,22 @@ class TurntableHandler:
         # Load foreground
         self.fgr_surf = None
         self.fgr_regions = []
+        self.fgr_screen_regions = []
         fgr_name = mc.get(FGR_FILENAME)
         meter_x = mc.get('meter.x', 0)
         meter_y = mc.get('meter.y', 0)
         try:
             if fgr_name:
-                meter_path = os.path.join(self.config.get(BASE_PATH), self.config.get(SCREEN_INFO)[METER_FOLDER])
+                meter_path = self._meter_path
                 fgr_path = os.path.join(meter_path, fgr_name)
-                self.fgr_surf = pg.image.load(fgr_path).convert_alpha()
-                self.fgr_regions = compute_foreground_regions(self.fgr_surf)
+                self.fgr_surf = self._load_skin_image(fgr_path).convert_alpha()
+                self.fgr_regions = compute_foreground_regions_cached(fgr_path, self.fgr_surf)
                 self.fgr_pos = (meter_x, meter_y)
+                # Regions never move, so their screen rects are computed once
+                self.fgr_screen_regions = [(r.move(meter_x, meter_y), r) for r in self.fgr_regions]
         except Exception as e:
             print(f"[TurntableHandler] Failed to load fgr '{fgr_name}': {e}")
+        self._skin_image_futures = {}
         
         # Store album position for artist combination logic
         self.album_pos = album_pos
@@ -2436,42 +3392,26 @@ class TurntableHandler:
         
         # Light font
         light_file = self.global_config.get(FONT_LIGHT)
-        if light_file and os.path.exists(font_path + light_file):
-            self.fontL = pg.font.Font(font_path + light_file, size_light)
-            log_debug(f"  Font light: {font_path + light_file}", "basic")
-        else:
-            self.fontL = pg.font.SysFont("DejaVuSans", size_light)
-            log_debug(f"  Font light: SysFont DejaVuSans (fallback, file={light_file})", "basic")
+        self.fontL = load_font_cached(font_path + light_file if light_file else None, size_light)
+        log_debug(f"  Font light: {light_file} size={size_light}", "basic")
         
         # Regular font
         regular_file = self.global_config.get(FONT_REGULAR)
-        if regular_file and os.path.exists(font_path + regular_file):
-            self.fontR = pg.font.Font(font_path + regular_file, size_regular)
-            log_debug(f"  Font regular: {font_path + regular_file}", "basic")
-        else:
-            self.fontR = pg.font.SysFont("DejaVuSans", size_regular)
-            log_debug(f"  Font regular: SysFont DejaVuSans (fallback, file={regular_file})", "basic")
+        self.fontR = load_font_cached(font_path + regular_file if regular_file else None, size_regular)
+        log_debug(f"  Font regular: {regular_file} size={size_regular}", "basic")
         
         # Bold font
         bold_file = self.global_config.get(FONT_BOLD)
-        if bold_file and os.path.exists(font_path + bold_file):
-            self.fontB = pg.font.Font(font_path + bold_file, size_bold)
-            log_debug(f"  Font bold: {font_path + bold_file}", "basic")
-        else:
-            self.fontB = pg.font.SysFont("DejaVuSans", size_bold, bold=True)
-            log_debug(f"  Font bold: SysFont DejaVuSans (fallback, file={bold_file})", "basic")
+        self.fontB = load_font_cached(font_path + bold_file if bold_file else None, size_bold, bold=True)
+        log_debug(f"  Font bold: {bold_file} size={size_bold}", "basic")
         
         # Digital font for time (default; used when per-field font/size not set)
         default_digi_path = os.path.join(os.path.dirname(__file__), 'fonts', 'DSEG7Classic-Italic.ttf')
-        if os.path.exists(default_digi_path):
-            self.fontDigi = pg.font.Font(default_digi_path, size_digi)
-            log_debug(f"  Font digi: {default_digi_path}", "basic")
-        else:
-            self.fontDigi = pg.font.SysFont("DejaVuSans", size_digi)
-            log_debug(f"  Font digi: SysFont DejaVuSans (fallback)", "basic")
+        self.fontDigi = load_font_cached(default_digi_path, size_digi)
+        log_debug(f"  Font digi: {default_digi_path} size={size_digi}", "basic")
 
         # Per-field time fonts (remaining, elapsed, total): optional font path + fontsize; fallback to fontDigi
-        meter_path = os.path.join(self.config.get(BASE_PATH), self.config.get(SCREEN_INFO)[METER_FOLDER])
+        meter_path = self._meter_path
         self._time_font_cache = {}
 
         def resolve_time_font_path(font_value):
@@ -2491,10 +3431,7 @@ class TurntableHandler:
                 return self.fontDigi
             key = (path, size)
             if key not in self._time_font_cache:
-                if os.path.exists(path):
-                    self._time_font_cache[key] = pg.font.Font(path, size)
-                else:
-                    self._time_font_cache[key] = pg.font.SysFont("DejaVuSans", size)
+                self._time_font_cache[key] = load_font_cached(path, size)
             return self._time_font_cache[key]
 
         path_remaining = resolve_time_font_path(mc_vol.get(TIME_REMAINING_FONT))
@@ -2526,6 +3463,62 @@ class TurntableHandler:
         self.font_time_elapsed = self.fontDigiElapsed if (not style_elapsed or style_elapsed == "digi") else self._font_for_style(norm_time_style(style_elapsed))
         self.font_time_total = self.fontDigiTotal if (not style_total or style_total == "digi") else self._font_for_style(norm_time_style(style_total))
     
+    def _wait_meter_delay(self):
+        """Keep meter.run() calls at least meter_delay_ms apart.
+        
+        Sleeps only for the part of the delay the frame has not already
+        spent (rendering, clock.tick), instead of adding the full delay to
+        every frame.
+        """
+        if self.meter_delay_ms > 0:
+            wait_ms = self._meter_run_ms + self.meter_delay_ms - pg.time.get_ticks()
+            if wait_ms > 0:
+                time.sleep(wait_ms / 1000.0)
+        self._meter_run_ms = pg.time.get_ticks()
+    
+    def _read_persist(self):
+        """Return (duration_sec, start_ts, display_mode) from the persist file.
+        
+        The file is only re-read when its mtime or size changes, so idle
+        frames cost one stat() instead of an exists/open/read. Returns None
+        when the file is missing; duration and start are None when it is
+        malformed.
+        """
+        try:
+            st = os.stat(self._persist_file)
+        except OSError:
+            self._persist_cache = None
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cache = self._persist_cache
+        if cache is None or cache[0] != stamp:
+            p_duration = start_ts = None
+            mode = "freeze"
+            try:
+                with open(self._persist_file, 'r') as f:
+                    parts = f.read().strip().split(':')
+                if len(parts) >= 2:
+                    p_duration, start_ts = int(parts[0]), int(parts[1]) / 1000.0
+                if len(parts) >= 3:
+                    mode = parts[2]
+            except Exception:
+                pass
+            cache = self._persist_cache = (stamp, p_duration, start_ts, mode)
+        return cache[1:]
+    
+    def _draw_time_field(self, text, font, color, pos, rect, dirty_rects):
+        """Clear a time field from bgr_surface and draw text at pos.
+        
+        Shared by the remaining, elapsed and total time layers; returns the
+        rendered surface.
+        """
+        if self.bgr_surface and rect:
+            self.screen.blit(self.bgr_surface, rect.topleft, rect)
+            dirty_rects.append(rect)
+        surf = font.render(text, True, color)
+        self.screen.blit(surf, pos)
+        return surf
+    
     def _font_for_style(self, style):
         """Get font for style."""
         if style == FONT_STYLE_B:
@@ -2534,12 +3527,60 @@ class TurntableHandler:
             return self.fontR
         else:
             return self.fontL
+
+    def _text_width(self, font, text, rendered=False):
+        """Get width of text in font, measured once per font.
+        rendered=True measures the rendered surface, which includes italic overhang.
+
+        Fonts come from load_font_cached and are shared across meter inits,
+        so the module-level cache also hits when switching back to a meter.
+        """
+        key = (font, text, rendered)
+        width = _FONT_METRIC_CACHE.get(key)
+        if width is not None:
+            _FONT_METRIC_CACHE.move_to_end(key)
+            return width
+        if rendered:
+            width = font.render(text, True, (255, 255, 255)).get_width()
+        else:
+            width = font.size(text)[0]
+        _FONT_METRIC_CACHE[key] = width
+        if len(_FONT_METRIC_CACHE) > _FONT_METRIC_CACHE_MAX:
+            _FONT_METRIC_CACHE.popitem(last=False)
+        return width
+    
+    @classmethod
+    def _get_image_executor(cls):
+        """Shared worker for skin image decode (created on first use)."""
+        if cls._image_executor is None:
+            cls._image_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="skinimg")
+        return cls._image_executor
+    
+    def _prefetch_skin_images(self, mc):
+        """Submit screen.bgr, bgr and fgr decodes to the worker pool.
+        
+        Only the file read and PNG decode run off the main thread;
+        convert()/convert_alpha() stay with the caller of _load_skin_image().
+        """
+        meter_path = self._meter_path
+        executor = self._get_image_executor()
+        self._skin_image_futures = {}
+        for name in (mc.get('screen.bgr'), mc.get(BGR_FILENAME), mc.get(FGR_FILENAME)):
+            if name:
+                path = os.path.join(meter_path, name)
+                if path not in self._skin_image_futures:
+                    self._skin_image_futures[path] = executor.submit(pg.image.load, path)
+    
+    def _load_skin_image(self, path):
+        """Return the decoded image for path, waiting on a prefetch if one was started."""
+        future = self._skin_image_futures.pop(path, None)
+        if future is not None:
+            return future.result()
+        return pg.image.load(path)
     
     def _draw_static_assets(self, mc):
         """Draw static background assets."""
-        base_path = self.config.get(BASE_PATH)
-        meter_dir = self.config.get(SCREEN_INFO)[METER_FOLDER]
-        meter_path = os.path.join(base_path, meter_dir)
+        meter_path = self._meter_path
         
         screen_bgr_name = mc.get('screen.bgr')
         bgr_name = mc.get(BGR_FILENAME)
@@ -2550,7 +3591,7 @@ class TurntableHandler:
         if screen_bgr_name:
             try:
                 img_path = os.path.join(meter_path, screen_bgr_name)
-                img = pg.image.load(img_path).convert()
+                img = self._load_skin_image(img_path).convert()
                 self.screen.blit(img, (0, 0))
             except Exception as e:
                 print(f"[TurntableHandler] Failed to load screen.bgr '{screen_bgr_name}': {e}")
@@ -2559,7 +3600,7 @@ class TurntableHandler:
         if bgr_name:
             try:
                 img_path = os.path.join(meter_path, bgr_name)
-                img = pg.image.load(img_path).convert_alpha()
+                img = self._load_skin_image(img_path).convert_alpha()
                 self.screen.blit(img, (meter_x, meter_y))
             except Exception as e:
                 print(f"[TurntableHandler] Failed to load bgr '{bgr_name}': {e}")
@@ -2593,11 +3634,10 @@ class TurntableHandler:
         :return: List of dirty rects
         """
         if not self.enabled:
-            meter_rects = self.meter.run()
-            if meter_rects:
-                return meter_rects if isinstance(meter_rects, list) else [meter_rects]
-            return []
+            return list(iter_meter_rects(self.meter.run()))
         
+        # Consumers only read these rects (collidelist, coalesce, display.update),
+        # so handler-owned rects are appended without copying
         dirty_rects = []
         
         # Extract metadata
@@ -2609,12 +3649,12 @@ class TurntableHandler:
         bitdepth = meta.get("bitdepth", "")
         track_type = meta.get("trackType", "")
         bitrate = meta.get("bitrate", "")
-        status = meta.get("status", "")
+        status = resolve_status(meta.get("status", ""))
         # volatile: True=transitional, False=genuine stop, None=unset (getEmptyState, treat as transitional)
         volatile_raw = meta.get("volatile")
         is_transitional = (volatile_raw is not False)  # True or None = transitional
         volatile = is_transitional  # For render: treat stop/pause as play when transitional
-        is_playing = status == "play"
+        is_playing = status == STATUS_PLAY
         duration = meta.get("duration", 0) or 0
         uri = meta.get("uri", "")
         volumio_url = meta.get("_volumio_url", "http://localhost:3000")
@@ -2682,6 +3722,9 @@ class TurntableHandler:
         # This allows progress bar to reflect queue progress when queue mode is active
         meta["_effective_progress_pct"] = effective_progress_pct
         
+        # Wall clock sampled once per frame for seek, deceleration and countdown
+        now_wall = time.time()
+        
         # Seek interpolation - calculate current position based on elapsed time
         # CRITICAL: Don't use 'or' fallback - 0 is a valid seek position!
         seek_raw = meta.get("_seek_raw")
@@ -2695,7 +3738,7 @@ class TurntableHandler:
         # Webradio excluded by duration=0 check
         if is_playing and duration > 0:
             if seek_update_time > 0:
-                elapsed_ms = (time.time() - seek_update_time) * 1000
+                elapsed_ms = (now_wall - seek_update_time) * 1000
                 seek = min(duration * 1000, seek_raw + elapsed_ms)
                 meta["seek"] = seek  # Update for indicators (progress bar)
         
@@ -2720,7 +3763,7 @@ class TurntableHandler:
         
         # Start deceleration when playback stops
         if just_stopped:
-            self._decel_start = time.time()
+            self._decel_start = now_wall
             # Get lift duration from tonearm for matching deceleration
             if self.tonearm_renderer:
                 self._decel_duration = getattr(self.tonearm_renderer, 'lift_duration', 1.5)
@@ -2739,11 +3782,10 @@ class TurntableHandler:
         decel_factor = 1.0
         in_deceleration = False
         if self._decel_start is not None:
-            elapsed = time.time() - self._decel_start
+            elapsed = now_wall - self._decel_start
             if elapsed < self._decel_duration:
-                # Smooth deceleration curve (ease out)
-                progress = elapsed / self._decel_duration
-                decel_factor = max(0.0, 1.0 - progress * progress)  # Quadratic ease out
+                # Smooth deceleration curve (ease out), precomputed in DECEL_EASE_LUT
+                decel_factor = DECEL_EASE_LUT[max(0, int(elapsed / self._decel_duration * DECEL_LUT_STEPS))]
                 in_deceleration = True
             else:
                 # Deceleration complete
@@ -2762,12 +3804,20 @@ class TurntableHandler:
         album_url_changed = False
         if self.album_renderer:
             album_url_changed = albumart != self.album_renderer._current_url
-            if album_url_changed:
+            # Art fetched in the background is installed here, then drawn
+            # (and its area cleared) like a fresh load
+            album_art_ready = self.album_renderer.check_pending_load()
+            if album_url_changed or album_art_ready:
                 album_will_render = True
             elif self.album_renderer.rotate_enabled and self.album_renderer.rotate_rpm > 0.0:
-                # Rotating art follows same deceleration logic as vinyl
-                album_should_rotate = is_playing or volatile or in_deceleration or tonearm_is_animating
-                album_will_render = album_should_rotate and self.album_renderer.will_blit(now_ticks)
+                if self.album_renderer.vinyl_renderer:
+                    # Coupled art takes the vinyl angle at the same rotation_fps,
+                    # so the vinyl's timing decision covers both
+                    album_will_render = bool(vinyl_will_blit)
+                else:
+                    # Rotating art follows same deceleration logic as vinyl
+                    album_should_rotate = is_playing or volatile or in_deceleration or tonearm_is_animating
+                    album_will_render = album_should_rotate and self.album_renderer.will_blit(now_ticks)
         
         # =================================================================
         # FORCE FLAG: When animated elements change, force overlapping 
@@ -2809,9 +3859,10 @@ class TurntableHandler:
         
         # Clear all dirty regions from background
         if clear_regions and self.bgr_surface:
-            for region in clear_regions:
-                self.screen.blit(self.bgr_surface, region.topleft, region)
-                dirty_rects.append(region.copy())
+            # One blits() call instead of a Python-level blit per region
+            self.screen.blits([(self.bgr_surface, region.topleft, region) for region in clear_regions],
+                              doreturn=False)
+            dirty_rects.extend(clear_regions)
         
         # =================================================================
         # PHASE 2: RENDER ALL LAYERS IN Z-ORDER
@@ -2842,139 +3893,111 @@ class TurntableHandler:
                     dirty_rects.append(rect)
         
         # Z3: Meters (draw AFTER vinyl/art so needles are visible)
-        meter_rects = self.meter.run()
-        if meter_rects:
-            if isinstance(meter_rects, list):
-                for item in meter_rects:
-                    if item:
-                        if isinstance(item, tuple) and len(item) >= 2:
-                            rect = item[1]
-                            if rect:
-                                dirty_rects.append(rect)
-                        elif hasattr(item, 'x'):
-                            dirty_rects.append(item)
-            elif isinstance(meter_rects, tuple) and len(meter_rects) >= 2:
-                rect = meter_rects[1]
-                if rect:
-                    dirty_rects.append(rect)
-            elif hasattr(meter_rects, 'x'):
-                dirty_rects.append(meter_rects)
-        
         # TIMING FIX: Optimizations (precomputed frames, vinyl+art composite) make
         # the render loop complete very fast. This can cause meter.run() to be called
         # before the audio data source has new samples, resulting in stuck needles.
         # 
-        # The meter_delay setting (UI configurable, 0-20ms, default 10ms) controls
-        # the balance between CPU usage and meter responsiveness:
+        # The meter_delay setting (UI configurable, 0-20ms, default 10ms) sets the
+        # minimum spacing between meter runs:
         # - Higher values (10-20): Lower CPU, meters may feel slightly sluggish
         # - Lower values (0-5): Higher CPU (up to 95%), more responsive meters
-        if self.meter_delay_sec > 0:
-            if not getattr(self, '_meter_delay_logged', False):
-                log_debug(f"Meter timing delay: {self.meter_delay_ms}ms (configurable in Performance Settings)", "basic")
-                self._meter_delay_logged = True
-            time.sleep(self.meter_delay_sec)
+        if self.meter_delay_ms > 0 and not self._meter_delay_logged:
+            log_debug(f"Meter timing delay: {self.meter_delay_ms}ms (configurable in Performance Settings)", "basic")
+            self._meter_delay_logged = True
+        self._wait_meter_delay()
+        dirty_rects.extend(iter_meter_rects(self.meter.run()))
         
         # =================================================================
         # SURGICAL OVERLAP DETECTION
         # =================================================================
         # Only force components that actually overlap cleared regions.
         # This is anti-collision compliant AND efficient.
+        # Union of all cleared regions: a single colliderect rejects most
+        # components without walking the list.
+        clear_union = clear_regions[0].unionall(clear_regions[1:]) if clear_regions else None
+        
         def overlaps_cleared(component_rect):
             """Check if component_rect overlaps any cleared region."""
-            if not component_rect or not clear_regions:
+            if not component_rect or clear_union is None:
                 return False
-            for region in clear_regions:
-                if region and component_rect.colliderect(region):
-                    return True
-            return False
+            if not component_rect.colliderect(clear_union):
+                return False
+            return len(clear_regions) == 1 or component_rect.collidelist(clear_regions) != -1
         
         # Z4: Text fields - only force if they overlap cleared regions
-        if self.artist_scroller:
-            scroller_rect = self.artist_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.artist_scroller.force_redraw()
-        
-        if self.title_scroller:
-            scroller_rect = self.title_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.title_scroller.force_redraw()
-        
-        if self.album_scroller:
-            scroller_rect = self.album_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.album_scroller.force_redraw()
-        if self.next_title_scroller:
-            scroller_rect = self.next_title_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.next_title_scroller.force_redraw()
-        if self.next_artist_scroller:
-            scroller_rect = self.next_artist_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.next_artist_scroller.force_redraw()
-        if self.next_album_scroller:
-            scroller_rect = self.next_album_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.next_album_scroller.force_redraw()
-        if self.ticker_scroller:
-            scroller_rect = self.ticker_scroller.get_rect()
-            if overlaps_cleared(scroller_rect):
-                self.ticker_scroller.force_redraw()
+        # (nothing was cleared on a static frame, so skip the checks entirely)
+        if clear_regions:
+            for scroller in self._scrollers:
+                if overlaps_cleared(scroller.get_rect()):
+                    scroller.force_redraw()
 
         if self.artist_scroller:
-            display_artist = artist
-            if not self.album_pos and album:
-                display_artist = f"{artist} - {album}" if artist else album
-            self.artist_scroller.update_text(display_artist)
-            rect = self.artist_scroller.draw(self.screen)
+            # Rebuild the "artist - album" line only when either source changes
+            if artist != self._artist_src or album != self._album_src:
+                display_artist = artist
+                if not self.album_pos and album:
+                    display_artist = f"{artist} - {album}" if artist else album
+                self._display_artist = display_artist
+                self._artist_src, self._album_src = artist, album
+            self.artist_scroller.update_text(self._display_artist, now_ms=now_ticks)
+            rect = self.artist_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
         
         if self.title_scroller:
-            self.title_scroller.update_text(title)
-            rect = self.title_scroller.draw(self.screen)
+            self.title_scroller.update_text(title, now_ms=now_ticks)
+            rect = self.title_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
         
         if self.album_scroller:
-            self.album_scroller.update_text(album)
-            rect = self.album_scroller.draw(self.screen)
+            self.album_scroller.update_text(album, now_ms=now_ticks)
+            rect = self.album_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
 
         if self.next_title_scroller:
-            self.next_title_scroller.update_text(meta.get("next_title", "") or "")
-            rect = self.next_title_scroller.draw(self.screen)
+            self.next_title_scroller.update_text(meta.get("next_title", "") or "", now_ms=now_ticks)
+            rect = self.next_title_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
         if self.next_artist_scroller:
-            self.next_artist_scroller.update_text(meta.get("next_artist", "") or "")
-            rect = self.next_artist_scroller.draw(self.screen)
+            self.next_artist_scroller.update_text(meta.get("next_artist", "") or "", now_ms=now_ticks)
+            rect = self.next_artist_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
         if self.next_album_scroller:
-            self.next_album_scroller.update_text(meta.get("next_album", "") or "")
-            rect = self.next_album_scroller.draw(self.screen)
+            self.next_album_scroller.update_text(meta.get("next_album", "") or "", now_ms=now_ticks)
+            rect = self.next_album_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
 
         if self.ticker_scroller:
-            sep = self.ticker_separator or " · "
-            space = " " * self.ticker_space_between
-            between = space + sep + space
-            parts = [p for p in (artist, title, album) if p]
-            content = between.join(parts) if parts else ""
             if self.ticker_append_next:
                 na = meta.get("next_artist", "") or ""
                 nt = meta.get("next_title", "") or ""
+            else:
+                na = nt = ""
+            # Ticker text and its width only change with the metadata;
+            # skip the string build and font measure on static frames
+            ticker_key = (artist, title, album, na, nt)
+            if ticker_key != self._ticker_key:
+                sep = self.ticker_separator or " · "
+                space = " " * self.ticker_space_between
+                between = space + sep + space
+                parts = [p for p in (artist, title, album) if p]
+                content = between.join(parts) if parts else ""
                 next_part = " - ".join(filter(None, [na, nt])) or ""
                 if next_part:
                     content = (content + between + "Next: " + next_part) if content else ("Next: " + next_part)
-            end_sp = " " * self.ticker_end_spaces
-            segment = content + end_sp
-            display = (segment * 3) if segment else ""
-            segment_px = self.ticker_scroller.font.size(segment)[0] if segment else 0
-            self.ticker_scroller.update_text(display, segment_pixels=segment_px if segment_px > 0 else None)
-            rect = self.ticker_scroller.draw(self.screen)
+                end_sp = " " * self.ticker_end_spaces
+                segment = content + end_sp
+                self._ticker_display = (segment * 3) if segment else ""
+                self._ticker_segment_px = self.ticker_scroller.font.size(segment)[0] if segment else 0
+                self._ticker_key = ticker_key
+            segment_px = self._ticker_segment_px
+            self.ticker_scroller.update_text(self._ticker_display, segment_pixels=segment_px if segment_px > 0 else None, now_ms=now_ticks)
+            rect = self.ticker_scroller.draw(self.screen, now_ticks)
             if rect:
                 dirty_rects.append(rect)
 
@@ -2982,6 +4005,8 @@ class TurntableHandler:
         # Always render when force_flag is set (tonearm is part of animated elements)
         if self.tonearm_renderer and force_flag:
             rect = self.tonearm_renderer.render(self.screen, now_ticks, force=True)
+            # The cleared old position is already in dirty_rects; a union with
+            # it would send uncleared area to the foreground pass
             if rect:
                 dirty_rects.append(rect)
         
@@ -2998,41 +4023,27 @@ class TurntableHandler:
             indicator_dirty_rects = dirty_rects[indicator_dirty_start:]
 
         def overlaps_indicator_dirty(rect):
-            if not rect or not indicator_dirty_rects:
-                return False
-            for dirty in indicator_dirty_rects:
-                if dirty and rect.colliderect(dirty):
-                    return True
-            return False
+            return bool(rect and indicator_dirty_rects) and rect.collidelist(indicator_dirty_rects) != -1
         
         # Z7: Time remaining (FORCE when animated elements change)
         if self.time_pos:
-            import time as time_module
-            current_time = time_module.time()
+            current_time = now_wall
             
             # Check for persist file (countdown mode for external control)
             # Defensive: only show countdown when NOT transitional (volatile explicitly False)
             persist_countdown_sec = None
             persist_display_mode = "freeze"
-            persist_file = os.path.join(tempfile.gettempdir(), 'peppy_persist')
-            if not is_playing and not is_transitional and os.path.exists(persist_file):
-                try:
-                    with open(persist_file, 'r') as f:
-                        parts = f.read().strip().split(':')
-                        if len(parts) >= 2:
-                            p_duration = int(parts[0])
-                            start_ts = int(parts[1]) / 1000.0
-                            elapsed_persist = current_time - start_ts
-                            persist_countdown_sec = max(0, p_duration - int(elapsed_persist))
-                        if len(parts) >= 3:
-                            persist_display_mode = parts[2]
-                except Exception:
-                    pass
+            if not is_playing and not is_transitional:
+                persist = self._read_persist()
+                if persist:
+                    p_duration, start_ts, persist_display_mode = persist
+                    if p_duration is not None:
+                        persist_countdown_sec = max(0, p_duration - int(current_time - start_ts))
             
             time_remain_sec = meta.get("_time_remain", -1)
             time_last_update = meta.get("_time_update", 0)
             
-            if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("time", False):
+            if _TRACE_TIME:
                 log_debug(f"[Time] INPUT: remain={time_remain_sec}s, playing={is_playing}, persist_mode={persist_display_mode}, persist_sec={persist_countdown_sec}", "trace", "time")
             
             show_persist_countdown = (
@@ -3047,7 +4058,7 @@ class TurntableHandler:
                 if is_playing:
                     elapsed = current_time - time_last_update
                     if elapsed >= 1.0:
-                        if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("seek", False):
+                        if _TRACE_SEEK:
                             log_debug(f"[Seek] INTERPOLATE: raw={time_remain_sec}s, elapsed={elapsed:.1f}s, result={max(0, time_remain_sec - int(elapsed))}s", "trace", "seek")
                         time_remain_sec = max(0, time_remain_sec - int(elapsed))
                 display_sec = time_remain_sec
@@ -3055,9 +4066,7 @@ class TurntableHandler:
                 display_sec = -1
             
             if display_sec >= 0:
-                mins = display_sec // 60
-                secs = display_sec % 60
-                time_str = f"{mins:02d}:{secs:02d}"
+                time_str = format_mmss(display_sec)
                 
                 # Force redraw when animated elements overlap time area
                 # or if time string changed
@@ -3067,11 +4076,6 @@ class TurntableHandler:
                 if needs_redraw:
                     self.last_time_str = time_str
                     
-                    # LAYER COMPOSITION: Clear from bgr_surface
-                    if self.bgr_surface and self.time_rect:
-                        self.screen.blit(self.bgr_surface, self.time_rect.topleft, self.time_rect)
-                        dirty_rects.append(self.time_rect.copy())
-                    
                     # Color: orange for persist countdown, red for <10s, else skin color
                     if show_persist_countdown:
                         t_color = (242, 165, 0)  # Orange
@@ -3080,142 +4084,78 @@ class TurntableHandler:
                     else:
                         t_color = self.time_color
                     
-                    self.last_time_surf = self.font_time_remaining.render(time_str, True, t_color)
-                    self.screen.blit(self.last_time_surf, self.time_pos)
+                    self.last_time_surf = self._draw_time_field(time_str, self.font_time_remaining, t_color,
+                                                                self.time_pos, self.time_rect, dirty_rects)
                     
-                    if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("time", False):
+                    if _TRACE_TIME:
                         log_debug(f"[Time] OUTPUT: rendered '{time_str}' at {self.time_pos}, color={t_color}", "trace", "time")
 
         # Z7b: Elapsed time (when time.elapsed.pos set; anti-collision: force redraw when tonearm/vinyl/art overlap)
         if self.time_elapsed_pos and self.font_time_elapsed:
             seek_ms = meta.get("seek") or 0
             elapsed_sec = max(0, int(seek_ms) // 1000)
-            elapsed_str = f"{elapsed_sec // 60:02d}:{elapsed_sec % 60:02d}"
+            elapsed_str = format_mmss(elapsed_sec)
             elapsed_overlaps = overlaps_cleared(self.time_elapsed_rect) if self.time_elapsed_rect else False
             needs_redraw = elapsed_str != self.last_elapsed_str or elapsed_overlaps or overlaps_indicator_dirty(self.time_elapsed_rect)
             if needs_redraw:
                 self.last_elapsed_str = elapsed_str
-                if self.bgr_surface and self.time_elapsed_rect:
-                    self.screen.blit(self.bgr_surface, self.time_elapsed_rect.topleft, self.time_elapsed_rect)
-                    dirty_rects.append(self.time_elapsed_rect.copy())
-                surf = self.font_time_elapsed.render(elapsed_str, True, self.time_elapsed_color)
-                self.screen.blit(surf, self.time_elapsed_pos)
+                self._draw_time_field(elapsed_str, self.font_time_elapsed, self.time_elapsed_color,
+                                      self.time_elapsed_pos, self.time_elapsed_rect, dirty_rects)
 
         # Z7c: Total time (when time.total.pos set; anti-collision: force redraw when tonearm/vinyl/art overlap)
         if self.time_total_pos and self.font_time_total:
             duration_sec = max(0, int(meta.get("duration") or 0))
-            total_str = f"{duration_sec // 60:02d}:{duration_sec % 60:02d}"
+            total_str = format_mmss(duration_sec)
             total_overlaps = overlaps_cleared(self.time_total_rect) if self.time_total_rect else False
             needs_redraw = total_str != self.last_total_str or total_overlaps or overlaps_indicator_dirty(self.time_total_rect)
             if needs_redraw:
                 self.last_total_str = total_str
-                if self.bgr_surface and self.time_total_rect:
-                    self.screen.blit(self.bgr_surface, self.time_total_rect.topleft, self.time_total_rect)
-                    dirty_rects.append(self.time_total_rect.copy())
-                surf = self.font_time_total.render(total_str, True, self.time_total_color)
-                self.screen.blit(surf, self.time_total_pos)
+                self._draw_time_field(total_str, self.font_time_total, self.time_total_color,
+                                      self.time_total_pos, self.time_total_rect, dirty_rects)
 
         # LAYER: Sample rate / format icon - only force if overlapping cleared regions
         # Format icon
         if self.type_rect:
-            fmt = (track_type or "").strip().lower().replace(" ", "_")
-            if fmt == "dsf":
-                fmt = "dsd"
-            
-            # Strip signal strength indicators and other suffixes
-            # DAB sends "DAB ●◦◦◦◦" -> "dab_●◦◦◦◦", need just "dab"
-            # FM sends "FM ◦◦◦◦◦" -> "fm_◦◦◦◦◦", need just "fm"
-            import re
-            fmt_clean = re.sub(r'[^a-z0-9_].*', '', fmt)  # Keep only alphanumeric prefix
-            if fmt_clean:
-                fmt = fmt_clean
-            
-            # Normalize common trackType variants to icon names
-            format_map = {
-                'dab_radio': 'dab',
-                'dab_': 'dab',
-                'dab': 'dab',
-                'rtlsdr': 'dab',
-                'rtlsdr_radio': 'dab',
-                'fm_radio': 'fm',
-                'fm_': 'fm',
-                'fm': 'fm',
-                'webradio': 'radio',
-                'web_radio': 'radio',
-                'internet_radio': 'radio',
-                'tidal_connect': 'tidal',
-                'qobuz_connect': 'qobuz',
-                'spotify': 'spotify',
-                'spotify_connect': 'spotify',
-                'airplay': 'airplay',
-                'bluetooth': 'bluetooth',
-                'upnp': 'upnp',
-                'dlna': 'upnp',
-            }
-            fmt_before = fmt
-            fmt = format_map.get(fmt, fmt)
-            
-            # TRACE: Log format icon processing
-            if DEBUG_LEVEL_CURRENT == "trace" and DEBUG_TRACE.get("metadata", False):
-                log_debug(f"[FormatIcon] INPUT: track_type='{track_type}', fmt_normalized='{fmt_before}', fmt_mapped='{fmt}'", "trace", "metadata")
-            
-            type_overlaps = overlaps_cleared(self.type_rect)
-            needs_redraw = fmt != self.last_track_type or type_overlaps
+            # Format resolution only depends on the raw trackType
+            resolved = self._fmt_resolve_cache.get(track_type)
+            if resolved is None:
+                resolved = resolve_format_icon(track_type)
+                self._fmt_resolve_cache[track_type] = resolved
+                
+                # TRACE: Log format icon processing
+                if _TRACE_METADATA:
+                    log_debug(f"[FormatIcon] INPUT: track_type='{track_type}', fmt_mapped='{resolved[0]}', icon='{resolved[1]}'", "trace", "metadata")
+            fmt, icon_path, icon_exists = resolved
             
-            if needs_redraw:
+            # Only rasterize the icon when the format changes (once per track);
+            # overlap redraws re-blit the cached surface
+            format_changed = fmt != self.last_track_type
+            if format_changed:
                 self.last_track_type = fmt
+                self.last_format_icon_surf = None
                 
-                # LAYER COMPOSITION: Clear from bgr_surface
-                if self.bgr_surface and self.type_rect:
-                    self.screen.blit(self.bgr_surface, self.type_rect.topleft, self.type_rect)
-                
-                file_path = os.path.dirname(__file__)
-                local_icons = {'tidal', 'cd', 'qobuz', 'dab', 'fm', 'radio'}
-                if fmt in local_icons:
-                    icon_path = os.path.join(file_path, 'format-icons', f"{fmt}.svg")
-                else:
-                    icon_path = f"/volumio/http/www3/app/assets-common/format-icons/{fmt}.svg"
-                
-                if not os.path.exists(icon_path):
+                if not icon_exists:
                     if self.sample_font:
-                        txt_surf = self.sample_font.render(fmt[:4], True, self.type_color)
-                        self.screen.blit(txt_surf, (self.type_rect.x, self.type_rect.y))
-                        self.last_format_icon_surf = txt_surf
+                        self.last_format_icon_surf = self.sample_font.render(fmt[:4], True, self.type_color)
+                        self._format_icon_pos = self.type_rect.topleft
                 else:
                     try:
-                        img = None
-                        # Prefer cairosvg: rasterizes at exact target dimensions,
-                        # consistent across platforms (Linux/Windows/Mac).
-                        # pg.image.load() uses SDL_image nanosvg which produces
-                        # platform-dependent default raster sizes for the same SVG.
-                        if CAIROSVG_AVAILABLE and PIL_AVAILABLE:
-                            png_bytes = cairosvg.svg2png(url=icon_path,
-                                                        output_width=self.type_rect.width,
-                                                        output_height=self.type_rect.height)
-                            pil_img = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
-                            img = pg.image.fromstring(pil_img.tobytes(), pil_img.size, "RGBA")
-                            img = img.convert_alpha()
-                        elif pg.version.ver.startswith("2"):
-                            # Fallback: Pygame 2 native SVG (platform-dependent size)
-                            img = pg.image.load(icon_path)
-                            w, h = img.get_width(), img.get_height()
-                            sc = min(self.type_rect.width / float(w), self.type_rect.height / float(h))
-                            new_size = (max(1, int(w * sc)), max(1, int(h * sc)))
-                            try:
-                                img = pg.transform.smoothscale(img, new_size)
-                            except Exception:
-                                img = pg.transform.scale(img, new_size)
-                            img = img.convert_alpha()
+                        img = rasterize_format_icon(icon_path, self.type_rect.size, self.type_color)
                         if img:
-                            set_color(img, pg.Color(self.type_color[0], self.type_color[1], self.type_color[2]))
                             dx = self.type_rect.x + (self.type_rect.width - img.get_width()) // 2
                             dy = self.type_rect.y + (self.type_rect.height - img.get_height()) // 2
-                            self.screen.blit(img, (dx, dy))
                             self.last_format_icon_surf = img
+                            self._format_icon_pos = (dx, dy)
                     except Exception as e:
                         print(f"[FormatIcon] error: {e}")
-                
-                dirty_rects.append(self.type_rect.copy())
+            
+            if format_changed or overlaps_cleared(self.type_rect):
+                # LAYER COMPOSITION: Clear from bgr_surface
+                if self.bgr_surface:
+                    self.screen.blit(self.bgr_surface, self.type_rect.topleft, self.type_rect)
+                if self.last_format_icon_surf:
+                    self.screen.blit(self.last_format_icon_surf, self._format_icon_pos)
+                dirty_rects.append(self.type_rect)
         
         # Sample rate - only force if overlapping cleared regions
         if self.sample_pos and self.sample_box:
@@ -3232,7 +4172,7 @@ class TurntableHandler:
                 # LAYER COMPOSITION: Clear from bgr_surface
                 if self.bgr_surface and self.sample_rect:
                     self.screen.blit(self.bgr_surface, self.sample_rect.topleft, self.sample_rect)
-                    dirty_rects.append(self.sample_rect.copy())
+                    dirty_rects.append(self.sample_rect)
                 
                 self.last_sample_surf = self.sample_font.render(sample_text, True, self.type_color)
                 
@@ -3244,14 +4184,14 @@ class TurntableHandler:
         
         # LAYER: Foreground mask (always last)
         if self.fgr_surf and dirty_rects:
-            fgr_x, fgr_y = self.fgr_pos
-            if self.fgr_regions:
-                for region in self.fgr_regions:
-                    screen_rect = region.move(fgr_x, fgr_y)
-                    for dirty in dirty_rects:
-                        if screen_rect.colliderect(dirty):
-                            self.screen.blit(self.fgr_surf, screen_rect.topleft, region)
-                            break
+            if self.fgr_screen_regions:
+                # Batch all touched regions into a single blits() call
+                fgr = self.fgr_surf
+                self.screen.blits(
+                    [(fgr, screen_rect.topleft, region)
+                     for screen_rect, region in self.fgr_screen_regions
+                     if screen_rect.collidelist(dirty_rects) != -1],
+                    doreturn=False)
             else:
                 self.screen.blit(self.fgr_surf, self.fgr_pos)
         
@@ -3270,5 +4210,6 @@ class TurntableHandler:
         self.next_title_scroller = None
         self.next_artist_scroller = None
         self.next_album_scroller = None
+        self._scrollers = []
         self.bgr_surface = None
 